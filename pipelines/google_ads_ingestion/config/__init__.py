@@ -3,6 +3,17 @@ from .config_loader import (
     DATASET_ID,
     RAW_TABLE_ID,
     ADVERTISERS_TRACKING_TABLE_ID,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    BACKFILL_STATE_TABLE_ID,
+    INGESTION_JOBS_TABLE_ID,
+    ADVERTISER_WATERMARKS_TABLE_ID,
+    BACKFILL_WINDOW_DAYS,
+    BACKFILL_ADVERTISER_BATCH_SIZE,
+    BACKFILL_MAX_IN_FLIGHT_JOBS,
+    RAW_SCHEMA_TYPED,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+    BYTE_BUDGETS,
+    ADS_UPDATE_WATERMARK_LOOKBACK_DAYS,
     LOG_LEVEL,
 )
 
@@ -11,5 +22,16 @@ __all__ = [
     "DATASET_ID",
     "RAW_TABLE_ID",
     "ADVERTISERS_TRACKING_TABLE_ID",
+    "CREATIVE_STATS_STAGING_TABLE_ID",
+    "BACKFILL_STATE_TABLE_ID",
+    "INGESTION_JOBS_TABLE_ID",
+    "ADVERTISER_WATERMARKS_TABLE_ID",
+    "BACKFILL_WINDOW_DAYS",
+    "BACKFILL_ADVERTISER_BATCH_SIZE",
+    "BACKFILL_MAX_IN_FLIGHT_JOBS",
+    "RAW_SCHEMA_TYPED",
+    "RAW_SCHEMA_KEEP_RAW_DATA",
+    "BYTE_BUDGETS",
+    "ADS_UPDATE_WATERMARK_LOOKBACK_DAYS",
     "LOG_LEVEL",
 ]
@@ -21,4 +21,17 @@ PROJECT_ID = config.project_id
 DATASET_ID = current_env_config.dataset_id
 RAW_TABLE_ID = current_env_config.raw_table_id
 ADVERTISERS_TRACKING_TABLE_ID = current_env_config.advertisers_tracking
+CREATIVE_STATS_STAGING_TABLE_ID = current_env_config.creative_stats_staging
+BACKFILL_STATE_TABLE_ID = current_env_config.backfill_state
+INGESTION_JOBS_TABLE_ID = current_env_config.ingestion_jobs
+ADVERTISER_WATERMARKS_TABLE_ID = current_env_config.advertiser_watermarks
+BACKFILL_WINDOW_DAYS = current_env_config.backfill.window_days
+BACKFILL_ADVERTISER_BATCH_SIZE = current_env_config.backfill.advertiser_batch_size
+BACKFILL_MAX_IN_FLIGHT_JOBS = current_env_config.backfill.max_in_flight_jobs
+RAW_SCHEMA_TYPED = current_env_config.raw_schema.typed
+RAW_SCHEMA_KEEP_RAW_DATA = current_env_config.raw_schema.keep_raw_data
+BYTE_BUDGETS = current_env_config.byte_budgets
+ADS_UPDATE_WATERMARK_LOOKBACK_DAYS = (
+    current_env_config.ads_update.watermark_lookback_days
+)
 LOG_LEVEL = current_env_config.logging["log_level"]
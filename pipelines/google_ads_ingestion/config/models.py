@@ -2,10 +2,33 @@ from typing import Dict, Any
 from pydantic import BaseModel
 
 
+class BackfillConfig(BaseModel):
+    window_days: int = 30
+    advertiser_batch_size: int = 100
+    max_in_flight_jobs: int = 4
+
+
+class RawSchemaConfig(BaseModel):
+    typed: bool = False
+    keep_raw_data: bool = True
+
+
+class AdsUpdateConfig(BaseModel):
+    watermark_lookback_days: int = 3
+
+
 class EnvironmentConfig(BaseModel):
     dataset_id: str
     raw_table_id: str
     advertisers_tracking: str
+    creative_stats_staging: str
+    backfill_state: str
+    ingestion_jobs: str
+    advertiser_watermarks: str
+    backfill: BackfillConfig = BackfillConfig()
+    raw_schema: RawSchemaConfig = RawSchemaConfig()
+    byte_budgets: Dict[str, int] = {}
+    ads_update: AdsUpdateConfig = AdsUpdateConfig()
     logging: Dict[str, Any]
 
 
@@ -13,6 +13,7 @@ class IngestionStatus(Enum):
         TABLE_EXISTS (str): The table already exists, so no creation was needed.
         TABLE_CREATED (str): The table was successfully created in BigQuery.
         TABLE_CREATION_FAILED (str): An error occurred during the table creation process.
+        STAGING_REFRESHED (str): The creative stats staging snapshot was rebuilt.
     """
 
     NO_DATA_AVAILABLE = "No data available for ingestion."
@@ -22,3 +23,4 @@ class IngestionStatus(Enum):
     TABLE_EXISTS = "Table already exists."
     TABLE_CREATED = "Table created successfully."
     TABLE_CREATION_FAILED = "Table creation failed."
+    STAGING_REFRESHED = "Creative stats staging snapshot refreshed."
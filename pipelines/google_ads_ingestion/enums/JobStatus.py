@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """
+    Enum representing the lifecycle states of a submitted ingestion job.
+
+    Attributes:
+        PENDING: The job was accepted but has not started yet.
+        RUNNING: The job is currently executing.
+        COMPLETED: The job finished and produced a response.
+        FAILED: The job raised an error; see the job's `status_code` and `error`.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
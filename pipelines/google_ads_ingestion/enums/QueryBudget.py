@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class QueryBudget(str, Enum):
+    """
+    Enum representing the endpoints that have their own byte budget in `config.yml`.
+
+    Attributes:
+        STAGING_SNAPSHOT: Rebuild of the creative stats staging snapshot.
+        DAILY: Daily ingestion of the previous day's ads.
+        BACKFILL: Backfill ingestion for a requested date range.
+        ADS_UPDATE: Insertion of updated ad versions (ALL or SPECIFIC mode).
+    """
+
+    STAGING_SNAPSHOT = "staging_snapshot"
+    DAILY = "daily"
+    BACKFILL = "backfill"
+    ADS_UPDATE = "ads_update"
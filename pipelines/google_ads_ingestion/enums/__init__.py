@@ -1,2 +1,4 @@
 from .InsertionEnum import InsertionMode as InsertionMode
 from .IngestionStatus import IngestionStatus as IngestionStatus
+from .QueryBudget import QueryBudget as QueryBudget
+from .JobStatus import JobStatus as JobStatus
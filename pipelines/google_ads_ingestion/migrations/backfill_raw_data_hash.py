@@ -0,0 +1,46 @@
+"""
+One-off migration that populates `raw_data_hash` for rows inserted before the column existed.
+
+Ingestion runs fill in the hashes themselves when they add the column. This migration is only
+needed for tables whose column was added by an earlier version that left the hashes NULL. Run it
+from the pipeline root:
+
+    ENV=prod python -m migrations.backfill_raw_data_hash
+"""
+
+from config import PROJECT_ID, DATASET_ID, RAW_TABLE_ID
+from queries import BACKFILL_RAW_DATA_HASH_QUERY
+from utils.bigquery_client import bigquery_client
+from utils.create_incremental_table_if_not_exists import (
+    create_incremental_table_if_not_exists,
+)
+from utils.logging_config import logger
+
+
+def backfill_raw_data_hash() -> int:
+    """
+    Sets `raw_data_hash = FARM_FINGERPRINT(raw_data)` on every row where it is still NULL.
+
+    The migration is idempotent; rows that already carry a hash are left untouched.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    create_incremental_table_if_not_exists(bigquery_client, DATASET_ID, RAW_TABLE_ID)
+
+    query = BACKFILL_RAW_DATA_HASH_QUERY.format(
+        project_id=PROJECT_ID, dataset_id=DATASET_ID, table_id=RAW_TABLE_ID
+    )
+    query_job = bigquery_client.query(query)
+    query_job.result()
+
+    updated_rows = query_job.num_dml_affected_rows or 0
+    logger.info(
+        f"Backfilled raw_data_hash for {updated_rows} rows in {RAW_TABLE_ID} "
+        f"(job {query_job.job_id}, {query_job.total_bytes_processed} bytes processed)."
+    )
+    return updated_rows
+
+
+if __name__ == "__main__":
+    backfill_raw_data_hash()
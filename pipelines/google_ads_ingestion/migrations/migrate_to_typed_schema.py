@@ -0,0 +1,92 @@
+"""
+One-off migration that copies the JSON raw table into a new raw table using the typed schema.
+
+Run from the pipeline root once the creative stats staging snapshot exists:
+
+    ENV=prod python -m migrations.migrate_to_typed_schema
+
+The typed table is written next to the existing one as `<raw_table_id>_typed`; the existing table
+is left untouched. Once the copy has been verified, point `raw_table_id` in `config.yml` at the
+typed table and set `raw_schema.typed: true`.
+"""
+
+from config import (
+    PROJECT_ID,
+    DATASET_ID,
+    RAW_TABLE_ID,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+)
+from enums.IngestionStatus import IngestionStatus
+from utils.bigquery_client import bigquery_client
+from utils.create_incremental_table_if_not_exists import (
+    create_incremental_table_if_not_exists,
+)
+from utils.get_raw_table_schema import RAW_PAYLOAD_COLUMNS
+from utils.query_builder import QueryBuilder
+from utils.logging_config import logger
+
+
+def migrate_to_typed_schema(
+    target_table_id: str = f"{RAW_TABLE_ID}_typed",
+    keep_raw_data: bool = RAW_SCHEMA_KEEP_RAW_DATA,
+) -> int:
+    """
+    Creates the typed raw table and fills it with every row of the JSON raw table.
+
+    The payload columns are parsed from `raw_data`, so all historical ad versions are kept, and
+    the existing `raw_data_hash` values are copied so deduplication keeps matching them. The
+    migration refuses to run against a target table that already holds rows.
+
+    Args:
+        target_table_id (str): The ID of the typed raw table to create and populate.
+        keep_raw_data (bool): Whether the typed table keeps the `raw_data` JSON audit column.
+
+    Returns:
+        int: The number of rows copied.
+    """
+    table_status = create_incremental_table_if_not_exists(
+        bigquery_client,
+        DATASET_ID,
+        target_table_id,
+        typed=True,
+        keep_raw_data=keep_raw_data,
+        staging_table_id=CREATIVE_STATS_STAGING_TABLE_ID,
+    )
+    if table_status == IngestionStatus.TABLE_CREATION_FAILED:
+        raise RuntimeError(f"Could not create typed table '{target_table_id}'.")
+
+    target_table = bigquery_client.get_table(
+        bigquery_client.dataset(DATASET_ID).table(target_table_id)
+    )
+    if target_table.num_rows:
+        logger.error(
+            f"Typed table '{target_table_id}' already holds {target_table.num_rows} rows; "
+            "drop it before re-running the migration."
+        )
+        return 0
+
+    payload_schema = [
+        field for field in target_table.schema if field.name in RAW_PAYLOAD_COLUMNS
+    ]
+    query = QueryBuilder.build_migrate_to_typed_schema_query(
+        project_id=PROJECT_ID,
+        dataset_id=DATASET_ID,
+        source_table_id=RAW_TABLE_ID,
+        target_table_id=target_table_id,
+        payload_schema=payload_schema,
+        keep_raw_data=keep_raw_data,
+    )
+    query_job = bigquery_client.query(query)
+    query_job.result()
+
+    copied_rows = query_job.num_dml_affected_rows or 0
+    logger.info(
+        f"Copied {copied_rows} rows from {RAW_TABLE_ID} into typed table {target_table_id} "
+        f"(job {query_job.job_id}, {query_job.total_bytes_processed} bytes processed)."
+    )
+    return copied_rows
+
+
+if __name__ == "__main__":
+    migrate_to_typed_schema()
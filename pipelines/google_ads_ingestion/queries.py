@@ -1,7 +1,3 @@
-CHECK_ROW_COUNT_QUERY = """
-SELECT COUNT(*) as row_count FROM `{project_id}.{dataset_id}.{table_id}`
-"""
-
 ADVERTISER_IDS_SUBQUERY = """
 SELECT x AS advertiser_id FROM UNNEST(@advertiser_ids) AS x
 """
@@ -10,30 +6,68 @@ ADVERTISER_TRACKING_SUBQUERY = """
 SELECT advertiser_id FROM `{project_id}.{dataset_id}.{advertiser_ids_table}`
 """
 
+REFRESH_CREATIVE_STATS_STAGING_QUERY = """
+CREATE OR REPLACE TABLE `{project_id}.{dataset_id}.{staging_table_id}`
+PARTITION BY DATE_TRUNC(se_last_shown, MONTH)
+CLUSTER BY advertiser_id, se_last_shown, creative_id
+AS
+SELECT
+    t.advertiser_id,
+    t.creative_id,
+    t.creative_page_url,
+    t.ad_format_type,
+    t.advertiser_disclosed_name,
+    t.advertiser_legal_name,
+    t.advertiser_location,
+    t.advertiser_verification_status,
+    t.topic,
+    t.is_funded_by_google_ad_grants,
+    ARRAY(
+        SELECT AS STRUCT *
+        FROM UNNEST(t.region_stats) AS region
+        WHERE region.region_code = "SE"
+    ) AS region_stats,
+    t.audience_selection_approach_info,
+    PARSE_DATE('%Y-%m-%d', t.se_region.first_shown) AS se_first_shown,
+    PARSE_DATE('%Y-%m-%d', t.se_region.last_shown) AS se_last_shown
+FROM (
+    SELECT
+        source.*,
+        (
+            SELECT AS STRUCT region.first_shown, region.last_shown
+            FROM UNNEST(source.region_stats) AS region
+            WHERE region.region_code = "SE"
+            LIMIT 1
+        ) AS se_region
+    FROM
+        `bigquery-public-data.google_ads_transparency_center.creative_stats` AS source
+    WHERE
+        source.advertiser_location = "SE"
+) AS t
+WHERE
+    t.se_region IS NOT NULL
+"""
+
 CHECK_DATA_AVAILABILITY_QUERY = """
 SELECT 1
-FROM `bigquery-public-data.google_ads_transparency_center.creative_stats` AS t
+FROM `{project_id}.{dataset_id}.{staging_table_id}` AS t
 WHERE
     t.advertiser_id IN ({advertiser_ids_subquery})
-    AND t.advertiser_location = "SE"
-    AND EXISTS (
-        SELECT 1 FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"
-    )
-    AND PARSE_DATE('%Y-%m-%d', (SELECT region.first_shown FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"))
-        BETWEEN @start_date AND @end_date
+    AND t.se_first_shown BETWEEN @start_date AND @end_date
+    -- first_shown <= last_shown, so this is implied by the filter above but lets BigQuery prune partitions.
+    AND t.se_last_shown >= @start_date
 LIMIT 1
 """
 
 INSERT_NEW_GOOGLE_ADS_DATA_QUERY = """
-INSERT INTO `{project_id}.{dataset_id}.{table_id}`
-(data_modified, metadata_time, advertiser_id, creative_id, raw_data)
-
+MERGE `{project_id}.{dataset_id}.{table_id}` AS existing
+USING (
 WITH selected_advertisers AS (
     {selected_advertisers_query}
 ),
 ads_with_dates AS (
     SELECT
-        TIMESTAMP(PARSE_DATE('%Y-%m-%d', (SELECT region.first_shown FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"))) AS data_modified,
+        TIMESTAMP(t.se_first_shown) AS data_modified,
         CURRENT_TIMESTAMP() AS metadata_time,
         t.advertiser_id,
         t.creative_id,
@@ -48,46 +82,71 @@ ads_with_dates AS (
             t.advertiser_verification_status,
             t.topic,
             t.is_funded_by_google_ad_grants,
-            ARRAY(
-                SELECT AS STRUCT *
-                FROM UNNEST(t.region_stats) AS region
-                WHERE region.region_code = "SE"
-            ) AS region_stats,
+            t.region_stats,
             t.audience_selection_approach_info
-        )) AS raw_data
+        )) AS raw_data{payload_columns}
     FROM
-        `bigquery-public-data.google_ads_transparency_center.creative_stats` AS t
+        `{project_id}.{dataset_id}.{staging_table_id}` AS t
     WHERE
         t.advertiser_id IN (SELECT advertiser_id FROM selected_advertisers)
-        AND t.advertiser_location = "SE"
-        AND EXISTS (
-            SELECT 1 FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"
-        )
-        AND PARSE_DATE('%Y-%m-%d', (SELECT region.last_shown FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE")) BETWEEN @start_date AND @end_date
+        AND t.se_last_shown BETWEEN @start_date AND @end_date
 )
 SELECT
-    ads_with_dates.data_modified,
-    ads_with_dates.metadata_time,
-    ads_with_dates.advertiser_id,
-    ads_with_dates.creative_id,
-    ads_with_dates.raw_data
+    ads_with_dates.*,
+    FARM_FINGERPRINT(ads_with_dates.raw_data) AS raw_data_hash
 FROM ads_with_dates
-WHERE NOT EXISTS (
-    SELECT 1
-    FROM `{project_id}.{dataset_id}.{table_id}` AS existing
-    WHERE existing.advertiser_id = ads_with_dates.advertiser_id
-    AND existing.creative_id = ads_with_dates.creative_id
-    AND existing.raw_data = ads_with_dates.raw_data
-)
+) AS source
+ON existing.advertiser_id = source.advertiser_id
+    AND existing.creative_id = source.creative_id
+    AND existing.raw_data_hash = source.raw_data_hash
+WHEN NOT MATCHED BY TARGET THEN
+    INSERT ({insert_columns})
+    VALUES ({insert_values})
+"""
+
+DAILY_INGESTION_SCRIPT = """
+DECLARE data_available BOOL DEFAULT FALSE;
+DECLARE rows_inserted INT64 DEFAULT 0;
+DECLARE status STRING DEFAULT 'NO_DATA_AVAILABLE';
+
+SET data_available = EXISTS (
+{check_data_availability_query}
+);
+
+IF data_available THEN
+    BEGIN TRANSACTION;
+{insert_query};
+    SET rows_inserted = @@row_count;
+    COMMIT TRANSACTION;
+    SET status = IF(rows_inserted > 0, 'DATA_INSERTED', 'INCOMPLETE_INSERTION');
+END IF;
+
+SELECT status, rows_inserted;
 """
 
 ADD_UPDATED_ADS_QUERY = """
-INSERT INTO `{project_id}.{dataset_id}.{raw_table_id}`
-(data_modified, metadata_time, advertiser_id, creative_id, raw_data)
+-- Earliest watermark across tracked advertisers, minus the lookback. Advertisers without a
+-- watermark yet force a full scan. As a script variable it lets BigQuery prune the staging
+-- table's partitions.
+DECLARE scan_from DATE DEFAULT (
+    SELECT IF(
+        COUNTIF(w.advertiser_id IS NULL) > 0,
+        DATE '1970-01-01',
+        DATE_SUB(MIN(w.last_shown_watermark), INTERVAL @lookback_days DAY)
+    )
+    FROM `{project_id}.{dataset_id}.{advertisers_tracking_table_id}` AS tracked
+    LEFT JOIN `{project_id}.{dataset_id}.{watermarks_table_id}` AS w
+        ON w.advertiser_id = tracked.advertiser_id
+);
+DECLARE rows_inserted INT64 DEFAULT 0;
+
+BEGIN TRANSACTION;
 
+MERGE `{project_id}.{dataset_id}.{raw_table_id}` AS existing
+USING (
 WITH filtered_ads AS (
     SELECT
-        TIMESTAMP(PARSE_DATE('%Y-%m-%d', (SELECT region.first_shown FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"))) AS data_modified,
+        TIMESTAMP(t.se_first_shown) AS data_modified,
         CURRENT_TIMESTAMP() AS metadata_time,
         t.advertiser_id,
         t.creative_id,
@@ -102,46 +161,73 @@ WITH filtered_ads AS (
             t.advertiser_verification_status,
             t.topic,
             t.is_funded_by_google_ad_grants,
-            ARRAY(
-                SELECT AS STRUCT *
-                FROM UNNEST(t.region_stats) AS region
-                WHERE region.region_code = "SE"
-            ) AS region_stats,
+            t.region_stats,
             t.audience_selection_approach_info
-        )) AS raw_data
+        )) AS raw_data{payload_columns}
     FROM
-        `bigquery-public-data.google_ads_transparency_center.creative_stats` AS t
+        `{project_id}.{dataset_id}.{staging_table_id}` AS t
+    LEFT JOIN
+        `{project_id}.{dataset_id}.{watermarks_table_id}` AS w
+        ON w.advertiser_id = t.advertiser_id
     WHERE
         t.advertiser_id IN (SELECT advertiser_id FROM `{project_id}.{dataset_id}.{advertisers_tracking_table_id}`)
-        AND t.advertiser_location = "SE"
-        AND EXISTS (
-            SELECT 1 FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"
+        AND t.se_last_shown >= scan_from
+        -- Only creatives shown on or after the advertiser's watermark can have changed. The
+        -- lookback re-reads the days before it, in case the staging snapshot updated them late;
+        -- versions already stored are skipped by the raw_data_hash match.
+        AND (
+            w.last_shown_watermark IS NULL
+            OR t.se_last_shown >= DATE_SUB(w.last_shown_watermark, INTERVAL @lookback_days DAY)
         )
 )
 SELECT
-    data_modified,
-    metadata_time,
-    advertiser_id,
-    creative_id,
-    raw_data
+    *,
+    FARM_FINGERPRINT(raw_data) AS raw_data_hash
 FROM
     filtered_ads
-WHERE NOT EXISTS (
-    SELECT 1
-    FROM `{project_id}.{dataset_id}.{raw_table_id}` AS existing
-    WHERE existing.advertiser_id = filtered_ads.advertiser_id
-    AND existing.creative_id = filtered_ads.creative_id
-    AND existing.raw_data = filtered_ads.raw_data
-)
+) AS source
+ON existing.advertiser_id = source.advertiser_id
+    AND existing.creative_id = source.creative_id
+    AND existing.raw_data_hash = source.raw_data_hash
+WHEN NOT MATCHED BY TARGET THEN
+    INSERT ({insert_columns})
+    VALUES ({insert_values});
+
+SET rows_inserted = @@row_count;
+
+MERGE `{project_id}.{dataset_id}.{watermarks_table_id}` AS w
+USING (
+    SELECT
+        t.advertiser_id,
+        MAX(t.se_last_shown) AS last_shown_watermark
+    FROM
+        `{project_id}.{dataset_id}.{staging_table_id}` AS t
+    WHERE
+        t.advertiser_id IN (SELECT advertiser_id FROM `{project_id}.{dataset_id}.{advertisers_tracking_table_id}`)
+        AND t.se_last_shown >= scan_from
+    GROUP BY
+        t.advertiser_id
+) AS latest
+ON w.advertiser_id = latest.advertiser_id
+WHEN MATCHED AND latest.last_shown_watermark > w.last_shown_watermark THEN
+    UPDATE SET
+        last_shown_watermark = latest.last_shown_watermark,
+        updated_at = CURRENT_TIMESTAMP()
+WHEN NOT MATCHED BY TARGET THEN
+    INSERT (advertiser_id, last_shown_watermark, updated_at)
+    VALUES (latest.advertiser_id, latest.last_shown_watermark, CURRENT_TIMESTAMP());
+
+COMMIT TRANSACTION;
+
+SELECT rows_inserted;
 """
 
 ADD_TARGETED_ADS_QUERY = """
-INSERT INTO `{project_id}.{dataset_id}.{raw_table_id}`
-(data_modified, metadata_time, advertiser_id, creative_id, raw_data)
-
+MERGE `{project_id}.{dataset_id}.{raw_table_id}` AS existing
+USING (
 WITH filtered_ads AS (
     SELECT
-        TIMESTAMP(PARSE_DATE('%Y-%m-%d', (SELECT region.first_shown FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"))) AS data_modified,
+        TIMESTAMP(t.se_first_shown) AS data_modified,
         CURRENT_TIMESTAMP() AS metadata_time,
         t.advertiser_id,
         t.creative_id,
@@ -156,35 +242,80 @@ WITH filtered_ads AS (
             t.advertiser_verification_status,
             t.topic,
             t.is_funded_by_google_ad_grants,
-            ARRAY(
-                SELECT AS STRUCT *
-                FROM UNNEST(t.region_stats) AS region
-                WHERE region.region_code = "SE"
-            ) AS region_stats,
+            t.region_stats,
             t.audience_selection_approach_info
-        )) AS raw_data
+        )) AS raw_data{payload_columns}
     FROM
-        `bigquery-public-data.google_ads_transparency_center.creative_stats` AS t
+        `{project_id}.{dataset_id}.{staging_table_id}` AS t
     WHERE
         ({where_clause})
-        AND t.advertiser_location = "SE"
-        AND EXISTS (
-            SELECT 1 FROM UNNEST(t.region_stats) AS region WHERE region.region_code = "SE"
-        )
 )
 SELECT
-    data_modified,
-    metadata_time,
-    advertiser_id,
-    creative_id,
-    raw_data
+    *,
+    FARM_FINGERPRINT(raw_data) AS raw_data_hash
 FROM
     filtered_ads
-WHERE NOT EXISTS (
-    SELECT 1
-    FROM `{project_id}.{dataset_id}.{raw_table_id}` AS existing
-    WHERE existing.advertiser_id = filtered_ads.advertiser_id
-    AND existing.creative_id = filtered_ads.creative_id
-    AND existing.raw_data = filtered_ads.raw_data
+) AS source
+ON existing.advertiser_id = source.advertiser_id
+    AND existing.creative_id = source.creative_id
+    AND existing.raw_data_hash = source.raw_data_hash
+WHEN NOT MATCHED BY TARGET THEN
+    INSERT ({insert_columns})
+    VALUES ({insert_values})
+"""
+
+MIGRATE_TO_TYPED_SCHEMA_QUERY = """
+INSERT INTO `{project_id}.{dataset_id}.{target_table_id}` ({insert_columns})
+SELECT
+    source.data_modified,
+    source.metadata_time,
+    source.advertiser_id,
+    source.creative_id,{raw_data_column}
+    COALESCE(source.raw_data_hash, FARM_FINGERPRINT(source.raw_data)) AS raw_data_hash,
+{payload_extractions}
+FROM
+    `{project_id}.{dataset_id}.{source_table_id}` AS source
+"""
+
+BACKFILL_RAW_DATA_HASH_QUERY = """
+UPDATE `{project_id}.{dataset_id}.{table_id}`
+SET raw_data_hash = FARM_FINGERPRINT(raw_data)
+WHERE raw_data_hash IS NULL
+"""
+
+GET_COMPLETED_BACKFILL_CHUNKS_QUERY = """
+SELECT DISTINCT chunk_id
+FROM `{project_id}.{dataset_id}.{state_table_id}`
+WHERE backfill_id = @backfill_id
+"""
+
+INSERT_BACKFILL_CHECKPOINT_QUERY = """
+INSERT INTO `{project_id}.{dataset_id}.{state_table_id}`
+(backfill_id, chunk_id, chunk_start_date, chunk_end_date, advertiser_ids, status, rows_inserted, bytes_processed, job_id, completed_at)
+VALUES (
+    @backfill_id,
+    @chunk_id,
+    @chunk_start_date,
+    @chunk_end_date,
+    @advertiser_ids,
+    @status,
+    @rows_inserted,
+    @bytes_processed,
+    @job_id,
+    CURRENT_TIMESTAMP()
 )
 """
+
+INSERT_INGESTION_JOB_EVENT_QUERY = """
+INSERT INTO `{project_id}.{dataset_id}.{jobs_table_id}`
+(job_id, job_type, status, submitted_at, updated_at, status_code, result, error)
+VALUES (@job_id, @job_type, @status, @submitted_at, @updated_at, @status_code, @result, @error)
+"""
+
+GET_INGESTION_JOB_QUERY = """
+SELECT job_id, job_type, status, submitted_at, updated_at, status_code, result, error
+FROM `{project_id}.{dataset_id}.{jobs_table_id}`
+WHERE job_id = @job_id
+ORDER BY updated_at DESC
+LIMIT 1
+"""
@@ -1,15 +1,19 @@
+from functools import partial
 from utils.logging_config import logger
 from fastapi import APIRouter, HTTPException
+from enums.InsertionEnum import InsertionMode
 from schemas.InsertionRequest import InsertionRequest
 from services.ads_service import run_ads_insertion
+from services.job_service import submit_ingestion_job, job_accepted_response
 
 router = APIRouter()
 
 
 @router.post(
     "/insert-updated",
+    status_code=202,
     summary="Insert updated ads",
-    description="Inserts Google Ads data that has been updated or modified.",
+    description="Submits a job that inserts Google Ads data that has been updated or modified.",
 )
 async def insert_updated_ads(insertion_request: InsertionRequest):
     """
@@ -23,20 +27,33 @@ async def insert_updated_ads(insertion_request: InsertionRequest):
                                               optional advertiser_ids or creative_ids for targeted updates.
 
     Background Task:
-        Adds a background task to execute the ad insertion process via `run_ads_insertion`.
+        Submits an ingestion job executing the ad insertion process via `run_ads_insertion`.
 
     Raises:
-        HTTPException: If no advertiser or creative IDs are provided for SPECIFIC mode, or if the insertion process fails.
+        HTTPException: If no advertiser or creative IDs are provided for SPECIFIC mode, or if the job cannot be submitted.
 
     Returns:
-        dict: A message indicating that the insertion process has been initiated, along with the selected update mode.
+        JSONResponse: HTTP 202 with the job record; poll `/ingestion/jobs/{job_id}` for the outcome.
     """
     try:
-        return await run_ads_insertion(
-            insertion_request.insertion_mode,
-            insertion_request.advertiser_ids,
-            insertion_request.creative_ids,
+        if insertion_request.insertion_mode == InsertionMode.SPECIFIC and not (
+            insertion_request.advertiser_ids or insertion_request.creative_ids
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail="In SPECIFIC mode, 'advertiser_ids' or 'creative_ids' is required.",
+            )
+
+        job = await submit_ingestion_job(
+            f"ads_update_{insertion_request.insertion_mode.value}",
+            partial(
+                run_ads_insertion,
+                insertion_request.insertion_mode,
+                insertion_request.advertiser_ids,
+                insertion_request.creative_ids,
+            ),
         )
+        return job_accepted_response(job)
 
     except HTTPException as http_exc:
         raise http_exc
@@ -1,35 +1,81 @@
+from functools import partial
 from utils.logging_config import logger
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Path
 from schemas.BackfillRequest import BackfillRequest
+from schemas.IngestionJob import IngestionJob
 from schemas.ThreeMonthIngestionRequest import ThreeMonthIngestionRequest
-from services.ingestion_service import run_daily_ingestion, run_backfill_ingestion
+from services.ingestion_service import (
+    run_daily_ingestion,
+    run_backfill_ingestion,
+    run_staging_snapshot,
+)
+from services.job_service import (
+    submit_ingestion_job,
+    get_ingestion_job,
+    job_accepted_response,
+)
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
 
+@router.post(
+    "/staging-snapshot",
+    status_code=202,
+    summary="Refresh Creative Stats Staging Snapshot",
+    description="Submits a job that rebuilds the partitioned snapshot of SE ads from the public Transparency Center table that all ingestion queries read from.",
+)
+async def staging_snapshot():
+    """
+    This endpoint submits a job that rebuilds the creative stats staging snapshot.
+
+    **Description**:
+    - Materialises SE ads with pre-extracted `se_first_shown`/`se_last_shown` dates into a partitioned, clustered table.
+    - Should be scheduled once per day, before the daily ingestion.
+
+    **Returns**:
+    - HTTP 202 with the job record; poll `/ingestion/jobs/{job_id}` for the snapshot row count and bytes processed.
+
+    **Raises**:
+    - HTTPException if the job cannot be submitted.
+    """
+    try:
+        job = await submit_ingestion_job("staging_snapshot", run_staging_snapshot)
+        return job_accepted_response(job)
+
+    except HTTPException as http_exc:
+        raise http_exc
+    except Exception:
+        logger.error("Unexpected error during staging snapshot refresh", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={"status": "Unexpected error during staging snapshot refresh"},
+        )
+
+
 @router.post(
     "/daily",
+    status_code=202,
     summary="Run Daily Ingestion",
-    description="Triggers the daily ingestion of Google Ads data for the previous day, ensuring the latest data is inserted into BigQuery.",
+    description="Submits a job for the daily ingestion of Google Ads data for the previous day, ensuring the latest data is inserted into BigQuery.",
 )
 async def daily_ingestion():
     """
-    This endpoint triggers the ingestion of Google Ads data for the previous day.
+    This endpoint submits a job that ingests Google Ads data for the previous day.
 
     **Description**:
     - It checks if the necessary BigQuery table exists and creates it if necessary.
     - Initiates data ingestion for the previous day’s data.
 
     **Returns**:
-    - A success message if new data is ingested.
-    - A no-content message if data is already up-to-date.
+    - HTTP 202 with the job record; poll `/ingestion/jobs/{job_id}` for the outcome.
 
     **Raises**:
-    - HTTPException if ingestion fails or if table verification fails.
+    - HTTPException if the job cannot be submitted.
     """
     try:
-        return await run_daily_ingestion()
+        job = await submit_ingestion_job("daily", run_daily_ingestion)
+        return job_accepted_response(job)
 
     except HTTPException as http_exc:
         raise http_exc
@@ -43,25 +89,31 @@ async def daily_ingestion():
 
 @router.post(
     "/backfill",
+    status_code=202,
     summary="Run Backfill Ingestion",
-    description="Triggers a backfill ingestion for a specified date range.",
+    description="Submits a job for a backfill ingestion for a specified date range.",
 )
 async def backfill_ingestion(backfill_request: BackfillRequest):
     """
-    This endpoint triggers a backfill ingestion of Google Ads data for a specified date range.
+    This endpoint submits a job that backfills Google Ads data for a specified date range.
 
     - **Parameters**:
         - backfill_request: Includes the start date, end date, and advertiser IDs.
-    - **Returns**: JSON with a status message for success or no new data.
-    - **Raises**: HTTPException with a status message for any ingestion failure.
+    - **Returns**: HTTP 202 with the job record; poll `/ingestion/jobs/{job_id}` for the outcome.
+    - **Raises**: HTTPException if the job cannot be submitted.
     """
     try:
-        return await run_backfill_ingestion(
-            backfill=True,
-            start_date=backfill_request.start_date,
-            end_date=backfill_request.end_date,
-            advertiser_ids=backfill_request.advertiser_ids,
+        job = await submit_ingestion_job(
+            "backfill",
+            partial(
+                run_backfill_ingestion,
+                backfill=True,
+                start_date=backfill_request.start_date,
+                end_date=backfill_request.end_date,
+                advertiser_ids=backfill_request.advertiser_ids,
+            ),
         )
+        return job_accepted_response(job)
     except HTTPException as http_exc:
         raise http_exc
     except Exception:
@@ -73,18 +125,19 @@ async def backfill_ingestion(backfill_request: BackfillRequest):
 
 @router.post(
     "/backfill-latest-three-months",
+    status_code=202,
     summary="Run Backfill Ingestion latest 3 months",
-    description="Triggers a backfill ingestion on latest ads 3 month range",
+    description="Submits a job for a backfill ingestion on latest ads 3 month range",
 )
 async def three_month_backfill_ingestion(request: ThreeMonthIngestionRequest):
     """
-    This endpoint triggers a backfill ingestion of Google Ads data for the past 3 months for a specified advertiser.
+    This endpoint submits a job that backfills Google Ads data for the past 3 months for a specified advertiser.
 
     **Parameters**:
         - `advertiser_ids`: The ID of the advertiser to ingest data for.
 
-    **Returns**: JSON with a status message for success or no new data.
-    **Raises**: HTTPException with a status message for any ingestion failure.
+    **Returns**: HTTP 202 with the job record; poll `/ingestion/jobs/{job_id}` for the outcome.
+    **Raises**: HTTPException if the job cannot be submitted.
     """
     try:
         advertiser_ids = request.advertiser_ids
@@ -94,12 +147,17 @@ async def three_month_backfill_ingestion(request: ThreeMonthIngestionRequest):
         end_date = datetime.now().date() - timedelta(days=1)
         start_date = end_date - timedelta(days=90)
 
-        return await run_backfill_ingestion(
-            backfill=True,
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
-            advertiser_ids=request.advertiser_ids,
+        job = await submit_ingestion_job(
+            "backfill_latest_three_months",
+            partial(
+                run_backfill_ingestion,
+                backfill=True,
+                start_date=start_date.isoformat(),
+                end_date=end_date.isoformat(),
+                advertiser_ids=advertiser_ids,
+            ),
         )
+        return job_accepted_response(job)
     except HTTPException as http_exc:
         raise http_exc
     except Exception:
@@ -107,3 +165,40 @@ async def three_month_backfill_ingestion(request: ThreeMonthIngestionRequest):
         raise HTTPException(
             status_code=500, detail="Unexpected error during 3-month ingestion"
         )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=IngestionJob,
+    summary="Get Ingestion Job Status",
+    description="Returns the current state of a submitted ingestion job and, once finished, its result.",
+)
+async def ingestion_job_status(
+    job_id: str = Path(
+        ...,
+        description="Job ID returned when the ingestion was submitted",
+        example="123e4567-e89b-12d3-a456-426614174000",
+    )
+):
+    """
+    This endpoint returns the status of an ingestion job.
+
+    **Parameters**:
+        - `job_id`: The ID returned by one of the ingestion or ads update endpoints.
+
+    **Returns**: The job record, including the ingestion's status code and response body once finished.
+    **Raises**: HTTPException 404 if no job with this ID exists.
+    """
+    try:
+        job = await get_ingestion_job(job_id)
+    except Exception:
+        logger.error(
+            f"Unexpected error retrieving ingestion job {job_id}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=500, detail="Unexpected error retrieving ingestion job"
+        )
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
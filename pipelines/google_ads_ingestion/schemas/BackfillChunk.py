@@ -0,0 +1,19 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class BackfillChunk(BaseModel):
+    """
+    Model representing one unit of work of a planned backfill.
+
+    Attributes:
+        chunk_id (str): Deterministic identifier of the chunk within its backfill.
+        start_date (str): First day of the chunk's date window in 'YYYY-MM-DD' format.
+        end_date (str): Last day of the chunk's date window in 'YYYY-MM-DD' format.
+        advertiser_ids (List[str]): The batch of advertiser IDs covered by the chunk.
+    """
+
+    chunk_id: str
+    start_date: str
+    end_date: str
+    advertiser_ids: List[str] = Field(default_factory=list)
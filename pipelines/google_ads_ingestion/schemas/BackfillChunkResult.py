@@ -0,0 +1,27 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class BackfillChunkResult(BaseModel):
+    """
+    Model representing the progress of a single backfill chunk.
+
+    Attributes:
+        chunk_id (str): Identifier of the chunk within its backfill.
+        start_date (str): First day of the chunk's date window.
+        end_date (str): Last day of the chunk's date window.
+        advertiser_count (int): Number of advertisers in the chunk's batch.
+        status (str): Outcome of the chunk, e.g. an IngestionStatus value, "resumed" or "failed".
+        rows_inserted (int): Rows inserted by the chunk.
+        bytes_processed (int): Bytes processed by the chunk's insert job.
+        job_id (str, optional): The BigQuery job ID of the chunk's insert job.
+    """
+
+    chunk_id: str
+    start_date: str
+    end_date: str
+    advertiser_count: int
+    status: str
+    rows_inserted: int = 0
+    bytes_processed: int = 0
+    job_id: Optional[str] = None
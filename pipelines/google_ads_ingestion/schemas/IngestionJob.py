@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel, Field
+from enums.JobStatus import JobStatus
+
+
+class IngestionJob(BaseModel):
+    """
+    Model representing a tracked ingestion job.
+
+    Attributes:
+        job_id (str): Unique identifier of the job.
+        job_type (str): The kind of ingestion, e.g. "daily" or "backfill".
+        status (JobStatus): Current lifecycle state of the job.
+        submitted_at (datetime): When the job was submitted.
+        updated_at (datetime): When the job record was last changed.
+        status_code (int, optional): HTTP status code the ingestion produced, once finished.
+        result (Any, optional): Response body the ingestion produced, once finished.
+        error (str, optional): Error detail if the job failed.
+    """
+
+    job_id: str = Field(
+        ...,
+        description="Unique identifier for the job",
+        example="123e4567-e89b-12d3-a456-426614174000",
+    )
+    job_type: str = Field(..., description="Kind of ingestion", example="backfill")
+    status: JobStatus = Field(..., description="Current state of the job")
+    submitted_at: datetime
+    updated_at: datetime
+    status_code: Optional[int] = Field(
+        None, description="HTTP status code produced by the ingestion"
+    )
+    result: Optional[Any] = Field(
+        None, description="Response body produced by the ingestion"
+    )
+    error: Optional[str] = Field(None, description="Error detail if the job failed")
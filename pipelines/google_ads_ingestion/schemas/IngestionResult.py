@@ -0,0 +1,44 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from enums.IngestionStatus import IngestionStatus
+from schemas.BackfillChunkResult import BackfillChunkResult
+
+
+class IngestionResult(BaseModel):
+    """
+    Model representing the outcome of a single ingestion query job.
+
+    The statistics are read from the BigQuery job itself, so no additional queries are
+    needed to determine whether new rows were written.
+
+    Attributes:
+        status (IngestionStatus): The resulting ingestion status.
+        rows_inserted (int): Number of rows written by the DML statement.
+        bytes_processed (int): Total bytes processed by the query job.
+        slot_ms (int): Slot milliseconds consumed by the query job.
+        job_id (str, optional): The BigQuery job ID, if a job was executed.
+        chunks (List[BackfillChunkResult]): Per-chunk progress, for planned backfills only.
+    """
+
+    status: IngestionStatus
+    rows_inserted: int = Field(0, description="Rows written by the DML statement")
+    bytes_processed: int = Field(0, description="Bytes processed by the query job")
+    slot_ms: int = Field(0, description="Slot milliseconds consumed by the query job")
+    job_id: Optional[str] = Field(None, description="BigQuery job ID")
+    chunks: List[BackfillChunkResult] = Field(
+        default_factory=list, description="Per-chunk progress of a planned backfill"
+    )
+
+    def to_content(self) -> dict:
+        """
+        Returns the job statistics as a JSON-serialisable dictionary.
+        """
+        content = {
+            "rows_inserted": self.rows_inserted,
+            "bytes_processed": self.bytes_processed,
+            "slot_ms": self.slot_ms,
+            "job_id": self.job_id,
+        }
+        if self.chunks:
+            content["chunks"] = [chunk.model_dump() for chunk in self.chunks]
+        return content
@@ -1,5 +1,9 @@
+from .BackfillChunk import BackfillChunk as BackfillChunk
+from .BackfillChunkResult import BackfillChunkResult as BackfillChunkResult
 from .BackfillRequest import BackfillRequest as BackfillRequest
 from .InsertionRequest import InsertionRequest as InsertionRequest
 from .ThreeMonthIngestionRequest import (
     ThreeMonthIngestionRequest as ThreeMonthIngestionRequest,
 )
+from .IngestionResult import IngestionResult as IngestionResult
+from .IngestionJob import IngestionJob as IngestionJob
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi.responses import JSONResponse
 from utils.logging_config import logger
 from fastapi import HTTPException
@@ -36,7 +37,8 @@ async def run_ads_insertion(
                 logger.info(
                     f"Starting SPECIFIC update for advertiser_ids: {advertiser_ids} and creative_ids: {creative_ids}"
                 )
-                result = add_targeted_ad_versions(
+                result = await asyncio.to_thread(
+                    add_targeted_ad_versions,
                     bigquery_client=bigquery_client,
                     project_id=PROJECT_ID,
                     dataset_id=DATASET_ID,
@@ -49,7 +51,8 @@ async def run_ads_insertion(
 
             case InsertionMode.ALL:
                 logger.info(f"Starting update for ALL ads in {RAW_TABLE_ID}.")
-                result = add_all_updated_ads(
+                result = await asyncio.to_thread(
+                    add_all_updated_ads,
                     bigquery_client=bigquery_client,
                     project_id=PROJECT_ID,
                     dataset_id=DATASET_ID,
@@ -1,44 +1,82 @@
+import asyncio
 from fastapi.responses import JSONResponse
 from utils.logging_config import logger
 from typing import List, Union
 
 from fastapi import HTTPException
-from config import PROJECT_ID, DATASET_ID, RAW_TABLE_ID
+from config import (
+    PROJECT_ID,
+    DATASET_ID,
+    RAW_TABLE_ID,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+)
 from enums.IngestionStatus import IngestionStatus
 from utils.create_incremental_table_if_not_exists import (
     create_incremental_table_if_not_exists,
 )
-from utils.insert_new_google_ads_data import insert_new_google_ads_data
+from utils.run_daily_ingestion_script import run_daily_ingestion_script
+from utils.run_planned_backfill import run_planned_backfill
+from utils.refresh_creative_stats_staging import refresh_creative_stats_staging
 from utils.bigquery_client import bigquery_client
 from utils.handle_ingestion_result import handle_ingestion_result
 
 
-async def run_daily_ingestion() -> JSONResponse:
+async def run_staging_snapshot() -> JSONResponse:
     """
-    Executes the daily ingestion process for Google Ads data.
+    Rebuilds the creative stats staging snapshot that all ingestion queries read from.
 
-    This function checks if the necessary BigQuery table exists or creates it if it doesn't.
-    Then, it inserts new daily data into the specified table, ensuring only unique records are added.
+    This should run once per day, before the daily ingestion, so that the ingestion
+    queries read a partitioned and clustered local copy of the SE ads instead of scanning
+    the public Transparency Center table.
 
     Raises:
-        Exception: If the BigQuery table cannot be created or verified.
+        Exception: If the staging snapshot cannot be rebuilt.
     """
     try:
-        table_status = create_incremental_table_if_not_exists(
-            bigquery_client, DATASET_ID, RAW_TABLE_ID
+        logger.info("Refreshing creative stats staging snapshot.")
+        result = await asyncio.to_thread(
+            refresh_creative_stats_staging,
+            bigquery_client=bigquery_client,
+            project_id=PROJECT_ID,
+            dataset_id=DATASET_ID,
+            staging_table_id=CREATIVE_STATS_STAGING_TABLE_ID,
         )
 
-        table_response = handle_ingestion_result(table_status, "Table verification")
-        if table_status == IngestionStatus.TABLE_CREATION_FAILED:
-            return table_response
+        return handle_ingestion_result(result, "Staging snapshot")
+
+    except HTTPException as http_exc:
+        raise http_exc
+
+    except Exception:
+        logger.error(
+            "An unexpected error occurred during staging snapshot refresh",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred during staging snapshot refresh.",
+        )
+
+
+async def run_daily_ingestion() -> JSONResponse:
+    """
+    Executes the daily ingestion process for Google Ads data.
+
+    After the BigQuery table is created if it doesn't exist, checking data availability and
+    inserting the new daily data are submitted as a single multi-statement script, ensuring only
+    unique records are added.
 
+    Raises:
+        Exception: If the daily ingestion script fails.
+    """
+    try:
         logger.info("Starting daily ingestion.")
-        data_status = insert_new_google_ads_data(
+        data_status = await asyncio.to_thread(
+            run_daily_ingestion_script,
             bigquery_client=bigquery_client,
             project_id=PROJECT_ID,
             dataset_id=DATASET_ID,
             table_id=RAW_TABLE_ID,
-            backfill=False,
         )
 
         return handle_ingestion_result(data_status, "Daily ingestion")
@@ -66,7 +104,9 @@ async def run_backfill_ingestion(
     Executes a backfill ingestion for Google Ads data over a specific date range.
 
     This function verifies or creates the required BigQuery table, then inserts historical data between
-    the specified start and end dates, ensuring only unique records are added.
+    the specified start and end dates, ensuring only unique records are added. The range is split into
+    date-window x advertiser-batch chunks that run concurrently and are checkpointed, so re-submitting
+    a failed backfill resumes from the chunks that had not completed yet.
 
     Args:
         backfill (bool): Indicates that the function is performing a backfill ingestion.
@@ -94,8 +134,11 @@ async def run_backfill_ingestion(
                 detail="Both start_date and end_date must be provided for backfill.",
             )
 
-        table_status = create_incremental_table_if_not_exists(
-            bigquery_client, DATASET_ID, RAW_TABLE_ID
+        table_status = await asyncio.to_thread(
+            create_incremental_table_if_not_exists,
+            bigquery_client,
+            DATASET_ID,
+            RAW_TABLE_ID,
         )
 
         table_response = handle_ingestion_result(table_status, "Table verification")
@@ -103,12 +146,12 @@ async def run_backfill_ingestion(
             return table_response
 
         logger.info(f"Starting backfill ingestion from {start_date} to {end_date}.")
-        data_status = insert_new_google_ads_data(
+        data_status = await asyncio.to_thread(
+            run_planned_backfill,
             bigquery_client=bigquery_client,
             project_id=PROJECT_ID,
             dataset_id=DATASET_ID,
             table_id=RAW_TABLE_ID,
-            backfill=backfill,
             start_date=start_date,
             end_date=end_date,
             advertiser_ids=advertiser_ids,
@@ -117,6 +160,9 @@ async def run_backfill_ingestion(
             data_status, "Backfill ingestion", is_backfill=True
         )
 
+    except HTTPException as http_exc:
+        raise http_exc
+
     except Exception:
         logger.error(
             "An unexpected error occurred during backfill ingestion", exc_info=True
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional, Set
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from utils.logging_config import logger
+from config import PROJECT_ID, DATASET_ID, INGESTION_JOBS_TABLE_ID
+from enums.JobStatus import JobStatus
+from schemas.IngestionJob import IngestionJob
+from utils.bigquery_client import bigquery_client
+from utils.ingestion_jobs import (
+    create_ingestion_jobs_table_if_not_exists,
+    save_ingestion_job,
+    load_ingestion_job,
+)
+
+# Finished jobs stay in memory this long and are then looked up from the jobs table.
+FINISHED_JOB_RETENTION_SECONDS = 300
+
+_jobs: Dict[str, IngestionJob] = {}
+_running_tasks: Set[asyncio.Task] = set()
+_jobs_table_verified = False
+
+
+def _persist_job_sync(job: IngestionJob) -> None:
+    """
+    Writes a job record to BigQuery, creating the jobs table on first use.
+    """
+    global _jobs_table_verified
+    if not _jobs_table_verified:
+        create_ingestion_jobs_table_if_not_exists(
+            bigquery_client, DATASET_ID, INGESTION_JOBS_TABLE_ID
+        )
+        _jobs_table_verified = True
+
+    save_ingestion_job(
+        bigquery_client, PROJECT_ID, DATASET_ID, INGESTION_JOBS_TABLE_ID, job
+    )
+
+
+async def _persist_job(job: IngestionJob) -> None:
+    """
+    Persists a job record without blocking the event loop. Failures are logged, not raised,
+    so that a bookkeeping error never fails the ingestion itself.
+    """
+    try:
+        await asyncio.to_thread(_persist_job_sync, job)
+    except Exception:
+        logger.error(f"Failed to persist ingestion job {job.job_id}", exc_info=True)
+
+
+def _update_job(job: IngestionJob, **changes) -> IngestionJob:
+    """
+    Returns a copy of the job with the given changes and stores it as the job's current state.
+    """
+    updated_job = job.model_copy(
+        update={**changes, "updated_at": datetime.now(timezone.utc)}
+    )
+    _jobs[job.job_id] = updated_job
+    return updated_job
+
+
+async def _run_job(
+    job: IngestionJob, run: Callable[[], Awaitable[JSONResponse]]
+) -> None:
+    """
+    Executes a submitted ingestion and records its outcome on the job.
+    """
+    job = _update_job(job, status=JobStatus.RUNNING)
+    await _persist_job(job)
+
+    try:
+        response = await run()
+        result = json.loads(response.body) if response.body else None
+        job = _update_job(
+            job,
+            status=JobStatus.COMPLETED,
+            status_code=response.status_code,
+            result=result,
+        )
+        logger.info(f"Ingestion job {job.job_id} ({job.job_type}) completed.")
+
+    except HTTPException as http_exc:
+        job = _update_job(
+            job,
+            status=JobStatus.FAILED,
+            status_code=http_exc.status_code,
+            error=str(http_exc.detail),
+        )
+        logger.error(f"Ingestion job {job.job_id} ({job.job_type}) failed: {job.error}")
+
+    except Exception:
+        logger.error(
+            f"Unexpected error in ingestion job {job.job_id} ({job.job_type})",
+            exc_info=True,
+        )
+        job = _update_job(
+            job,
+            status=JobStatus.FAILED,
+            status_code=500,
+            error="An unexpected error occurred during ingestion.",
+        )
+
+    await _persist_job(job)
+    asyncio.get_running_loop().call_later(
+        FINISHED_JOB_RETENTION_SECONDS, _jobs.pop, job.job_id, None
+    )
+
+
+async def submit_ingestion_job(
+    job_type: str, run: Callable[[], Awaitable[JSONResponse]]
+) -> IngestionJob:
+    """
+    Submits an ingestion to run in the background and returns its job record immediately.
+
+    The ingestion runs as an asyncio task on the service's event loop, while its BigQuery
+    calls run in worker threads, so the request handler returns at once and other requests,
+    including health checks, are served while the ingestion is in progress. Every state change
+    is persisted to the ingestion jobs table, so the job can be looked up from any instance.
+
+    Args:
+        job_type (str): The kind of ingestion, e.g. "daily" or "backfill".
+        run (Callable[[], Awaitable[JSONResponse]]): Coroutine function performing the ingestion.
+
+    Returns:
+        IngestionJob: The job record in PENDING state.
+    """
+    now = datetime.now(timezone.utc)
+    job = IngestionJob(
+        job_id=str(uuid.uuid4()),
+        job_type=job_type,
+        status=JobStatus.PENDING,
+        submitted_at=now,
+        updated_at=now,
+    )
+    _jobs[job.job_id] = job
+
+    task = asyncio.create_task(_run_job(job, run))
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+
+    logger.info(f"Ingestion job {job.job_id} ({job_type}) submitted.")
+    return job
+
+
+async def get_ingestion_job(job_id: str) -> Optional[IngestionJob]:
+    """
+    Retrieves a job record, from this instance's memory or otherwise from the jobs table.
+    Finished jobs are only kept in memory for FINISHED_JOB_RETENTION_SECONDS.
+
+    Args:
+        job_id (str): The ID of the job.
+
+    Returns:
+        Optional[IngestionJob]: The job record, or None if no job with this ID exists.
+    """
+    job = _jobs.get(job_id)
+    if job is not None:
+        return job
+
+    return await asyncio.to_thread(
+        load_ingestion_job,
+        bigquery_client,
+        PROJECT_ID,
+        DATASET_ID,
+        INGESTION_JOBS_TABLE_ID,
+        job_id,
+    )
+
+
+def job_accepted_response(job: IngestionJob) -> JSONResponse:
+    """
+    Builds the HTTP 202 response returned when an ingestion job has been submitted.
+    """
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
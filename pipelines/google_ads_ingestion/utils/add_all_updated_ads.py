@@ -1,8 +1,22 @@
-from config import ADVERTISERS_TRACKING_TABLE_ID
+from config import (
+    ADS_UPDATE_WATERMARK_LOOKBACK_DAYS,
+    ADVERTISERS_TRACKING_TABLE_ID,
+    ADVERTISER_WATERMARKS_TABLE_ID,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    RAW_SCHEMA_TYPED,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+)
 from google.cloud import bigquery
 from enums.IngestionStatus import IngestionStatus
+from enums.QueryBudget import QueryBudget
+from schemas.IngestionResult import IngestionResult
 from .query_builder import QueryBuilder
-from utils.check_table_row_count import check_table_row_count
+from .build_ingestion_result import build_ingestion_result
+from .create_incremental_table_if_not_exists import ensure_raw_data_hash_column
+from .create_watermarks_table_if_not_exists import (
+    create_watermarks_table_if_not_exists,
+)
+from .run_guarded_query import run_guarded_query
 
 
 def add_all_updated_ads(
@@ -10,7 +24,10 @@ def add_all_updated_ads(
     project_id: str,
     dataset_id: str,
     raw_table_id: str,
-) -> IngestionStatus:
+    staging_table_id: str = CREATIVE_STATS_STAGING_TABLE_ID,
+    watermarks_table_id: str = ADVERTISER_WATERMARKS_TABLE_ID,
+    lookback_days: int = ADS_UPDATE_WATERMARK_LOOKBACK_DAYS,
+) -> IngestionResult:
     """
     Inserts updated ad versions for all advertisers listed in the ADVERTISERS_TRACKING_TABLE_ID.
 
@@ -18,37 +35,64 @@ def add_all_updated_ads(
     and inserts new or modified ad records into the target raw table, ensuring only unique
     records are added based on raw data changes. This maintains historical versions of each ad.
 
+    The update is incremental: each advertiser has a watermark holding the latest `last_shown`
+    date seen by a previous successful run, and only creatives shown on or after it, minus
+    `lookback_days`, are read. The lookback catches creatives the staging snapshot updated after
+    that run; the versions among them that are already stored are skipped by their hash.
+    Advertisers without a watermark are read in full. The watermarks are advanced in the same
+    transaction as the insert, so a failed run leaves them untouched. The raw table is given the
+    `raw_data_hash` column the MERGE matches on first, if it predates it.
+
     Args:
         bigquery_client (bigquery.Client): An instance of BigQuery client to execute queries.
         project_id (str): The Google Cloud project ID where BigQuery datasets reside.
         dataset_id (str): The ID of the dataset containing both the target and tracking tables.
         raw_table_id (str): The ID of the raw table where updated ad data is stored.
+        staging_table_id (str): The ID of the creative stats staging table to read ads from.
+        watermarks_table_id (str): The ID of the per-advertiser watermarks table.
+        lookback_days (int): Days before each watermark that are read again.
 
     Returns:
-        IngestionStatus: An enum value indicating the status of the insertion process:
+        IngestionResult: The insertion status and job statistics, where the status is:
             - DATA_INSERTED: New rows were successfully added to the raw table.
             - NO_NEW_UPDATES: No new rows were added, as all ads already existed in the table.
 
     """
-    initial_row_count = check_table_row_count(
-        bigquery_client, project_id, dataset_id, raw_table_id
+    create_watermarks_table_if_not_exists(
+        bigquery_client, dataset_id, watermarks_table_id
+    )
+    ensure_raw_data_hash_column(
+        bigquery_client,
+        bigquery_client.get_table(
+            bigquery_client.dataset(dataset_id).table(raw_table_id)
+        ),
     )
 
     query = QueryBuilder.build_add_updated_ads_query(
         project_id=project_id,
         dataset_id=dataset_id,
         raw_table_id=raw_table_id,
-        advertisers_tracking_table=ADVERTISERS_TRACKING_TABLE_ID,
+        tracking_table_id=ADVERTISERS_TRACKING_TABLE_ID,
+        staging_table_id=staging_table_id,
+        watermarks_table_id=watermarks_table_id,
+        typed=RAW_SCHEMA_TYPED,
+        keep_raw_data=RAW_SCHEMA_KEEP_RAW_DATA,
     )
 
-    query_job = bigquery_client.query(query)
-    query_job.result()
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("lookback_days", "INT64", lookback_days),
+        ]
+    )
 
-    final_row_count = check_table_row_count(
-        bigquery_client, project_id, dataset_id, raw_table_id
+    query_job = run_guarded_query(
+        bigquery_client, query, QueryBudget.ADS_UPDATE, job_config
     )
+    rows_inserted = next(iter(query_job.result())).rows_inserted
 
-    if final_row_count > initial_row_count:
-        return IngestionStatus.DATA_INSERTED
-    else:
-        return IngestionStatus.NO_NEW_UPDATES
+    return build_ingestion_result(
+        query_job,
+        IngestionStatus.DATA_INSERTED,
+        IngestionStatus.NO_NEW_UPDATES,
+        rows_inserted=rows_inserted,
+    )
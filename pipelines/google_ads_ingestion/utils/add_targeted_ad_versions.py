@@ -1,8 +1,22 @@
 from typing import List
 from google.cloud import bigquery
+from config import (
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    RAW_SCHEMA_TYPED,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+)
 from enums.IngestionStatus import IngestionStatus
-from .check_table_row_count import check_table_row_count
+from enums.QueryBudget import QueryBudget
+from schemas.IngestionResult import IngestionResult
 from .query_builder import QueryBuilder
+from .build_ingestion_result import build_ingestion_result
+from .create_incremental_table_if_not_exists import ensure_raw_data_hash_column
+from .run_guarded_query import run_guarded_query
+from .stage_ids_in_temp_table import stage_ids_in_temp_table
+
+# ID lists longer than this are staged in a temporary table instead of being passed as a
+# query parameter, which keeps the request well below BigQuery's request size limit.
+MAX_INLINE_IDS = 10_000
 
 
 def add_targeted_ad_versions(
@@ -12,7 +26,8 @@ def add_targeted_ad_versions(
     raw_table_id: str,
     advertiser_ids: List[str] = None,
     creative_ids: List[str] = None,
-) -> None:
+    staging_table_id: str = CREATIVE_STATS_STAGING_TABLE_ID,
+) -> IngestionResult:
     """
     Inserts new versions of ads for specified advertisers or creatives, retaining ad version history.
 
@@ -20,6 +35,11 @@ def add_targeted_ad_versions(
     records into the raw table if there are updates. It prevents duplicate entries by checking for
     uniqueness based on raw data changes.
 
+    The IDs are passed as ARRAY<STRING> query parameters, so the query text is the same for every
+    request. Lists longer than `MAX_INLINE_IDS` are loaded into temporary tables instead, which are
+    deleted once the query has finished. The raw table is given the `raw_data_hash` column the
+    MERGE matches on first, if it predates it.
+
     Args:
         bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
         project_id (str): Google Cloud project ID where the BigQuery dataset is located.
@@ -27,33 +47,59 @@ def add_targeted_ad_versions(
         raw_table_id (str): The ID of the raw table where ad records are stored.
         advertiser_ids (List[str], optional): List of specific advertiser IDs to filter for updates.
         creative_ids (List[str], optional): List of specific creative IDs to filter for updates.
+        staging_table_id (str): The ID of the creative stats staging table to read ads from.
 
     Returns:
-        IngestionStatus: Enum indicating the insertion status:
+        IngestionResult: The insertion status and job statistics, where the status is:
             - DATA_INSERTED: New records were added to the raw table.
             - NO_NEW_UPDATES: No new records were added as all ads already existed in the table.
     """
-
-    initial_row_count = check_table_row_count(
-        bigquery_client, project_id, dataset_id, raw_table_id
+    ensure_raw_data_hash_column(
+        bigquery_client,
+        bigquery_client.get_table(
+            bigquery_client.dataset(dataset_id).table(raw_table_id)
+        ),
     )
 
-    query = QueryBuilder.build_add_targeted_ad_versions_query(
-        project_id=project_id,
-        dataset_id=dataset_id,
-        raw_table_id=raw_table_id,
-        advertiser_ids=advertiser_ids,
-        creative_ids=creative_ids,
-    )
+    query_params = []
+    staged_tables = {}
+    for name, ids in (
+        ("advertiser_ids", advertiser_ids),
+        ("creative_ids", creative_ids),
+    ):
+        if not ids:
+            continue
+        if len(ids) > MAX_INLINE_IDS:
+            staged_tables[name] = stage_ids_in_temp_table(
+                bigquery_client, dataset_id, ids, prefix=f"tmp_{name}"
+            )
+        else:
+            query_params.append(bigquery.ArrayQueryParameter(name, "STRING", ids))
 
-    query_job = bigquery_client.query(query)
-    query_job.result()
+    try:
+        query = QueryBuilder.build_add_targeted_ad_versions_query(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            raw_table_id=raw_table_id,
+            staging_table_id=staging_table_id,
+            filter_advertiser_ids=bool(advertiser_ids),
+            filter_creative_ids=bool(creative_ids),
+            advertiser_ids_table=staged_tables.get("advertiser_ids"),
+            creative_ids_table=staged_tables.get("creative_ids"),
+            typed=RAW_SCHEMA_TYPED,
+            keep_raw_data=RAW_SCHEMA_KEEP_RAW_DATA,
+        )
 
-    final_row_count = check_table_row_count(
-        bigquery_client, project_id, dataset_id, raw_table_id
-    )
+        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
+        query_job = run_guarded_query(
+            bigquery_client, query, QueryBudget.ADS_UPDATE, job_config
+        )
+    finally:
+        for table_id in staged_tables.values():
+            bigquery_client.delete_table(
+                bigquery_client.dataset(dataset_id).table(table_id), not_found_ok=True
+            )
 
-    if final_row_count > initial_row_count:
-        return IngestionStatus.DATA_INSERTED
-    else:
-        return IngestionStatus.NO_NEW_UPDATES
+    return build_ingestion_result(
+        query_job, IngestionStatus.DATA_INSERTED, IngestionStatus.NO_NEW_UPDATES
+    )
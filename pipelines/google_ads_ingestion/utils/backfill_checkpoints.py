@@ -0,0 +1,128 @@
+from typing import Set
+from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
+from utils.logging_config import logger
+from queries import (
+    GET_COMPLETED_BACKFILL_CHUNKS_QUERY,
+    INSERT_BACKFILL_CHECKPOINT_QUERY,
+)
+from schemas.BackfillChunk import BackfillChunk
+from schemas.BackfillChunkResult import BackfillChunkResult
+
+
+def create_backfill_state_table_if_not_exists(
+    bigquery_client: bigquery.Client, dataset_id: str, state_table_id: str
+) -> None:
+    """
+    Creates the table holding backfill chunk checkpoints if it does not exist yet.
+
+    Args:
+        bigquery_client (bigquery.Client): A BigQuery client instance.
+        dataset_id (str): The BigQuery dataset ID.
+        state_table_id (str): The ID of the backfill state table.
+    """
+    table_ref = bigquery_client.dataset(dataset_id).table(state_table_id)
+    try:
+        bigquery_client.get_table(table_ref)
+        return
+    except NotFound:
+        logger.info(
+            f"Table '{state_table_id}' does not exist in dataset '{dataset_id}'. Creating table..."
+        )
+
+    schema = [
+        bigquery.SchemaField("backfill_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("chunk_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("chunk_start_date", "DATE", mode="REQUIRED"),
+        bigquery.SchemaField("chunk_end_date", "DATE", mode="REQUIRED"),
+        bigquery.SchemaField("advertiser_ids", "STRING", mode="REPEATED"),
+        bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("rows_inserted", "INT64"),
+        bigquery.SchemaField("bytes_processed", "INT64"),
+        bigquery.SchemaField("job_id", "STRING"),
+        bigquery.SchemaField("completed_at", "TIMESTAMP", mode="REQUIRED"),
+    ]
+
+    table = bigquery.Table(table_ref, schema=schema)
+    table.clustering_fields = ["backfill_id"]
+    bigquery_client.create_table(table, exists_ok=True)
+
+
+def get_completed_backfill_chunks(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    state_table_id: str,
+    backfill_id: str,
+) -> Set[str]:
+    """
+    Retrieves the IDs of the chunks of a backfill that were already completed.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID.
+        state_table_id (str): The ID of the backfill state table.
+        backfill_id (str): The ID of the backfill.
+
+    Returns:
+        Set[str]: The IDs of the completed chunks.
+    """
+    query = GET_COMPLETED_BACKFILL_CHUNKS_QUERY.format(
+        project_id=project_id, dataset_id=dataset_id, state_table_id=state_table_id
+    )
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("backfill_id", "STRING", backfill_id)
+        ]
+    )
+    return {
+        row.chunk_id
+        for row in bigquery_client.query(query, job_config=job_config).result()
+    }
+
+
+def record_backfill_checkpoint(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    state_table_id: str,
+    backfill_id: str,
+    chunk: BackfillChunk,
+    chunk_result: BackfillChunkResult,
+) -> None:
+    """
+    Records a completed backfill chunk so that a resumed backfill skips it.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID.
+        state_table_id (str): The ID of the backfill state table.
+        backfill_id (str): The ID of the backfill.
+        chunk (BackfillChunk): The completed chunk.
+        chunk_result (BackfillChunkResult): The outcome of the chunk.
+    """
+    query = INSERT_BACKFILL_CHECKPOINT_QUERY.format(
+        project_id=project_id, dataset_id=dataset_id, state_table_id=state_table_id
+    )
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("backfill_id", "STRING", backfill_id),
+            bigquery.ScalarQueryParameter("chunk_id", "STRING", chunk.chunk_id),
+            bigquery.ScalarQueryParameter("chunk_start_date", "DATE", chunk.start_date),
+            bigquery.ScalarQueryParameter("chunk_end_date", "DATE", chunk.end_date),
+            bigquery.ArrayQueryParameter(
+                "advertiser_ids", "STRING", chunk.advertiser_ids
+            ),
+            bigquery.ScalarQueryParameter("status", "STRING", chunk_result.status),
+            bigquery.ScalarQueryParameter(
+                "rows_inserted", "INT64", chunk_result.rows_inserted
+            ),
+            bigquery.ScalarQueryParameter(
+                "bytes_processed", "INT64", chunk_result.bytes_processed
+            ),
+            bigquery.ScalarQueryParameter("job_id", "STRING", chunk_result.job_id),
+        ]
+    )
+    bigquery_client.query(query, job_config=job_config).result()
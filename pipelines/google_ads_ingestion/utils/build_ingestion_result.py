@@ -0,0 +1,39 @@
+from typing import Optional
+from google.cloud import bigquery
+from enums.IngestionStatus import IngestionStatus
+from schemas.IngestionResult import IngestionResult
+
+
+def build_ingestion_result(
+    query_job: bigquery.QueryJob,
+    inserted_status: IngestionStatus,
+    empty_status: IngestionStatus,
+    rows_inserted: Optional[int] = None,
+) -> IngestionResult:
+    """
+    Builds an IngestionResult from the statistics of a completed insert job.
+
+    The number of inserted rows is taken from the job's `num_dml_affected_rows`, which
+    is reported only for the rows written by that job and therefore is not affected by
+    concurrent writers to the same table.
+
+    Args:
+        query_job (bigquery.QueryJob): The completed DML query job.
+        inserted_status (IngestionStatus): Status to report when rows were inserted.
+        empty_status (IngestionStatus): Status to report when no rows were inserted.
+        rows_inserted (int, optional): Inserted row count reported by the query itself, for
+            multi-statement scripts whose parent job carries no DML statistics.
+
+    Returns:
+        IngestionResult: The ingestion status together with the job statistics.
+    """
+    if rows_inserted is None:
+        rows_inserted = query_job.num_dml_affected_rows or 0
+
+    return IngestionResult(
+        status=inserted_status if rows_inserted > 0 else empty_status,
+        rows_inserted=rows_inserted,
+        bytes_processed=query_job.total_bytes_processed or 0,
+        slot_ms=query_job.slot_millis or 0,
+        job_id=query_job.job_id,
+    )
@@ -1,6 +1,10 @@
 from google.cloud import bigquery
 from typing import List
+from config import CREATIVE_STATS_STAGING_TABLE_ID
+from enums.QueryBudget import QueryBudget
+from utils.logging_config import logger
 from .query_builder import QueryBuilder
+from .run_guarded_query import run_guarded_query
 
 
 def check_data_availability(
@@ -12,14 +16,15 @@ def check_data_availability(
     end_date: str,
     advertiser_ids: List[str] = None,
     backfill: bool = False,
+    staging_table_id: str = CREATIVE_STATS_STAGING_TABLE_ID,
 ) -> bool:
     """
     Verifies if relevant ad data exists within the specified date range for targeted advertisers.
 
     This function checks if there is any available data for specific advertisers within a
-    specified date range in the Google Ads Transparency dataset. The search can be based on
-    advertiser IDs provided in the function call (`backfill=True`) or based on IDs present in
-    an advertiser tracking table.
+    specified date range in the staging snapshot of the Google Ads Transparency dataset.
+    The search can be based on advertiser IDs provided in the function call (`backfill=True`)
+    or based on IDs present in an advertiser tracking table.
 
     Args:
         bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
@@ -30,6 +35,7 @@ def check_data_availability(
         end_date (str): End date for the data range (YYYY-MM-DD format).
         advertiser_ids (List[str], optional): List of specific advertiser IDs for targeted data retrieval (used if backfill=True).
         backfill (bool): Flag indicating if specific advertiser IDs are used (True) or all advertiser IDs from the table (False).
+        staging_table_id (str): Table ID of the creative stats staging table.
 
     Returns:
         bool: True if relevant data is found within the specified range, otherwise False.
@@ -39,6 +45,7 @@ def check_data_availability(
         project_id=project_id,
         dataset_id=dataset_id,
         advertiser_ids_table=advertiser_ids_table,
+        staging_table_id=staging_table_id,
         backfill=backfill,
     )
 
@@ -52,5 +59,11 @@ def check_data_availability(
         )
 
     job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-    check_job = bigquery_client.query(query, job_config=job_config)
-    return check_job.result().total_rows > 0
+    budget = QueryBudget.BACKFILL if backfill else QueryBudget.DAILY
+    check_job = run_guarded_query(bigquery_client, query, budget, job_config)
+    data_available = check_job.result().total_rows > 0
+    logger.info(
+        f"Data availability check (job {check_job.job_id}) processed "
+        f"{check_job.total_bytes_processed} bytes."
+    )
+    return data_available
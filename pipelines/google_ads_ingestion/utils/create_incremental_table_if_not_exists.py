@@ -1,19 +1,74 @@
 from utils.logging_config import logger
 from google.cloud import bigquery
 from google.api_core.exceptions import NotFound
+from config import (
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    RAW_SCHEMA_TYPED,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+)
 from enums.IngestionStatus import IngestionStatus
+from queries import BACKFILL_RAW_DATA_HASH_QUERY
+from .get_raw_table_schema import RAW_DATA_HASH_FIELD, get_raw_table_schema
+
+
+def ensure_raw_data_hash_column(
+    bigquery_client: bigquery.Client, table: bigquery.Table
+) -> None:
+    """
+    Adds the `raw_data_hash` column to an existing table that was created before it was introduced.
+
+    The hash of the existing rows is filled in right away, since the deduplication MERGEs match
+    on it: with a NULL hash, every stored ad version would be inserted again.
+
+    Args:
+        bigquery_client (bigquery.Client): A BigQuery client instance.
+        table (bigquery.Table): The existing BigQuery table.
+    """
+    if any(field.name == RAW_DATA_HASH_FIELD.name for field in table.schema):
+        return
+
+    table.schema = [*table.schema, RAW_DATA_HASH_FIELD]
+    bigquery_client.update_table(table, ["schema"])
+    logger.info(
+        f"Added column '{RAW_DATA_HASH_FIELD.name}' to table '{table.table_id}'."
+    )
+
+    query_job = bigquery_client.query(
+        BACKFILL_RAW_DATA_HASH_QUERY.format(
+            project_id=table.project,
+            dataset_id=table.dataset_id,
+            table_id=table.table_id,
+        )
+    )
+    query_job.result()
+    logger.info(
+        f"Backfilled '{RAW_DATA_HASH_FIELD.name}' for {query_job.num_dml_affected_rows or 0} "
+        f"rows of table '{table.table_id}'."
+    )
 
 
 def create_incremental_table_if_not_exists(
-    bigquery_client: bigquery.Client, dataset_id: str, table_id: str
+    bigquery_client: bigquery.Client,
+    dataset_id: str,
+    table_id: str,
+    typed: bool = RAW_SCHEMA_TYPED,
+    keep_raw_data: bool = RAW_SCHEMA_KEEP_RAW_DATA,
+    staging_table_id: str = CREATIVE_STATS_STAGING_TABLE_ID,
 ) -> IngestionStatus:
     """
     Check if a BigQuery table exists, and if not, create a partitioned table on `data_modified`.
 
+    If the table already exists but lacks the `raw_data_hash` deduplication column, the column is added.
+    In typed mode the table is created with the ad payload stored as native columns, see
+    `get_raw_table_schema`.
+
     Args:
         bigquery_client (bigquery.Client): A BigQuery client instance.
         dataset_id (str): The BigQuery dataset ID.
         table_id (str): The BigQuery table ID.
+        typed (bool): Whether to create the table with typed payload columns.
+        keep_raw_data (bool): Whether a typed table keeps the `raw_data` JSON audit column.
+        staging_table_id (str): The creative stats staging table the typed column types are copied from.
 
     Returns:
         IngestionStatus: Status indicating if the table already exists, was created, or if an error occurred.
@@ -21,60 +76,24 @@ def create_incremental_table_if_not_exists(
 
     table_ref = bigquery_client.dataset(dataset_id).table(table_id)
     try:
-        bigquery_client.get_table(table_ref)
+        existing_table = bigquery_client.get_table(table_ref)
+        ensure_raw_data_hash_column(bigquery_client, existing_table)
         return IngestionStatus.TABLE_EXISTS
     except NotFound:
         logger.info(
             f"Table '{table_id}' does not exist in dataset '{dataset_id}'. Creating table..."
         )
 
-    schema = [
-        bigquery.SchemaField(
-            "data_modified",
-            "TIMESTAMP",
-            mode="REQUIRED",
-            description=(
-                "Timestamp indicating the exact moment when the ad data was last modified or updated. "
-                "This field is used for partitioning the table to optimize query performance and manage data lifecycle."
-            ),
-        ),
-        bigquery.SchemaField(
-            "metadata_time",
-            "TIMESTAMP",
-            mode="REQUIRED",
-            description=(
-                "Timestamp representing when the metadata for the ad record was recorded. "
-                "It serves as a reference for tracking the ingestion time of each record into the BigQuery table."
-            ),
-        ),
-        bigquery.SchemaField(
-            "advertiser_id",
-            "STRING",
-            mode="REQUIRED",
-            description=(
-                "Unique identifier assigned to each advertiser. "
-                "This ID is used to associate ads with their respective advertisers and facilitate aggregation and filtering based on advertiser entities."
-            ),
-        ),
-        bigquery.SchemaField(
-            "creative_id",
-            "STRING",
-            mode="REQUIRED",
-            description=(
-                "Unique identifier for each creative asset associated with an ad. "
-                "This ID distinguishes between different creative versions and is essential for tracking performance metrics at the creative level."
-            ),
-        ),
-        bigquery.SchemaField(
-            "raw_data",
-            "STRING",
-            mode="REQUIRED",
-            description=(
-                "JSON-formatted string containing the complete raw data of the ad. "
-                "This field encapsulates all relevant details and metadata related to the ad, providing a comprehensive snapshot for downstream analysis and auditing."
-            ),
-        ),
-    ]
+    try:
+        schema = get_raw_table_schema(
+            bigquery_client, dataset_id, staging_table_id, typed, keep_raw_data
+        )
+    except NotFound:
+        logger.error(
+            f"Staging table '{staging_table_id}' is required to create typed table '{table_id}'",
+            exc_info=True,
+        )
+        return IngestionStatus.TABLE_CREATION_FAILED
 
     table = bigquery.Table(table_ref, schema=schema)
     table.time_partitioning = bigquery.TimePartitioning(
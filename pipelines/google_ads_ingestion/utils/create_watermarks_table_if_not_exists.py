@@ -0,0 +1,52 @@
+from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
+from utils.logging_config import logger
+
+
+def create_watermarks_table_if_not_exists(
+    bigquery_client: bigquery.Client, dataset_id: str, watermarks_table_id: str
+) -> None:
+    """
+    Creates the table holding the per-advertiser `last_shown` watermarks if it does not exist yet.
+
+    Args:
+        bigquery_client (bigquery.Client): A BigQuery client instance.
+        dataset_id (str): The BigQuery dataset ID.
+        watermarks_table_id (str): The ID of the watermarks table.
+    """
+    table_ref = bigquery_client.dataset(dataset_id).table(watermarks_table_id)
+    try:
+        bigquery_client.get_table(table_ref)
+        return
+    except NotFound:
+        logger.info(
+            f"Table '{watermarks_table_id}' does not exist in dataset '{dataset_id}'. Creating table..."
+        )
+
+    schema = [
+        bigquery.SchemaField(
+            "advertiser_id",
+            "STRING",
+            mode="REQUIRED",
+            description="Advertiser the watermark belongs to.",
+        ),
+        bigquery.SchemaField(
+            "last_shown_watermark",
+            "DATE",
+            mode="REQUIRED",
+            description=(
+                "Latest SE `last_shown` date seen for the advertiser by a successful ALL ads update. "
+                "Creatives last shown before this date are not re-read by the next update."
+            ),
+        ),
+        bigquery.SchemaField(
+            "updated_at",
+            "TIMESTAMP",
+            mode="REQUIRED",
+            description="When the watermark was last advanced.",
+        ),
+    ]
+
+    table = bigquery.Table(table_ref, schema=schema)
+    table.clustering_fields = ["advertiser_id"]
+    bigquery_client.create_table(table, exists_ok=True)
@@ -0,0 +1,132 @@
+from typing import List
+from google.cloud import bigquery
+
+RAW_DATA_HASH_FIELD = bigquery.SchemaField(
+    "raw_data_hash",
+    "INT64",
+    mode="NULLABLE",
+    description=(
+        "FARM_FINGERPRINT of `raw_data`. "
+        "Used together with `advertiser_id` and `creative_id` as the deduplication key when merging new ad versions, "
+        "so that only a fixed-size hash is compared instead of the full JSON payload."
+    ),
+)
+
+RAW_TABLE_SCHEMA = [
+    bigquery.SchemaField(
+        "data_modified",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        description=(
+            "Timestamp indicating the exact moment when the ad data was last modified or updated. "
+            "This field is used for partitioning the table to optimize query performance and manage data lifecycle."
+        ),
+    ),
+    bigquery.SchemaField(
+        "metadata_time",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        description=(
+            "Timestamp representing when the metadata for the ad record was recorded. "
+            "It serves as a reference for tracking the ingestion time of each record into the BigQuery table."
+        ),
+    ),
+    bigquery.SchemaField(
+        "advertiser_id",
+        "STRING",
+        mode="REQUIRED",
+        description=(
+            "Unique identifier assigned to each advertiser. "
+            "This ID is used to associate ads with their respective advertisers and facilitate aggregation and filtering based on advertiser entities."
+        ),
+    ),
+    bigquery.SchemaField(
+        "creative_id",
+        "STRING",
+        mode="REQUIRED",
+        description=(
+            "Unique identifier for each creative asset associated with an ad. "
+            "This ID distinguishes between different creative versions and is essential for tracking performance metrics at the creative level."
+        ),
+    ),
+    bigquery.SchemaField(
+        "raw_data",
+        "STRING",
+        mode="REQUIRED",
+        description=(
+            "JSON-formatted string containing the complete raw data of the ad. "
+            "This field encapsulates all relevant details and metadata related to the ad, providing a comprehensive snapshot for downstream analysis and auditing."
+        ),
+    ),
+    RAW_DATA_HASH_FIELD,
+]
+
+RAW_DATA_AUDIT_FIELD = bigquery.SchemaField(
+    "raw_data",
+    "STRING",
+    mode="NULLABLE",
+    description=(
+        "JSON-formatted string containing the complete raw data of the ad, kept for auditing only. "
+        "The same data is stored in the typed payload columns, which should be used for analysis."
+    ),
+)
+
+
+# Ad fields that typed mode stores as native columns, with the types of the staging table.
+RAW_PAYLOAD_COLUMNS = [
+    "creative_page_url",
+    "ad_format_type",
+    "advertiser_disclosed_name",
+    "advertiser_legal_name",
+    "advertiser_location",
+    "advertiser_verification_status",
+    "topic",
+    "is_funded_by_google_ad_grants",
+    "region_stats",
+    "audience_selection_approach_info",
+]
+
+
+def get_raw_table_schema(
+    bigquery_client: bigquery.Client,
+    dataset_id: str,
+    staging_table_id: str,
+    typed: bool = False,
+    keep_raw_data: bool = True,
+) -> List[bigquery.SchemaField]:
+    """
+    Returns the schema of the raw ads table for the configured schema mode.
+
+    In the default mode the ad payload is stored only as the `raw_data` JSON string. In typed mode
+    the payload fields are stored as native columns, with their STRUCT/ARRAY types copied from the
+    creative stats staging table, and `raw_data` becomes an optional audit column that is left out
+    entirely unless `keep_raw_data` is set.
+
+    Args:
+        bigquery_client (bigquery.Client): A BigQuery client instance.
+        dataset_id (str): The BigQuery dataset ID.
+        staging_table_id (str): The ID of the creative stats staging table, read in typed mode only.
+        typed (bool): Whether to store the ad payload as native columns.
+        keep_raw_data (bool): Whether typed mode keeps the `raw_data` JSON column.
+
+    Returns:
+        List[bigquery.SchemaField]: The schema of the raw ads table.
+    """
+    if not typed:
+        return RAW_TABLE_SCHEMA
+
+    staging_table = bigquery_client.get_table(
+        bigquery_client.dataset(dataset_id).table(staging_table_id)
+    )
+    staging_fields = {field.name: field for field in staging_table.schema}
+
+    schema = [
+        field
+        for field in RAW_TABLE_SCHEMA
+        if field.name not in ("raw_data", RAW_DATA_HASH_FIELD.name)
+    ]
+    if keep_raw_data:
+        schema.append(RAW_DATA_AUDIT_FIELD)
+    schema.append(RAW_DATA_HASH_FIELD)
+    schema.extend(staging_fields[name] for name in RAW_PAYLOAD_COLUMNS)
+    return schema
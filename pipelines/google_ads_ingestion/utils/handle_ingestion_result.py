@@ -1,11 +1,15 @@
+from typing import Union
 from fastapi import HTTPException
 from utils.logging_config import logger
 from fastapi.responses import JSONResponse
 from enums.IngestionStatus import IngestionStatus
+from schemas.IngestionResult import IngestionResult
 
 
 def handle_ingestion_result(
-    result: IngestionStatus, process_name: str, is_backfill: bool = False
+    result: Union[IngestionStatus, IngestionResult],
+    process_name: str,
+    is_backfill: bool = False,
 ) -> JSONResponse:
     """
     Handles logging and raises HTTP exceptions based on the ingestion status.
@@ -14,8 +18,10 @@ def handle_ingestion_result(
     when necessary. It adapts its response based on whether the process is a backfill or a daily ingestion.
 
     - **Args**:
-        result (IngestionStatus): The status result of the ingestion or table creation operation.
-            Accepted values include:
+        result (Union[IngestionStatus, IngestionResult]): The status result of the ingestion or table
+            creation operation. When an IngestionResult is given, its job statistics (rows inserted,
+            bytes processed, slot-ms and job id) are included in the response body under `job`.
+            Accepted statuses include:
             - IngestionStatus.NO_DATA_AVAILABLE: No relevant data found for ingestion.
             - IngestionStatus.DATA_INSERTED: Data was successfully inserted.
             - IngestionStatus.INCOMPLETE_INSERTION: Insertion completed but no new rows were added.
@@ -23,6 +29,7 @@ def handle_ingestion_result(
             - IngestionStatus.TABLE_EXISTS: The specified table already exists.
             - IngestionStatus.TABLE_CREATED: A new table was successfully created.
             - IngestionStatus.TABLE_CREATION_FAILED: An error occurred while creating the table.
+            - IngestionStatus.STAGING_REFRESHED: The creative stats staging snapshot was rebuilt.
         process_name (str): A descriptive name for the process, such as "Daily Ingestion" or "Backfill Ingestion".
             This is used in log messages and exceptions for context.
         is_backfill (bool): Indicates whether the process is a backfill. This parameter affects how
@@ -41,6 +48,15 @@ def handle_ingestion_result(
 
     """
     try:
+        job_content = {}
+        if isinstance(result, IngestionResult):
+            job_content = {"job": result.to_content()}
+            logger.info(
+                f"{process_name}: job {result.job_id} inserted {result.rows_inserted} rows, "
+                f"processed {result.bytes_processed} bytes using {result.slot_ms} slot-ms."
+            )
+            result = result.status
+
         if result == IngestionStatus.NO_DATA_AVAILABLE:
             logger.info(f"{process_name}: No data available for ingestion.")
             return JSONResponse(status_code=204, content={"status": result.value})
@@ -48,16 +64,22 @@ def handle_ingestion_result(
         if result == IngestionStatus.DATA_INSERTED:
             logger.info(f"{process_name} completed successfully.")
             return JSONResponse(
-                status_code=200, content={"status": f"{process_name}: {result.value}."}
+                status_code=200,
+                content={"status": f"{process_name}: {result.value}.", **job_content},
             )
 
         if result == IngestionStatus.INCOMPLETE_INSERTION:
             logger.info(f"{process_name}:  {result.value}.")
             status_code = 200 if is_backfill else 206
             return JSONResponse(
-                status_code=status_code, content={"status": result.value}
+                status_code=status_code,
+                content={"status": result.value, **job_content},
             )
 
+        if result == IngestionStatus.NO_NEW_UPDATES:
+            logger.info(f"{process_name}: {result.value}")
+            return JSONResponse(status_code=204, content={"status": result.value})
+
         if result == IngestionStatus.TABLE_EXISTS:
             logger.info(f"{process_name}: Table already exists.")
             return JSONResponse(status_code=200, content={"status": result.value})
@@ -66,6 +88,12 @@ def handle_ingestion_result(
             logger.info(f"{process_name}: New table created successfully.")
             return JSONResponse(status_code=201, content={"status": result.value})
 
+        if result == IngestionStatus.STAGING_REFRESHED:
+            logger.info(f"{process_name}: {result.value}")
+            return JSONResponse(
+                status_code=200, content={"status": result.value, **job_content}
+            )
+
         if result == IngestionStatus.TABLE_CREATION_FAILED:
             logger.error(f"{process_name}: {result.value}")
             raise HTTPException(status_code=500, detail=result.value)
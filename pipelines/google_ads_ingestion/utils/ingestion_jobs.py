@@ -0,0 +1,127 @@
+import json
+from typing import Optional
+from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
+from utils.logging_config import logger
+from queries import INSERT_INGESTION_JOB_EVENT_QUERY, GET_INGESTION_JOB_QUERY
+from schemas.IngestionJob import IngestionJob
+
+
+def create_ingestion_jobs_table_if_not_exists(
+    bigquery_client: bigquery.Client, dataset_id: str, jobs_table_id: str
+) -> None:
+    """
+    Creates the table holding ingestion job records if it does not exist yet.
+
+    The table is append-only: every state change of a job adds a row, and the latest row per
+    `job_id` is the current state. Appending avoids conflicting concurrent UPDATE statements.
+
+    Args:
+        bigquery_client (bigquery.Client): A BigQuery client instance.
+        dataset_id (str): The BigQuery dataset ID.
+        jobs_table_id (str): The ID of the ingestion jobs table.
+    """
+    table_ref = bigquery_client.dataset(dataset_id).table(jobs_table_id)
+    try:
+        bigquery_client.get_table(table_ref)
+        return
+    except NotFound:
+        logger.info(
+            f"Table '{jobs_table_id}' does not exist in dataset '{dataset_id}'. Creating table..."
+        )
+
+    schema = [
+        bigquery.SchemaField("job_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("job_type", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("submitted_at", "TIMESTAMP", mode="REQUIRED"),
+        bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED"),
+        bigquery.SchemaField("status_code", "INT64"),
+        bigquery.SchemaField("result", "STRING"),
+        bigquery.SchemaField("error", "STRING"),
+    ]
+
+    table = bigquery.Table(table_ref, schema=schema)
+    table.time_partitioning = bigquery.TimePartitioning(
+        field="submitted_at", type_=bigquery.TimePartitioningType.DAY
+    )
+    table.clustering_fields = ["job_id"]
+    bigquery_client.create_table(table, exists_ok=True)
+
+
+def save_ingestion_job(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    jobs_table_id: str,
+    job: IngestionJob,
+) -> None:
+    """
+    Persists the current state of an ingestion job by appending it to the jobs table.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID.
+        jobs_table_id (str): The ID of the ingestion jobs table.
+        job (IngestionJob): The job record to persist.
+    """
+    query = INSERT_INGESTION_JOB_EVENT_QUERY.format(
+        project_id=project_id, dataset_id=dataset_id, jobs_table_id=jobs_table_id
+    )
+    result = json.dumps(job.result) if job.result is not None else None
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("job_id", "STRING", job.job_id),
+            bigquery.ScalarQueryParameter("job_type", "STRING", job.job_type),
+            bigquery.ScalarQueryParameter("status", "STRING", job.status.value),
+            bigquery.ScalarQueryParameter(
+                "submitted_at", "TIMESTAMP", job.submitted_at
+            ),
+            bigquery.ScalarQueryParameter("updated_at", "TIMESTAMP", job.updated_at),
+            bigquery.ScalarQueryParameter("status_code", "INT64", job.status_code),
+            bigquery.ScalarQueryParameter("result", "STRING", result),
+            bigquery.ScalarQueryParameter("error", "STRING", job.error),
+        ]
+    )
+    bigquery_client.query(query, job_config=job_config).result()
+
+
+def load_ingestion_job(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    jobs_table_id: str,
+    job_id: str,
+) -> Optional[IngestionJob]:
+    """
+    Loads the latest persisted state of an ingestion job.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID.
+        jobs_table_id (str): The ID of the ingestion jobs table.
+        job_id (str): The ID of the job to load.
+
+    Returns:
+        Optional[IngestionJob]: The job record, or None if no job with this ID exists.
+    """
+    query = GET_INGESTION_JOB_QUERY.format(
+        project_id=project_id, dataset_id=dataset_id, jobs_table_id=jobs_table_id
+    )
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("job_id", "STRING", job_id)]
+    )
+    try:
+        rows = list(bigquery_client.query(query, job_config=job_config).result())
+    except NotFound:
+        return None
+
+    if not rows:
+        return None
+
+    row = dict(rows[0])
+    if row["result"] is not None:
+        row["result"] = json.loads(row["result"])
+    return IngestionJob(**row)
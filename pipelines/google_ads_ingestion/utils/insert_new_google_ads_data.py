@@ -3,9 +3,17 @@ from datetime import datetime, timedelta, timezone
 from typing import List
 from .query_builder import QueryBuilder
 from .check_data_availability import check_data_availability
-from .check_table_row_count import check_table_row_count
+from .build_ingestion_result import build_ingestion_result
+from .run_guarded_query import run_guarded_query
 from enums.IngestionStatus import IngestionStatus
-from config import ADVERTISERS_TRACKING_TABLE_ID
+from enums.QueryBudget import QueryBudget
+from schemas.IngestionResult import IngestionResult
+from config import (
+    ADVERTISERS_TRACKING_TABLE_ID,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    RAW_SCHEMA_TYPED,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+)
 
 
 def insert_new_google_ads_data(
@@ -14,27 +22,33 @@ def insert_new_google_ads_data(
     dataset_id: str,
     table_id: str,
     advertiser_ids_table: str = ADVERTISERS_TRACKING_TABLE_ID,
+    staging_table_id: str = CREATIVE_STATS_STAGING_TABLE_ID,
     backfill: bool = False,
     start_date: str = None,
     end_date: str = None,
     advertiser_ids: List = None,
-) -> IngestionStatus:
+) -> IngestionResult:
     """
     Insert Google Ads Transparency data incrementally into BigQuery, avoiding duplicates.
 
     This function inserts data within the given date range (`start_date` to `end_date`)
-    while avoiding duplicates by ensuring that the combination of `advertiser_id`, `creative_id`,
-    and `data_modified` (first_shown) does not already exist.
+    using a MERGE that skips rows whose combination of `advertiser_id`, `creative_id`
+    and `raw_data_hash` already exists in the target table.
 
     Parameters:
     bigquery_client (bigquery.Client): BigQuery client instance.
     project_id (str): Google Cloud project ID.
     dataset_id (str): BigQuery dataset ID.
     table_id (str): BigQuery table ID.
+    staging_table_id (str): Creative stats staging table ID to read ads from.
     start_date (str): Start date for data fetching in 'YYYY-MM-DD' format.
     end_date (str): End date for data fetching in 'YYYY-MM-DD' format.
 
+    Returns:
+    IngestionResult: The insertion status along with the insert job's statistics.
+
     Raises:
+    HTTPException: If a dry run estimates more bytes than the daily or backfill byte budget.
     Exception: If the query execution or data insertion fails.
     """
 
@@ -54,21 +68,21 @@ def insert_new_google_ads_data(
         end_date,
         advertiser_ids,
         backfill,
+        staging_table_id,
     )
 
     if not data_available:
-        return IngestionStatus.NO_DATA_AVAILABLE
-
-    initial_row_count = check_table_row_count(
-        bigquery_client, project_id, dataset_id, table_id
-    )
+        return IngestionResult(status=IngestionStatus.NO_DATA_AVAILABLE)
 
     query = QueryBuilder.build_insert_new_google_ads_data_query(
         project_id=project_id,
         dataset_id=dataset_id,
         table_id=table_id,
         advertiser_ids_table=advertiser_ids_table,
+        staging_table_id=staging_table_id,
         backfill=backfill,
+        typed=RAW_SCHEMA_TYPED,
+        keep_raw_data=RAW_SCHEMA_KEEP_RAW_DATA,
     )
 
     query_params = [
@@ -83,14 +97,9 @@ def insert_new_google_ads_data(
 
     job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
-    query_job = bigquery_client.query(query, job_config=job_config)
-    query_job.result()
+    budget = QueryBudget.BACKFILL if backfill else QueryBudget.DAILY
+    query_job = run_guarded_query(bigquery_client, query, budget, job_config)
 
-    final_row_count = check_table_row_count(
-        bigquery_client, project_id, dataset_id, table_id
+    return build_ingestion_result(
+        query_job, IngestionStatus.DATA_INSERTED, IngestionStatus.INCOMPLETE_INSERTION
     )
-
-    if final_row_count > initial_row_count:
-        return IngestionStatus.DATA_INSERTED
-    else:
-        return IngestionStatus.INCOMPLETE_INSERTION
@@ -0,0 +1,85 @@
+import hashlib
+from datetime import date, timedelta
+from typing import List
+from schemas.BackfillChunk import BackfillChunk
+
+
+def get_backfill_id(
+    start_date: str, end_date: str, advertiser_ids: List[str], snapshot_version: str
+) -> str:
+    """
+    Derives a deterministic ID for a backfill request against a staging snapshot.
+
+    The same date range and set of advertisers map to the same ID as long as the staging snapshot
+    has not been rebuilt, so re-submitting a failed backfill picks up the checkpoints of the earlier
+    attempt. Once the snapshot is rebuilt, the same request gets a new ID and runs every chunk
+    again, so data the new snapshot added to the range is ingested.
+
+    Args:
+        start_date (str): Start date of the backfill in 'YYYY-MM-DD' format.
+        end_date (str): End date of the backfill in 'YYYY-MM-DD' format.
+        advertiser_ids (List[str]): Advertiser IDs of the backfill.
+        snapshot_version (str): Identifies the staging snapshot read, e.g. its modification time.
+
+    Returns:
+        str: The backfill ID.
+    """
+    key = "|".join(
+        [snapshot_version, start_date, end_date, *sorted(set(advertiser_ids))]
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def plan_backfill_chunks(
+    start_date: str,
+    end_date: str,
+    advertiser_ids: List[str],
+    window_days: int,
+    advertiser_batch_size: int,
+) -> List[BackfillChunk]:
+    """
+    Splits a backfill request into date-window x advertiser-batch chunks.
+
+    Args:
+        start_date (str): Start date of the backfill in 'YYYY-MM-DD' format.
+        end_date (str): End date of the backfill in 'YYYY-MM-DD' format.
+        advertiser_ids (List[str]): Advertiser IDs to backfill.
+        window_days (int): Maximum number of days covered by one chunk.
+        advertiser_batch_size (int): Maximum number of advertisers covered by one chunk.
+
+    Returns:
+        List[BackfillChunk]: The planned chunks, ordered by date window and advertiser batch.
+
+    Raises:
+        ValueError: If `start_date` is after `end_date` or a chunk size is not positive.
+    """
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    if start > end:
+        raise ValueError("start_date must not be after end_date.")
+    if window_days < 1 or advertiser_batch_size < 1:
+        raise ValueError("window_days and advertiser_batch_size must be positive.")
+
+    unique_advertiser_ids = sorted(set(advertiser_ids))
+    advertiser_batches = [
+        unique_advertiser_ids[i : i + advertiser_batch_size]
+        for i in range(0, len(unique_advertiser_ids), advertiser_batch_size)
+    ]
+
+    chunks = []
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + timedelta(days=window_days - 1), end)
+        for batch in advertiser_batches:
+            batch_key = hashlib.sha256("|".join(batch).encode("utf-8")).hexdigest()[:8]
+            chunks.append(
+                BackfillChunk(
+                    chunk_id=f"{window_start.isoformat()}_{window_end.isoformat()}_{batch_key}",
+                    start_date=window_start.isoformat(),
+                    end_date=window_end.isoformat(),
+                    advertiser_ids=batch,
+                )
+            )
+        window_start = window_end + timedelta(days=1)
+
+    return chunks
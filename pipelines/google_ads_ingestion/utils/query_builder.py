@@ -1,12 +1,25 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from google.cloud import bigquery
 from queries import (
     ADVERTISER_IDS_SUBQUERY,
     ADVERTISER_TRACKING_SUBQUERY,
+    REFRESH_CREATIVE_STATS_STAGING_QUERY,
     CHECK_DATA_AVAILABILITY_QUERY,
     INSERT_NEW_GOOGLE_ADS_DATA_QUERY,
+    DAILY_INGESTION_SCRIPT,
     ADD_UPDATED_ADS_QUERY,
     ADD_TARGETED_ADS_QUERY,
+    MIGRATE_TO_TYPED_SCHEMA_QUERY,
 )
+from .get_raw_table_schema import RAW_DATA_HASH_FIELD, RAW_PAYLOAD_COLUMNS
+
+# Standard SQL names of the legacy type names reported by the BigQuery API.
+STANDARD_SQL_TYPES = {
+    "INTEGER": "INT64",
+    "FLOAT": "FLOAT64",
+    "BOOLEAN": "BOOL",
+    "RECORD": "STRUCT",
+}
 
 
 class QueryBuilder:
@@ -30,13 +43,142 @@ class QueryBuilder:
             ADVERTISER_IDS_SUBQUERY
             if backfill
             else ADVERTISER_TRACKING_SUBQUERY.format(
-                project_id, dataset_id, advertiser_ids_table
+                project_id=project_id,
+                dataset_id=dataset_id,
+                advertiser_ids_table=advertiser_ids_table,
             )
         )
 
+    @staticmethod
+    def _get_id_filter(
+        column: str,
+        parameter_name: str,
+        project_id: str,
+        dataset_id: str,
+        ids_table: Optional[str] = None,
+    ) -> str:
+        """
+        Generates a filter restricting a column to a list of IDs.
+
+        Args:
+            column (str): The column of the creative stats table to filter on.
+            parameter_name (str): Name of the ARRAY<STRING> query parameter holding the IDs.
+            project_id (str): Google Cloud project ID.
+            dataset_id (str): BigQuery dataset ID.
+            ids_table (Optional[str]): Table with an `id` column holding the IDs; used instead
+                of the query parameter when the list is too large to be passed inline.
+
+        Returns:
+            str: SQL condition for the WHERE clause.
+        """
+        if ids_table:
+            return f"t.{column} IN (SELECT id FROM `{project_id}.{dataset_id}.{ids_table}`)"
+        return f"t.{column} IN UNNEST(@{parameter_name})"
+
+    @staticmethod
+    def _get_payload_placeholders(typed: bool, keep_raw_data: bool) -> Dict[str, str]:
+        """
+        Generates the column lists that differ between the JSON and the typed raw table schema.
+
+        Args:
+            typed (bool): Whether the raw table stores the ad payload as native columns.
+            keep_raw_data (bool): Whether a typed raw table keeps the `raw_data` JSON column.
+
+        Returns:
+            Dict[str, str]: The `payload_columns` selected from the staging table next to
+            `raw_data`, and the `insert_columns`/`insert_values` of the MERGE insert clause.
+        """
+        columns = ["data_modified", "metadata_time", "advertiser_id", "creative_id"]
+        if not typed or keep_raw_data:
+            columns.append("raw_data")
+        columns.append(RAW_DATA_HASH_FIELD.name)
+        if typed:
+            columns.extend(RAW_PAYLOAD_COLUMNS)
+
+        payload_columns = (
+            "".join(f",\n        t.{column}" for column in RAW_PAYLOAD_COLUMNS)
+            if typed
+            else ""
+        )
+        return {
+            "payload_columns": payload_columns,
+            "insert_columns": ", ".join(columns),
+            "insert_values": ", ".join(f"source.{column}" for column in columns),
+        }
+
+    @staticmethod
+    def _get_json_extraction(
+        field: bigquery.SchemaField, value_json: str, depth: int = 0
+    ) -> str:
+        """
+        Generates the expression that converts a JSON value back into the typed value of a field.
+
+        Args:
+            field (bigquery.SchemaField): The schema field the value is converted to.
+            value_json (str): SQL expression yielding the field's value as a JSON string.
+            depth (int): Nesting depth of repeated fields, used to keep UNNEST aliases unique.
+
+        Returns:
+            str: SQL expression of the field's type.
+        """
+        if field.mode == "REPEATED":
+            item, offset = f"item_{depth}", f"offset_{depth}"
+            # Arrays cannot hold NULL elements, so elements are converted as REQUIRED fields.
+            element = bigquery.SchemaField(
+                field.name, field.field_type, mode="REQUIRED", fields=field.fields
+            )
+            element_expression = QueryBuilder._get_json_extraction(
+                element, item, depth + 1
+            )
+            return (
+                f"ARRAY(SELECT {element_expression} "
+                f"FROM UNNEST(JSON_QUERY_ARRAY({value_json})) AS {item} WITH OFFSET AS {offset} "
+                f"ORDER BY {offset})"
+            )
+
+        field_type = STANDARD_SQL_TYPES.get(field.field_type, field.field_type)
+        if field_type == "STRUCT":
+            members = ", ".join(
+                QueryBuilder._get_json_extraction(
+                    member, f"JSON_QUERY({value_json}, '$.{member.name}')", depth
+                )
+                + f" AS {member.name}"
+                for member in field.fields
+            )
+            if field.mode == "REQUIRED":
+                return f"STRUCT({members})"
+            return f"IF({value_json} IS NULL, NULL, STRUCT({members}))"
+
+        return f"SAFE_CAST(JSON_VALUE({value_json}) AS {field_type})"
+
+    @staticmethod
+    def build_refresh_creative_stats_staging_query(
+        project_id: str, dataset_id: str, staging_table_id: str
+    ) -> str:
+        """
+        Constructs the query that snapshots the SE rows of the public creative_stats table.
+
+        Args:
+            project_id (str): Google Cloud project ID.
+            dataset_id (str): BigQuery dataset ID.
+            staging_table_id (str): Table ID of the partitioned creative stats staging table.
+
+        Returns:
+            str: SQL query for refreshing the creative stats staging table.
+        """
+        return REFRESH_CREATIVE_STATS_STAGING_QUERY.format(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            staging_table_id=staging_table_id,
+        )
+
     @staticmethod
     def build_check_data_availability_query(
-        project_id: str, dataset_id: str, advertiser_ids_table: str, backfill: bool
+        project_id: str,
+        dataset_id: str,
+        advertiser_ids_table: str,
+        staging_table_id: str,
+        backfill: bool,
     ) -> str:
         """
         Constructs the query to check data availability for selected advertiser IDs.
@@ -45,6 +187,7 @@ class QueryBuilder:
             project_id (str): Google Cloud project ID.
             dataset_id (str): BigQuery dataset ID.
             advertiser_ids_table (str): Table ID for advertiser tracking.
+            staging_table_id (str): Table ID of the creative stats staging table.
             backfill (bool): If True, select from provided advertiser IDs; if False, select from advertiser tracking table.
 
         Returns:
@@ -57,7 +200,10 @@ class QueryBuilder:
             advertiser_ids_table=advertiser_ids_table,
         )
         return CHECK_DATA_AVAILABILITY_QUERY.format(
-            advertiser_ids_subquery=advertiser_ids_subquery
+            project_id=project_id,
+            dataset_id=dataset_id,
+            staging_table_id=staging_table_id,
+            advertiser_ids_subquery=advertiser_ids_subquery,
         )
 
     @staticmethod
@@ -65,64 +211,109 @@ class QueryBuilder:
         project_id: str,
         dataset_id: str,
         raw_table_id: str,
-        advertiser_ids: Optional[List[str]] = None,
-        creative_ids: Optional[List[str]] = None,
+        staging_table_id: str,
+        filter_advertiser_ids: bool = False,
+        filter_creative_ids: bool = False,
+        advertiser_ids_table: Optional[str] = None,
+        creative_ids_table: Optional[str] = None,
+        typed: bool = False,
+        keep_raw_data: bool = True,
     ):
         """
         Constructs the query to add specific ad versions for targeted advertisers or creatives.
 
+        The IDs are never spliced into the SQL text. They are read from the `@advertiser_ids` and
+        `@creative_ids` ARRAY<STRING> query parameters, or from staged ID tables for lists too large
+        to pass as parameters, so the query text is identical for every request.
+
         Args:
             project_id (str): Google Cloud project ID.
             dataset_id (str): BigQuery dataset ID.
             raw_table_id (str): Target table ID in BigQuery for storing ad data.
-            advertiser_ids (Optional[List[str]]): List of specific advertiser IDs to update.
-            creative_ids (Optional[List[str]]): List of specific creative IDs to update.
+            staging_table_id (str): Table ID of the creative stats staging table.
+            filter_advertiser_ids (bool): Whether to select ads of specific advertisers.
+            filter_creative_ids (bool): Whether to select ads with specific creative IDs.
+            advertiser_ids_table (Optional[str]): Staged table holding the advertiser IDs.
+            creative_ids_table (Optional[str]): Staged table holding the creative IDs.
+            typed (bool): Whether the raw table stores the ad payload as native columns.
+            keep_raw_data (bool): Whether a typed raw table keeps the `raw_data` JSON column.
 
         Returns:
             str: SQL query for adding targeted ad versions.
         """
         conditions = []
-        if advertiser_ids:
-            advertiser_ids_str = ", ".join(
-                [f'"{advertiser_id}"' for advertiser_id in advertiser_ids]
+        if filter_advertiser_ids:
+            conditions.append(
+                QueryBuilder._get_id_filter(
+                    "advertiser_id",
+                    "advertiser_ids",
+                    project_id,
+                    dataset_id,
+                    advertiser_ids_table,
+                )
             )
-            conditions.append(f"t.advertiser_id IN ({advertiser_ids_str})")
 
-        if creative_ids:
-            creative_ids_str = ", ".join(
-                [f'"{creative_id}"' for creative_id in creative_ids]
+        if filter_creative_ids:
+            conditions.append(
+                QueryBuilder._get_id_filter(
+                    "creative_id",
+                    "creative_ids",
+                    project_id,
+                    dataset_id,
+                    creative_ids_table,
+                )
             )
-            conditions.append(f"t.creative_id IN ({creative_ids_str})")
 
         where_clause = " OR ".join(conditions)
         return ADD_TARGETED_ADS_QUERY.format(
             project_id=project_id,
             dataset_id=dataset_id,
             raw_table_id=raw_table_id,
+            staging_table_id=staging_table_id,
             where_clause=where_clause,
+            **QueryBuilder._get_payload_placeholders(typed, keep_raw_data),
         )
 
     @staticmethod
     def build_add_updated_ads_query(
-        project_id: str, dataset_id: str, raw_table_id: str, tracking_table_id: str
+        project_id: str,
+        dataset_id: str,
+        raw_table_id: str,
+        tracking_table_id: str,
+        staging_table_id: str,
+        watermarks_table_id: str,
+        typed: bool = False,
+        keep_raw_data: bool = True,
     ):
         """
-        Constructs the query to add updated ads for all advertisers in the tracking table.
+        Constructs the script to add updated ads for all advertisers in the tracking table.
+
+        The script only reads creatives shown on or after each advertiser's `last_shown` watermark,
+        minus the lookback given by the `lookback_days` INT64 query parameter, and advances the
+        watermarks in the same transaction as the insert. Its final statement returns the number
+        of inserted rows as `rows_inserted`.
 
         Args:
             project_id (str): Google Cloud project ID.
             dataset_id (str): BigQuery dataset ID.
             raw_table_id (str): Target table ID in BigQuery for storing ad data.
             tracking_table_id (str): Table ID for advertiser tracking.
+            staging_table_id (str): Table ID of the creative stats staging table.
+            watermarks_table_id (str): Table ID of the per-advertiser watermarks.
+            typed (bool): Whether the raw table stores the ad payload as native columns.
+            keep_raw_data (bool): Whether a typed raw table keeps the `raw_data` JSON column.
 
         Returns:
-            str: SQL query for adding updated ads.
+            str: SQL script for adding updated ads.
         """
         return ADD_UPDATED_ADS_QUERY.format(
             project_id=project_id,
             dataset_id=dataset_id,
             raw_table_id=raw_table_id,
-            ADVERTISERS_TRACKING_TABLE_ID=tracking_table_id,
+            staging_table_id=staging_table_id,
+            watermarks_table_id=watermarks_table_id,
+            advertisers_tracking_table_id=tracking_table_id,
+            **QueryBuilder._get_payload_placeholders(typed, keep_raw_data),
         )
 
     @staticmethod
@@ -131,7 +322,10 @@ class QueryBuilder:
         dataset_id: str,
         table_id: str,
         advertiser_ids_table: str,
+        staging_table_id: str,
         backfill: bool,
+        typed: bool = False,
+        keep_raw_data: bool = True,
     ):
         """
         Constructs the query for inserting new Google Ads data.
@@ -141,7 +335,10 @@ class QueryBuilder:
             dataset_id (str): BigQuery dataset ID.
             table_id (str): Target table ID in BigQuery for storing ad data.
             advertiser_ids_table (str): Table ID for advertiser tracking.
+            staging_table_id (str): Table ID of the creative stats staging table.
             backfill (bool): If True, select from provided advertiser IDs; if False, select from advertiser tracking table.
+            typed (bool): Whether the raw table stores the ad payload as native columns.
+            keep_raw_data (bool): Whether a typed raw table keeps the `raw_data` JSON column.
 
         Returns:
             str: SQL query for inserting new Google Ads data.
@@ -157,5 +354,109 @@ class QueryBuilder:
             project_id=project_id,
             dataset_id=dataset_id,
             table_id=table_id,
+            staging_table_id=staging_table_id,
             selected_advertisers_query=selected_advertisers_query,
+            **QueryBuilder._get_payload_placeholders(typed, keep_raw_data),
+        )
+
+    @staticmethod
+    def build_daily_ingestion_script(
+        project_id: str,
+        dataset_id: str,
+        table_id: str,
+        advertiser_ids_table: str,
+        staging_table_id: str,
+        typed: bool = False,
+        keep_raw_data: bool = True,
+    ) -> str:
+        """
+        Constructs the multi-statement script that performs the whole daily ingestion as one job.
+
+        The script checks data availability and runs the insert in a transaction only when data
+        is available. Its final statement returns the resulting `status` as the name of an
+        IngestionStatus member, together with `rows_inserted`. The raw table must already exist
+        with its `raw_data_hash` column, see `create_incremental_table_if_not_exists`, since the
+        script's dry run resolves every table it references.
+
+        Args:
+            project_id (str): Google Cloud project ID.
+            dataset_id (str): BigQuery dataset ID.
+            table_id (str): Target table ID in BigQuery for storing ad data.
+            advertiser_ids_table (str): Table ID for advertiser tracking.
+            staging_table_id (str): Table ID of the creative stats staging table.
+            typed (bool): Whether the raw table stores the ad payload as native columns.
+            keep_raw_data (bool): Whether a typed raw table keeps the `raw_data` JSON column.
+
+        Returns:
+            str: SQL script for the daily ingestion.
+        """
+        check_data_availability_query = (
+            QueryBuilder.build_check_data_availability_query(
+                project_id=project_id,
+                dataset_id=dataset_id,
+                advertiser_ids_table=advertiser_ids_table,
+                staging_table_id=staging_table_id,
+                backfill=False,
+            )
+        )
+        insert_query = QueryBuilder.build_insert_new_google_ads_data_query(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            table_id=table_id,
+            advertiser_ids_table=advertiser_ids_table,
+            staging_table_id=staging_table_id,
+            backfill=False,
+            typed=typed,
+            keep_raw_data=keep_raw_data,
+        )
+
+        return DAILY_INGESTION_SCRIPT.format(
+            check_data_availability_query=check_data_availability_query.strip(),
+            insert_query=insert_query.strip(),
+        )
+
+    @staticmethod
+    def build_migrate_to_typed_schema_query(
+        project_id: str,
+        dataset_id: str,
+        source_table_id: str,
+        target_table_id: str,
+        payload_schema: List[bigquery.SchemaField],
+        keep_raw_data: bool = True,
+    ) -> str:
+        """
+        Constructs the query that copies a JSON raw table into a typed raw table.
+
+        The typed payload columns are extracted from `raw_data` with JSON functions generated from
+        their schema, and rows without a `raw_data_hash` get one on the way.
+
+        Args:
+            project_id (str): Google Cloud project ID.
+            dataset_id (str): BigQuery dataset ID.
+            source_table_id (str): Table ID of the raw table storing the payload as JSON.
+            target_table_id (str): Table ID of the typed raw table to populate.
+            payload_schema (List[bigquery.SchemaField]): Schema of the typed payload columns.
+            keep_raw_data (bool): Whether to copy `raw_data` into the audit column.
+
+        Returns:
+            str: SQL query for populating the typed raw table.
+        """
+        payload_extractions = ",\n".join(
+            "    "
+            + QueryBuilder._get_json_extraction(
+                field, f"JSON_QUERY(source.raw_data, '$.{field.name}')"
+            )
+            + f" AS {field.name}"
+            for field in payload_schema
+        )
+        return MIGRATE_TO_TYPED_SCHEMA_QUERY.format(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            source_table_id=source_table_id,
+            target_table_id=target_table_id,
+            insert_columns=QueryBuilder._get_payload_placeholders(True, keep_raw_data)[
+                "insert_columns"
+            ],
+            raw_data_column="\n    source.raw_data," if keep_raw_data else "",
+            payload_extractions=payload_extractions,
         )
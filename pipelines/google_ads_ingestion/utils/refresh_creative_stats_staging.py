@@ -0,0 +1,57 @@
+from google.cloud import bigquery
+from utils.logging_config import logger
+from enums.IngestionStatus import IngestionStatus
+from enums.QueryBudget import QueryBudget
+from schemas.IngestionResult import IngestionResult
+from .query_builder import QueryBuilder
+from .run_guarded_query import run_guarded_query
+
+
+def refresh_creative_stats_staging(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    staging_table_id: str,
+) -> IngestionResult:
+    """
+    Rebuilds the local snapshot of SE ads from the public Transparency Center creative_stats table.
+
+    The snapshot keeps only ads from SE advertisers that were shown in SE, with the SE region
+    stats pre-filtered and the SE `first_shown`/`last_shown` dates extracted into the DATE
+    columns `se_first_shown` and `se_last_shown`. The table is partitioned on `se_last_shown`
+    and clustered on `advertiser_id`, so the ingestion queries can prune instead of paying a
+    full scan of the public table on every run. Only this job scans the public table.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID where the staging table is stored.
+        staging_table_id (str): Table ID of the creative stats staging table.
+
+    Returns:
+        IngestionResult: STAGING_REFRESHED with the snapshot row count and job statistics.
+    """
+    query = QueryBuilder.build_refresh_creative_stats_staging_query(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        staging_table_id=staging_table_id,
+    )
+
+    query_job = run_guarded_query(bigquery_client, query, QueryBudget.STAGING_SNAPSHOT)
+
+    staging_table = bigquery_client.get_table(
+        bigquery_client.dataset(dataset_id).table(staging_table_id)
+    )
+
+    logger.info(
+        f"Staging snapshot '{staging_table_id}' refreshed with {staging_table.num_rows} rows, "
+        f"{query_job.total_bytes_processed} bytes processed."
+    )
+
+    return IngestionResult(
+        status=IngestionStatus.STAGING_REFRESHED,
+        rows_inserted=staging_table.num_rows or 0,
+        bytes_processed=query_job.total_bytes_processed or 0,
+        slot_ms=query_job.slot_millis or 0,
+        job_id=query_job.job_id,
+    )
@@ -0,0 +1,102 @@
+from google.cloud import bigquery
+from datetime import datetime, timedelta, timezone
+from config import (
+    ADVERTISERS_TRACKING_TABLE_ID,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+    RAW_SCHEMA_TYPED,
+    RAW_SCHEMA_KEEP_RAW_DATA,
+)
+from enums.IngestionStatus import IngestionStatus
+from enums.QueryBudget import QueryBudget
+from schemas.IngestionResult import IngestionResult
+from utils.logging_config import logger
+from .query_builder import QueryBuilder
+from .build_ingestion_result import build_ingestion_result
+from .create_incremental_table_if_not_exists import (
+    create_incremental_table_if_not_exists,
+)
+from .run_guarded_query import run_guarded_query
+
+
+def run_daily_ingestion_script(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    advertiser_ids_table: str = ADVERTISERS_TRACKING_TABLE_ID,
+    staging_table_id: str = CREATIVE_STATS_STAGING_TABLE_ID,
+) -> IngestionResult:
+    """
+    Runs the daily ingestion for the previous day as a single BigQuery multi-statement script.
+
+    The data availability check and the insert are compiled into one script, so the daily run
+    costs a single job submission instead of one round-trip per step. The insert runs in a
+    transaction and is skipped inside the script when no data is available. The raw table is
+    created, or given its `raw_data_hash` column, beforehand: the script is dry-run against the
+    daily byte budget first, and a dry run fails on a table or column that does not exist yet.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID.
+        table_id (str): BigQuery table ID of the raw table.
+        advertiser_ids_table (str): Table ID for tracking advertiser IDs.
+        staging_table_id (str): Creative stats staging table ID to read ads from.
+
+    Returns:
+        IngestionResult: The status returned by the script along with the job's statistics:
+            - NO_DATA_AVAILABLE: No ads of tracked advertisers were shown on the previous day.
+            - DATA_INSERTED: New rows were added to the raw table.
+            - INCOMPLETE_INSERTION: Data was available, but all rows already existed.
+            - TABLE_CREATION_FAILED: The raw table did not exist and could not be created.
+
+    Raises:
+        HTTPException: If a dry run estimates more bytes than the daily byte budget.
+    """
+    target_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    table_status = create_incremental_table_if_not_exists(
+        bigquery_client,
+        dataset_id,
+        table_id,
+        RAW_SCHEMA_TYPED,
+        RAW_SCHEMA_KEEP_RAW_DATA,
+        staging_table_id,
+    )
+    if table_status == IngestionStatus.TABLE_CREATION_FAILED:
+        return IngestionResult(status=table_status)
+
+    script = QueryBuilder.build_daily_ingestion_script(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_id,
+        advertiser_ids_table=advertiser_ids_table,
+        staging_table_id=staging_table_id,
+        typed=RAW_SCHEMA_TYPED,
+        keep_raw_data=RAW_SCHEMA_KEEP_RAW_DATA,
+    )
+
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("start_date", "DATE", target_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", target_date),
+        ]
+    )
+
+    query_job = run_guarded_query(
+        bigquery_client, script, QueryBudget.DAILY, job_config
+    )
+    summary = next(iter(query_job.result()))
+    logger.info(
+        f"Daily ingestion script (job {query_job.job_id}) for {target_date} finished "
+        f"with status {summary.status}."
+    )
+
+    result = build_ingestion_result(
+        query_job,
+        IngestionStatus.DATA_INSERTED,
+        IngestionStatus.INCOMPLETE_INSERTION,
+        rows_inserted=summary.rows_inserted,
+    )
+    result.status = IngestionStatus[summary.status]
+    return result
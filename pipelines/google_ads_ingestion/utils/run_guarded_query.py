@@ -0,0 +1,69 @@
+from typing import Optional
+from fastapi import HTTPException
+from google.cloud import bigquery
+from config import BYTE_BUDGETS
+from enums.QueryBudget import QueryBudget
+from utils.logging_config import logger
+
+
+def run_guarded_query(
+    bigquery_client: bigquery.Client,
+    query: str,
+    budget: QueryBudget,
+    job_config: Optional[bigquery.QueryJobConfig] = None,
+) -> bigquery.QueryJob:
+    """
+    Executes a query only after a dry run shows that it fits within the endpoint's byte budget.
+
+    The query is first submitted as a dry run to obtain `total_bytes_processed`. If the estimate
+    exceeds the budget configured for the endpoint in `config.yml`, the query is refused without
+    being executed. Otherwise it is run with `maximum_bytes_billed` set to the budget, so BigQuery
+    itself fails the job should the estimate turn out to be too low.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        query (str): The SQL query to execute.
+        budget (QueryBudget): The endpoint whose byte budget applies to this query.
+        job_config (bigquery.QueryJobConfig, optional): Job configuration, e.g. query parameters.
+
+    Returns:
+        bigquery.QueryJob: The completed query job.
+
+    Raises:
+        HTTPException: HTTP 400 if the estimated bytes exceed the endpoint's byte budget.
+    """
+    job_config = job_config or bigquery.QueryJobConfig()
+    max_bytes = BYTE_BUDGETS.get(budget.value)
+
+    dry_run_config = bigquery.QueryJobConfig(
+        query_parameters=job_config.query_parameters,
+        dry_run=True,
+        use_query_cache=False,
+    )
+    dry_run_job = bigquery_client.query(query, job_config=dry_run_config)
+    estimated_bytes = dry_run_job.total_bytes_processed or 0
+
+    logger.info(
+        f"Dry run for '{budget.value}' query estimates {estimated_bytes} bytes "
+        f"(budget: {max_bytes if max_bytes is not None else 'unlimited'})."
+    )
+
+    if max_bytes is not None and estimated_bytes > max_bytes:
+        logger.error(
+            f"Refusing '{budget.value}' query: estimated {estimated_bytes} bytes exceeds "
+            f"the budget of {max_bytes} bytes."
+        )
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Query would process {estimated_bytes} bytes, which exceeds the "
+                f"'{budget.value}' budget of {max_bytes} bytes. Narrow the request."
+            ),
+        )
+
+    if max_bytes is not None:
+        job_config.maximum_bytes_billed = max_bytes
+
+    query_job = bigquery_client.query(query, job_config=job_config)
+    query_job.result()
+    return query_job
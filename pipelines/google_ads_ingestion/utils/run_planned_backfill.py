@@ -0,0 +1,225 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
+from google.cloud import bigquery
+from fastapi import HTTPException
+from config import (
+    BACKFILL_STATE_TABLE_ID,
+    BACKFILL_WINDOW_DAYS,
+    BACKFILL_ADVERTISER_BATCH_SIZE,
+    BACKFILL_MAX_IN_FLIGHT_JOBS,
+    CREATIVE_STATS_STAGING_TABLE_ID,
+)
+from enums.IngestionStatus import IngestionStatus
+from schemas.BackfillChunk import BackfillChunk
+from schemas.BackfillChunkResult import BackfillChunkResult
+from schemas.IngestionResult import IngestionResult
+from utils.logging_config import logger
+from .backfill_checkpoints import (
+    create_backfill_state_table_if_not_exists,
+    get_completed_backfill_chunks,
+    record_backfill_checkpoint,
+)
+from .insert_new_google_ads_data import insert_new_google_ads_data
+from .plan_backfill_chunks import get_backfill_id, plan_backfill_chunks
+
+
+def _run_chunk(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    backfill_id: str,
+    chunk: BackfillChunk,
+) -> BackfillChunkResult:
+    """
+    Ingests a single backfill chunk and checkpoints it once it has completed.
+    """
+    result = insert_new_google_ads_data(
+        bigquery_client=bigquery_client,
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_id,
+        backfill=True,
+        start_date=chunk.start_date,
+        end_date=chunk.end_date,
+        advertiser_ids=chunk.advertiser_ids,
+    )
+
+    chunk_result = BackfillChunkResult(
+        chunk_id=chunk.chunk_id,
+        start_date=chunk.start_date,
+        end_date=chunk.end_date,
+        advertiser_count=len(chunk.advertiser_ids),
+        status=result.status.name,
+        rows_inserted=result.rows_inserted,
+        bytes_processed=result.bytes_processed,
+        job_id=result.job_id,
+    )
+
+    record_backfill_checkpoint(
+        bigquery_client,
+        project_id,
+        dataset_id,
+        BACKFILL_STATE_TABLE_ID,
+        backfill_id,
+        chunk,
+        chunk_result,
+    )
+    return chunk_result
+
+
+def run_planned_backfill(
+    bigquery_client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    start_date: str,
+    end_date: str,
+    advertiser_ids: List[str],
+) -> IngestionResult:
+    """
+    Runs a backfill as date-window x advertiser-batch chunks with a bounded number of jobs in flight.
+
+    The request is split by `plan_backfill_chunks` using the `backfill` settings in `config.yml`.
+    Chunks are ingested concurrently with at most `max_in_flight_jobs` chunks running at a time.
+    Each completed chunk is checkpointed in the backfill state table, and chunks already
+    checkpointed for the same request are skipped, so re-submitting a failed backfill resumes
+    where it stopped instead of restarting from zero. Checkpoints only apply to the staging
+    snapshot they were recorded against: after the daily snapshot refresh, the same request runs
+    every chunk again, see `get_backfill_id`.
+
+    Args:
+        bigquery_client (bigquery.Client): BigQuery client instance for executing queries.
+        project_id (str): Google Cloud project ID.
+        dataset_id (str): BigQuery dataset ID.
+        table_id (str): The ID of the raw table to insert into.
+        start_date (str): Start date of the backfill in 'YYYY-MM-DD' format.
+        end_date (str): End date of the backfill in 'YYYY-MM-DD' format.
+        advertiser_ids (List[str]): Advertiser IDs to backfill.
+
+    Returns:
+        IngestionResult: Totals across all chunks together with the progress of each chunk:
+            - DATA_INSERTED: At least one chunk inserted new rows.
+            - INCOMPLETE_INSERTION: Data was available, but all of it already existed
+              or was inserted by an earlier attempt of the same backfill.
+            - NO_DATA_AVAILABLE: No chunk found data to ingest.
+
+    Raises:
+        HTTPException: HTTP 400 if the date range is invalid, HTTP 500 if any chunk failed.
+    """
+    try:
+        chunks = plan_backfill_chunks(
+            start_date,
+            end_date,
+            advertiser_ids,
+            BACKFILL_WINDOW_DAYS,
+            BACKFILL_ADVERTISER_BATCH_SIZE,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    staging_table = bigquery_client.get_table(
+        bigquery_client.dataset(dataset_id).table(CREATIVE_STATS_STAGING_TABLE_ID)
+    )
+    backfill_id = get_backfill_id(
+        start_date, end_date, advertiser_ids, staging_table.modified.isoformat()
+    )
+
+    create_backfill_state_table_if_not_exists(
+        bigquery_client, dataset_id, BACKFILL_STATE_TABLE_ID
+    )
+    completed_chunk_ids = get_completed_backfill_chunks(
+        bigquery_client, project_id, dataset_id, BACKFILL_STATE_TABLE_ID, backfill_id
+    )
+
+    chunk_results = []
+    pending_chunks = []
+    for chunk in chunks:
+        if chunk.chunk_id in completed_chunk_ids:
+            chunk_results.append(
+                BackfillChunkResult(
+                    chunk_id=chunk.chunk_id,
+                    start_date=chunk.start_date,
+                    end_date=chunk.end_date,
+                    advertiser_count=len(chunk.advertiser_ids),
+                    status="RESUMED",
+                )
+            )
+        else:
+            pending_chunks.append(chunk)
+
+    logger.info(
+        f"Backfill {backfill_id}: {len(chunks)} chunks planned, "
+        f"{len(chunks) - len(pending_chunks)} already completed, "
+        f"running {len(pending_chunks)} with up to {BACKFILL_MAX_IN_FLIGHT_JOBS} in flight."
+    )
+
+    failed_chunk_ids = []
+    with ThreadPoolExecutor(max_workers=BACKFILL_MAX_IN_FLIGHT_JOBS) as executor:
+        futures = {
+            executor.submit(
+                _run_chunk,
+                bigquery_client,
+                project_id,
+                dataset_id,
+                table_id,
+                backfill_id,
+                chunk,
+            ): chunk
+            for chunk in pending_chunks
+        }
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                chunk_result = future.result()
+            except Exception:
+                logger.error(
+                    f"Backfill {backfill_id}: chunk {chunk.chunk_id} failed",
+                    exc_info=True,
+                )
+                failed_chunk_ids.append(chunk.chunk_id)
+                chunk_result = BackfillChunkResult(
+                    chunk_id=chunk.chunk_id,
+                    start_date=chunk.start_date,
+                    end_date=chunk.end_date,
+                    advertiser_count=len(chunk.advertiser_ids),
+                    status="FAILED",
+                )
+
+            chunk_results.append(chunk_result)
+            logger.info(
+                f"Backfill {backfill_id}: {len(chunk_results)}/{len(chunks)} chunks done "
+                f"(chunk {chunk_result.chunk_id}: {chunk_result.status}, "
+                f"{chunk_result.rows_inserted} rows)."
+            )
+
+    if failed_chunk_ids:
+        raise HTTPException(
+            status_code=500,
+            detail=(
+                f"Backfill {backfill_id}: {len(failed_chunk_ids)} of {len(chunks)} chunks "
+                "failed. Re-submit the same request to resume from the last checkpoint."
+            ),
+        )
+
+    chunk_results.sort(key=lambda chunk_result: chunk_result.chunk_id)
+    rows_inserted = sum(chunk_result.rows_inserted for chunk_result in chunk_results)
+
+    if rows_inserted > 0:
+        status = IngestionStatus.DATA_INSERTED
+    elif any(
+        chunk_result.status in (IngestionStatus.INCOMPLETE_INSERTION.name, "RESUMED")
+        for chunk_result in chunk_results
+    ):
+        status = IngestionStatus.INCOMPLETE_INSERTION
+    else:
+        status = IngestionStatus.NO_DATA_AVAILABLE
+
+    return IngestionResult(
+        status=status,
+        rows_inserted=rows_inserted,
+        bytes_processed=sum(
+            chunk_result.bytes_processed for chunk_result in chunk_results
+        ),
+        chunks=chunk_results,
+    )
@@ -0,0 +1,47 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+from google.cloud import bigquery
+from utils.logging_config import logger
+
+TEMP_TABLE_EXPIRATION = timedelta(hours=1)
+
+
+def stage_ids_in_temp_table(
+    bigquery_client: bigquery.Client, dataset_id: str, ids: List[str], prefix: str
+) -> str:
+    """
+    Loads a list of IDs into a short-lived single-column table.
+
+    Very large ID lists cannot be passed as query parameters without hitting BigQuery's
+    request size limits, so they are written with a load job instead and joined from the
+    query. The table expires automatically after one hour in case it is not deleted.
+
+    Args:
+        bigquery_client (bigquery.Client): A BigQuery client instance.
+        dataset_id (str): The BigQuery dataset ID in which to create the table.
+        ids (List[str]): The IDs to stage.
+        prefix (str): Prefix for the generated table name, e.g. "tmp_advertiser_ids".
+
+    Returns:
+        str: The ID of the created table. Its single STRING column is named `id`.
+    """
+    table_id = f"{prefix}_{uuid.uuid4().hex}"
+    table_ref = bigquery_client.dataset(dataset_id).table(table_id)
+
+    table = bigquery.Table(
+        table_ref, schema=[bigquery.SchemaField("id", "STRING", mode="REQUIRED")]
+    )
+    table.expires = datetime.now(timezone.utc) + TEMP_TABLE_EXPIRATION
+    bigquery_client.create_table(table)
+
+    load_config = bigquery.LoadJobConfig(
+        schema=table.schema,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+    )
+    bigquery_client.load_table_from_json(
+        [{"id": value} for value in ids], table_ref, job_config=load_config
+    ).result()
+
+    logger.info(f"Staged {len(ids)} IDs in temporary table '{table_id}'.")
+    return table_id
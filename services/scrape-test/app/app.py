@@ -3,7 +3,12 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from routes import router
+from bigquery_utils import create_batch_writer
+from scrape_cache import create_scrape_cache
+from job_store import create_job_store
+from scraper import resume_incomplete_jobs
 from logging_config import logger
+import global_vars
 
 
 @asynccontextmanager
@@ -16,9 +21,16 @@ async def lifespan(app: FastAPI):
     """
     # Startup code
     logger.info("Application startup")
+    global_vars.bq_writer = create_batch_writer()
+    await global_vars.bq_writer.start()
+    global_vars.scrape_cache = create_scrape_cache()
+    global_vars.job_store = create_job_store()
+    resume_incomplete_jobs()
     yield
     # Shutdown code
     logger.info("Application shutdown")
+    await global_vars.bq_writer.close()
+    global_vars.job_store.close()
 
 
 app = FastAPI(title="YouTube Scraper API", lifespan=lifespan)
@@ -1,67 +1,717 @@
 # bigquery_utils.py
 
-from google.cloud import bigquery
-from models import BigQueryRow
+import asyncio
+import threading
+import time
+import uuid
+from collections import defaultdict
+from google.api_core.exceptions import AlreadyExists, GoogleAPIError
+from google.cloud import bigquery, bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import exceptions, types, writer
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from models import BigQueryRow, JobSource
 from config_loader import config
-from queries import GET_ROWS_QUERY
+from queries import GET_ROWS_QUERY, GET_RESOLVED_URLS_QUERY, GET_TIMEOUT_ROWS_QUERY
 from utils import normalize_row_keys
 from logging_config import logger
-from typing import List, Dict, Any
+from metrics import BIGQUERY_WRITE_SECONDS
+from typing import Iterator, List, Dict, Any, Optional, Set, Tuple, Type, Union
 
+_client: Optional[bigquery.Client] = None
 
-def get_rows_from_bq(advertiser_id: str) -> List[Dict[str, Any]]:
+
+def get_bigquery_client() -> bigquery.Client:
+    """
+    Return the BigQuery client shared by the whole application.
+
+    The client is created on first use and reused afterwards, so its HTTP session and
+    credentials are not set up again for every query or insert.
+
+    Returns:
+        bigquery.Client: The shared BigQuery client.
     """
-    Retrieve rows from BigQuery for a given advertiser ID.
+    global _client
+    if _client is None:
+        _client = bigquery.Client(project=config["bigquery"]["project_id"])
+    return _client
+
+
+def get_row_pages_from_bq(
+    advertiser_ids: List[str],
+    shard_index: int = 0,
+    shard_count: int = 1,
+    source: JobSource = JobSource.CREATIVES,
+) -> Tuple[int, Iterator[List[Dict[str, Any]]]]:
+    """
+    Run the rows query for the given advertiser IDs and return its results as a stream of pages.
+
+    Only the query itself runs before this function returns. Each page of
+    `bigquery.read_page_size` rows is downloaded when the returned iterator is advanced, so the
+    full result is never held in memory.
 
     Args:
-        advertiser_id (str): The advertiser ID to query.
+        advertiser_ids (List[str]): The advertiser IDs to query, in a single query.
+        shard_index (int): Index of the shard of the advertisers' rows to return.
+        shard_count (int): Number of shards the advertisers' rows are split into.
+        source (JobSource): Whether to read the creatives to scrape, or the unresolved rows of
+            the timeouts table. With the timeouts table, an empty `advertiser_ids` reads the
+            rows of every advertiser.
 
     Returns:
-        List[Dict[str, Any]]: A list of rows matching the advertiser ID.
+        Tuple[int, Iterator[List[Dict[str, Any]]]]: The number of rows in the shard, and an
+        iterator over pages of rows.
     """
-    client = bigquery.Client(project=config["bigquery"]["project_id"])
+    client = get_bigquery_client()
 
-    query = GET_ROWS_QUERY.format(
-        table=config["bigquery"]["tables"]["test_consumption"]
-    )
+    tables = config["bigquery"]["tables"]
+    if source == JobSource.TIMEOUTS:
+        query = GET_TIMEOUT_ROWS_QUERY.format(
+            table=tables["timeouts"], youtube_links_table=tables["youtube_links"]
+        )
+    else:
+        query = GET_ROWS_QUERY.format(table=tables["test_consumption"])
 
     job_config = bigquery.QueryJobConfig(
         query_parameters=[
-            bigquery.ScalarQueryParameter("advertiser_id", "STRING", advertiser_id)
+            bigquery.ArrayQueryParameter("advertiser_ids", "STRING", advertiser_ids),
+            bigquery.ScalarQueryParameter("shard_index", "INT64", shard_index),
+            bigquery.ScalarQueryParameter("shard_count", "INT64", shard_count),
         ]
     )
 
     try:
-        logger.info(f"Executing BigQuery query for advertiser_id: {advertiser_id}")
+        logger.info(f"Executing BigQuery query for advertiser_ids: {advertiser_ids}")
         query_job = client.query(query, job_config=job_config)
-        results = query_job.result()
+        results = query_job.result(page_size=config["bigquery"]["read_page_size"])
     except Exception as e:
         logger.error(f"Error executing BigQuery query: {e}")
         raise
 
-    rows = [normalize_row_keys(dict(row)) for row in results]
-    logger.info(f"Fetched {len(rows)} rows for advertiser_id: {advertiser_id}")
-    return rows
+    logger.info(
+        f"Streaming {results.total_rows} rows for advertiser_ids: {advertiser_ids}"
+        + (f" (shard {shard_index + 1}/{shard_count})" if shard_count > 1 else "")
+    )
+    pages = ([normalize_row_keys(row) for row in page] for page in results.pages)
+    return results.total_rows, pages
+
+
+def get_resolved_urls_from_bq(advertiser_ids: List[str]) -> Set[str]:
+    """
+    Retrieve the creative page URLs of advertisers already stored in the YouTube links table.
+
+    The lookup only lets jobs skip work, so a failing query is logged and treated as an empty result.
+
+    Args:
+        advertiser_ids (List[str]): The advertiser IDs to query.
+
+    Returns:
+        Set[str]: The creative page URLs that already have a YouTube link.
+    """
+    client = get_bigquery_client()
+
+    query = GET_RESOLVED_URLS_QUERY.format(
+        table=config["bigquery"]["tables"]["youtube_links"]
+    )
+
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ArrayQueryParameter("advertiser_ids", "STRING", advertiser_ids)
+        ]
+    )
 
+    try:
+        results = client.query(query, job_config=job_config).result()
+    except Exception as e:
+        logger.warning(
+            f"Could not look up resolved URLs for advertiser_ids {advertiser_ids}: {e}"
+        )
+        return set()
 
-def insert_row_to_bq(row_data: BigQueryRow, destination_table: str) -> None:
+    return {row["creative_page_url"] for row in results}
+
+
+def build_row_message_class(
+    model: Type[BigQueryRow],
+) -> Tuple[descriptor_pb2.DescriptorProto, type]:
     """
-    Insert a row into a BigQuery table.
+    Build a protobuf message type mirroring a row model, for the Storage Write API.
+
+    Every model field becomes an optional proto2 string field, numbered in declaration
+    order, which matches the STRING columns of the scraper's result tables.
 
     Args:
-        row_data (BigQueryRow): The data to insert.
-        destination_table (str): The fully qualified table name.
+        model (Type[BigQueryRow]): The pydantic row model.
+
+    Returns:
+        Tuple[descriptor_pb2.DescriptorProto, type]: The message descriptor sent as the
+        writer schema, and the message class used to serialise rows.
+    """
+    descriptor_proto = descriptor_pb2.DescriptorProto(name=model.__name__)
+    for number, field_name in enumerate(model.model_fields, start=1):
+        descriptor_proto.field.add(
+            name=field_name,
+            number=number,
+            type=descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+        )
+
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f"{model.__name__.lower()}.proto", syntax="proto2"
+    )
+    file_proto.message_type.add().CopyFrom(descriptor_proto)
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+
+    message_class = message_factory.GetMessageClass(
+        pool.FindMessageTypeByName(model.__name__)
+    )
+    return descriptor_proto, message_class
+
+
+class InsertAllSink:
     """
-    client = bigquery.Client(project=config["bigquery"]["project_id"])
+    Writes rows with the legacy streaming insert (`insertAll`) API.
 
-    row_dict = row_data.model_dump()
+    Rows rejected by BigQuery are retried with exponential backoff. Each row carries the insert ID
+    it was given when buffered, so BigQuery drops the rows of a retry that were already written.
 
-    logger.debug(f"Inserting row into {destination_table}: {row_dict}")
+    Attributes:
+        stages_rows (bool): False, as inserted rows are durable as soon as `write` returns.
+    """
+
+    stages_rows = False
+
+    def __init__(
+        self, client: bigquery.Client, max_retries: int, retry_backoff_seconds: float
+    ):
+        """
+        Args:
+            client (bigquery.Client): The BigQuery client used for the inserts.
+            max_retries (int): Number of times rejected rows are retried before being dropped.
+            retry_backoff_seconds (float): Delay before the first retry, doubled for every retry.
+        """
+        self.client = client
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+    def write(
+        self, destination_table: str, rows: List[Tuple[str, Dict[str, Any]]]
+    ) -> bool:
+        """
+        Insert rows, retrying the rejected ones with exponential backoff.
+
+        Args:
+            destination_table (str): The fully qualified table name.
+            rows (List[Tuple[str, Dict[str, Any]]]): Insert IDs and the rows to insert.
+
+        Returns:
+            bool: True if all rows were inserted, False if some were dropped after the retries.
+        """
+        pending = rows
+        for attempt in range(self.max_retries + 1):
+            try:
+                errors = self.client.insert_rows_json(
+                    destination_table,
+                    [row for _, row in pending],
+                    row_ids=[row_id for row_id, _ in pending],
+                )
+            except GoogleAPIError as e:
+                logger.warning(
+                    f"Insert of {len(pending)} rows into {destination_table} failed: {e}"
+                )
+            else:
+                if not errors:
+                    logger.info(
+                        f"Inserted {len(pending)} rows into {destination_table}."
+                    )
+                    return True
+                failed_indexes = sorted({error["index"] for error in errors})
+                logger.warning(
+                    f"{len(failed_indexes)} of {len(pending)} rows were rejected by "
+                    f"{destination_table}: {errors}"
+                )
+                pending = [pending[index] for index in failed_indexes]
+
+            if attempt < self.max_retries:
+                time.sleep(self.retry_backoff_seconds * 2**attempt)
 
-    errors = client.insert_rows_json(destination_table, [row_dict])
-    if errors:
         logger.error(
-            f"Errors occurred while inserting row into {destination_table}: {errors}"
+            f"Dropping {len(pending)} rows for {destination_table} after "
+            f"{self.max_retries} retries."
+        )
+        return False
+
+    def commit(self) -> bool:
+        """
+        Streamed inserts are visible immediately, so there is nothing to commit.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+
+class StorageWriteStream:
+    """
+    State of an open Storage Write API stream for one destination table.
+
+    Attributes:
+        parent (str): Resource path of the destination table.
+        name (str): Resource name of the write stream.
+        offset (int): Offset at which the next batch of rows is appended.
+        append_rows_stream (writer.AppendRowsStream): Connection the rows are sent over.
+    """
+
+    def __init__(self, parent: str, name: str):
+        self.parent = parent
+        self.name = name
+        self.offset = 0
+        self.append_rows_stream: Optional[writer.AppendRowsStream] = None
+
+
+class StorageWriteSink:
+    """
+    Writes rows with the BigQuery Storage Write API, serialised as protobuf `BigQueryRow`s.
+
+    One write stream is opened per destination table and every batch is appended at an explicit
+    offset, so retrying a batch whose append did succeed is rejected by BigQuery instead of
+    writing the rows twice. With `pending` streams the rows only become visible when `commit`
+    finalises the streams and commits them atomically; with `committed` streams they are visible
+    as soon as they are appended. Either way the next write after a commit opens new streams.
+
+    Attributes:
+        stages_rows (bool): Whether appended rows only become durable on `commit`, which is the
+            case for pending streams.
+    """
+
+    def __init__(
+        self,
+        client: bigquery_storage_v1.BigQueryWriteClient,
+        stream_type: str,
+        max_retries: int,
+        retry_backoff_seconds: float,
+    ):
+        """
+        Args:
+            client (bigquery_storage_v1.BigQueryWriteClient): The Storage Write API client.
+            stream_type (str): Write stream type, `pending` or `committed`.
+            max_retries (int): Number of times a failed append is retried before it is dropped.
+            retry_backoff_seconds (float): Delay before the first retry, doubled for every retry.
+        """
+        self.client = client
+        self.stream_type = types.WriteStream.Type[stream_type.upper()]
+        self.stages_rows = self.stream_type == types.WriteStream.Type.PENDING
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._descriptor, self._message_class = build_row_message_class(BigQueryRow)
+        self._streams: Dict[str, StorageWriteStream] = {}
+        self._lock = threading.Lock()
+
+    def write(
+        self, destination_table: str, rows: List[Tuple[str, Dict[str, Any]]]
+    ) -> bool:
+        """
+        Append rows to the destination table's write stream, opening the stream if needed.
+
+        Args:
+            destination_table (str): The fully qualified table name.
+            rows (List[Tuple[str, Dict[str, Any]]]): Insert IDs and the rows to append. The
+                insert IDs are not needed, as appends are deduplicated by offset.
+
+        Returns:
+            bool: True if the rows were appended, False if they were dropped after the retries.
+        """
+        serialized_rows = [
+            self._message_class(
+                **{key: value for key, value in row.items() if value is not None}
+            ).SerializeToString()
+            for _, row in rows
+        ]
+
+        with self._lock:
+            stream = self._streams.get(destination_table)
+            if stream is None:
+                stream = self._open_stream(destination_table)
+                self._streams[destination_table] = stream
+
+            request = types.AppendRowsRequest(
+                offset=stream.offset,
+                proto_rows=types.AppendRowsRequest.ProtoData(
+                    rows=types.ProtoRows(serialized_rows=serialized_rows)
+                ),
+            )
+            if self._append_with_retry(stream, request):
+                stream.offset += len(serialized_rows)
+                logger.info(
+                    f"Appended {len(serialized_rows)} rows to {destination_table}."
+                )
+                return True
+
+            logger.error(
+                f"Dropping {len(serialized_rows)} rows for {destination_table} after "
+                f"{self.max_retries} retries."
+            )
+            return False
+
+    def commit(self) -> bool:
+        """
+        Finalise all open write streams and, for pending streams, commit their rows.
+
+        Returns:
+            bool: True if the rows of every stream were committed.
+        """
+        with self._lock:
+            streams, self._streams = self._streams, {}
+
+        committed = True
+        for destination_table, stream in streams.items():
+            if stream.append_rows_stream is not None:
+                stream.append_rows_stream.close()
+            self.client.finalize_write_stream(name=stream.name)
+
+            if self.stream_type == types.WriteStream.Type.PENDING:
+                response = self.client.batch_commit_write_streams(
+                    types.BatchCommitWriteStreamsRequest(
+                        parent=stream.parent, write_streams=[stream.name]
+                    )
+                )
+                if response.stream_errors:
+                    logger.error(
+                        f"Committing {stream.offset} rows to {destination_table} failed: "
+                        f"{list(response.stream_errors)}"
+                    )
+                    committed = False
+                    continue
+
+            logger.info(f"Committed {stream.offset} rows to {destination_table}.")
+        return committed
+
+    def _open_stream(self, destination_table: str) -> StorageWriteStream:
+        """
+        Create a write stream of the configured type for a table.
+
+        Args:
+            destination_table (str): The fully qualified table name.
+
+        Returns:
+            StorageWriteStream: The new stream, not yet connected.
+        """
+        project_id, dataset_id, table_id = destination_table.split(".")
+        parent = self.client.table_path(project_id, dataset_id, table_id)
+        write_stream = self.client.create_write_stream(
+            parent=parent, write_stream=types.WriteStream(type_=self.stream_type)
+        )
+        return StorageWriteStream(parent=parent, name=write_stream.name)
+
+    def _connect(self, stream: StorageWriteStream) -> None:
+        """
+        Open a new connection for appending rows to a write stream.
+
+        Args:
+            stream (StorageWriteStream): The write stream to connect to.
+        """
+        request_template = types.AppendRowsRequest(
+            write_stream=stream.name,
+            proto_rows=types.AppendRowsRequest.ProtoData(
+                writer_schema=types.ProtoSchema(proto_descriptor=self._descriptor)
+            ),
+        )
+        stream.append_rows_stream = writer.AppendRowsStream(
+            self.client, request_template
+        )
+
+    def _append_with_retry(
+        self, stream: StorageWriteStream, request: types.AppendRowsRequest
+    ) -> bool:
+        """
+        Send an append request, reconnecting and retrying with exponential backoff on failure.
+
+        Args:
+            stream (StorageWriteStream): The write stream to append to.
+            request (types.AppendRowsRequest): The append request, with its offset set.
+
+        Returns:
+            bool: True if the rows were appended, False if all attempts failed.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                if stream.append_rows_stream is None:
+                    self._connect(stream)
+                stream.append_rows_stream.send(request).result()
+                return True
+            except AlreadyExists:
+                # An earlier attempt did append the rows at this offset.
+                return True
+            except (GoogleAPIError, exceptions.StreamClosedError) as e:
+                logger.warning(f"Append to write stream {stream.name} failed: {e}")
+                if stream.append_rows_stream is not None:
+                    stream.append_rows_stream.close()
+                stream.append_rows_stream = None
+
+            if attempt < self.max_retries:
+                time.sleep(self.retry_backoff_seconds * 2**attempt)
+        return False
+
+
+class LocalStubSink:
+    """
+    Keeps rows in memory instead of writing them to BigQuery, for tests and local runs.
+
+    Rows are held as pending until `commit`, like the Storage Write API's pending streams.
+
+    Attributes:
+        tables (Dict[str, List[Dict[str, Any]]]): Committed rows per destination table.
+        stages_rows (bool): True, as written rows are only committed on `commit`.
+    """
+
+    stages_rows = True
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._pending: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def write(
+        self, destination_table: str, rows: List[Tuple[str, Dict[str, Any]]]
+    ) -> bool:
+        """
+        Hold rows as pending for the destination table.
+
+        Args:
+            destination_table (str): The fully qualified table name.
+            rows (List[Tuple[str, Dict[str, Any]]]): Insert IDs and the rows to write.
+
+        Returns:
+            bool: Always True.
+        """
+        with self._lock:
+            self._pending[destination_table].extend(row for _, row in rows)
+        logger.debug(f"Stub sink received {len(rows)} rows for {destination_table}.")
+        return True
+
+    def commit(self) -> bool:
+        """
+        Move all pending rows to the committed tables.
+
+        Returns:
+            bool: Always True.
+        """
+        with self._lock:
+            for destination_table, rows in self._pending.items():
+                self.tables[destination_table].extend(rows)
+                logger.info(
+                    f"Stub sink committed {len(rows)} rows to {destination_table}."
+                )
+            self._pending.clear()
+        return True
+
+
+def _resolve(futures: List[asyncio.Future], written: bool) -> None:
+    """
+    Resolve the futures returned by `BigQueryBatchWriter.add` for a batch of rows.
+
+    Args:
+        futures (List[asyncio.Future]): The rows' futures.
+        written (bool): Whether the rows are durable.
+    """
+    for future in futures:
+        if not future.done():
+            future.set_result(written)
+
+
+class BigQueryBatchWriter:
+    """
+    Buffers rows per destination table and writes them to a sink in batches.
+
+    A table's buffer is flushed as soon as it holds `max_batch_rows` rows, and all buffers are
+    flushed every `max_batch_age_seconds` by a background task, so no row waits longer than that.
+    Every row gets an insert ID when it is buffered, so sinks can deduplicate retried rows.
+    `commit` flushes the buffers and makes the written rows visible for sinks that stage them.
+
+    Sinks drop the rows they fail to write after retrying instead of raising, so `add` returns a
+    future telling whether the row became durable: it is resolved once the row's batch is
+    written, or, for sinks that stage rows, once the batch is committed. Since the writer is
+    shared by concurrent jobs, each job follows its own rows' futures rather than the outcome of
+    a commit, which may cover other jobs' rows.
+    """
+
+    def __init__(
+        self,
+        sink: Union[InsertAllSink, StorageWriteSink, LocalStubSink],
+        max_batch_rows: int,
+        max_batch_age_seconds: float,
+    ):
+        """
+        Args:
+            sink (Union[InsertAllSink, StorageWriteSink, LocalStubSink]): Where rows are written.
+            max_batch_rows (int): Number of buffered rows that triggers a flush of a table.
+            max_batch_age_seconds (float): Interval at which all buffers are flushed.
+        """
+        self.sink = sink
+        self.max_batch_rows = max_batch_rows
+        self.max_batch_age_seconds = max_batch_age_seconds
+        self._buffers: Dict[str, List[Tuple[str, Dict[str, Any], asyncio.Future]]] = (
+            defaultdict(list)
+        )
+        self._lock = asyncio.Lock()
+        self._writes_done = asyncio.Condition(self._lock)
+        self._writes_in_flight = 0
+        self._staged: List[asyncio.Future] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Start the background task that flushes the buffers by age.
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def add(
+        self, row_data: BigQueryRow, destination_table: str
+    ) -> asyncio.Future:
+        """
+        Buffer a row for insertion, flushing the table's buffer if it is full.
+
+        Args:
+            row_data (BigQueryRow): The data to insert.
+            destination_table (str): The fully qualified table name.
+
+        Returns:
+            asyncio.Future: Resolved with True once the row is durable, or with False if it was
+            dropped.
+        """
+        written = asyncio.get_running_loop().create_future()
+        async with self._lock:
+            buffer = self._buffers[destination_table]
+            buffer.append((str(uuid.uuid4()), row_data.model_dump(), written))
+            full = len(buffer) >= self.max_batch_rows
+
+        if full:
+            await self._flush_table(destination_table)
+        return written
+
+    async def flush(self) -> None:
+        """
+        Write all buffered rows to the sink.
+        """
+        async with self._lock:
+            tables = [table for table, rows in self._buffers.items() if rows]
+        await asyncio.gather(*(self._flush_table(table) for table in tables))
+
+    async def commit(self) -> None:
+        """
+        Write all buffered rows to the sink and commit them.
+
+        Writes still in flight, such as a periodic flush, are waited for first, so the futures
+        of every row added before the call are resolved when it returns.
+        """
+        await self.flush()
+        async with self._writes_done:
+            await self._writes_done.wait_for(lambda: self._writes_in_flight == 0)
+            staged, self._staged = self._staged, []
+        loop = asyncio.get_running_loop()
+        committed = False
+        try:
+            committed = await loop.run_in_executor(None, self.sink.commit)
+        finally:
+            _resolve(staged, committed)
+
+    async def close(self) -> None:
+        """
+        Stop the background flush task and commit the remaining buffered rows.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.commit()
+
+    async def _flush_periodically(self) -> None:
+        """
+        Flush all buffers every `max_batch_age_seconds` until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.max_batch_age_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Periodic flush of buffered rows failed: {e}")
+
+    async def _flush_table(self, destination_table: str) -> None:
+        """
+        Take the buffered rows of a table and write them to the sink off the event loop.
+
+        Args:
+            destination_table (str): The fully qualified table name.
+        """
+        async with self._lock:
+            rows = self._buffers.pop(destination_table, [])
+            if not rows:
+                return
+            self._writes_in_flight += 1
+
+        futures = [written for _, _, written in rows]
+        written = False
+        try:
+            loop = asyncio.get_running_loop()
+            with BIGQUERY_WRITE_SECONDS.labels(destination_table).time():
+                written = await loop.run_in_executor(
+                    None,
+                    self.sink.write,
+                    destination_table,
+                    [(insert_id, row) for insert_id, row, _ in rows],
+                )
+        finally:
+            async with self._writes_done:
+                self._writes_in_flight -= 1
+                if written and self.sink.stages_rows:
+                    self._staged.extend(futures)
+                else:
+                    _resolve(futures, written)
+                self._writes_done.notify_all()
+
+
+def create_batch_writer() -> BigQueryBatchWriter:
+    """
+    Create a batch writer with the sink selected by the `bigquery.writer` configuration.
+
+    The `sink` setting selects `insert_all` (legacy streaming inserts), `storage_write`
+    (Storage Write API, with `storage_write_stream_type` `pending` or `committed`) or
+    `stub` (in-memory, for tests and local runs).
+
+    Returns:
+        BigQueryBatchWriter: The configured batch writer.
+
+    Raises:
+        ValueError: If the configured sink is unknown.
+    """
+    writer_config = config["bigquery"]["writer"]
+    sink_name = writer_config.get("sink", "insert_all")
+
+    if sink_name == "insert_all":
+        sink = InsertAllSink(
+            client=get_bigquery_client(),
+            max_retries=writer_config["max_retries"],
+            retry_backoff_seconds=writer_config["retry_backoff_seconds"],
+        )
+    elif sink_name == "storage_write":
+        sink = StorageWriteSink(
+            client=bigquery_storage_v1.BigQueryWriteClient(),
+            stream_type=writer_config.get("storage_write_stream_type", "pending"),
+            max_retries=writer_config["max_retries"],
+            retry_backoff_seconds=writer_config["retry_backoff_seconds"],
         )
+    elif sink_name == "stub":
+        sink = LocalStubSink()
     else:
-        logger.info(f"Row inserted into {destination_table} successfully.")
+        raise ValueError(f"Unknown BigQuery writer sink: {sink_name}")
+
+    logger.info(f"Writing scrape results with the '{sink_name}' sink.")
+    return BigQueryBatchWriter(
+        sink=sink,
+        max_batch_rows=writer_config["max_batch_rows"],
+        max_batch_age_seconds=writer_config["max_batch_age_seconds"],
+    )
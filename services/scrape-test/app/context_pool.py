@@ -0,0 +1,192 @@
+# context_pool.py
+
+import asyncio
+from contextlib import asynccontextmanager
+from playwright.async_api import Browser, BrowserContext, Page, Route
+from logging_config import logger
+from metrics import ACTIVE_BROWSER_CONTEXTS
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+CLEAR_STORAGE_SCRIPT: str = """
+() => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+}
+"""
+"""
+Script clearing the web storage of the origin a pooled page is on before it is reused.
+"""
+
+
+class PooledContext:
+    """
+    A browser context and its page, leased from a BrowserContextPool.
+
+    Attributes:
+        context (BrowserContext): The Playwright browser context.
+        page (Page): The page used for scraping within the context.
+        pages_served (int): Number of URLs the context has been used for.
+        failed (bool): Whether the current lease hit an error, forcing the context to be recycled.
+    """
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.pages_served = 0
+        self.failed = False
+
+    def mark_failed(self) -> None:
+        """
+        Mark the context as unusable, so it is replaced instead of reused when it is released.
+        """
+        self.failed = True
+
+
+class BrowserContextPool:
+    """
+    A fixed-size pool of browser contexts, each with a single open page, that are reused across URLs.
+
+    Creating a context is one of the most expensive Playwright operations, so contexts are kept
+    open and leased out one URL at a time. Between leases the context's cookies and the page's
+    web storage are cleared and the page is reset to `about:blank`. A context is replaced by a
+    fresh one after `max_pages_per_context` URLs, or when a lease was marked as failed.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int,
+        max_pages_per_context: int,
+        route_handler: Optional[Callable[[Route], Awaitable[None]]] = None,
+    ):
+        """
+        Args:
+            browser (Browser): The Playwright browser to create contexts in.
+            size (int): Number of contexts in the pool.
+            max_pages_per_context (int): Number of URLs after which a context is recycled.
+            route_handler (Optional[Callable[[Route], Awaitable[None]]]): Handler installed with
+                `page.route` on every pooled page to intercept its requests.
+        """
+        self.browser = browser
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self.route_handler = route_handler
+        self._available: asyncio.Queue = asyncio.Queue()
+        self._contexts: List[PooledContext] = []
+
+    async def start(self) -> None:
+        """
+        Create the pool's contexts and pages.
+        """
+        for _ in range(self.size):
+            self._available.put_nowait(await self._create())
+
+    async def close(self) -> None:
+        """
+        Close every context of the pool.
+        """
+        for pooled in list(self._contexts):
+            await self._close_context(pooled)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[PooledContext]:
+        """
+        Lease a context and its page, waiting until one is available.
+
+        The context is returned to the pool when the block exits; if the block raised or
+        called `mark_failed`, it is replaced by a fresh context instead.
+
+        Yields:
+            PooledContext: The leased context.
+        """
+        pooled: PooledContext = await self._available.get()
+        pooled.failed = False
+        ACTIVE_BROWSER_CONTEXTS.inc()
+        try:
+            yield pooled
+        except Exception:
+            pooled.mark_failed()
+            raise
+        finally:
+            ACTIVE_BROWSER_CONTEXTS.dec()
+            pooled.pages_served += 1
+            self._available.put_nowait(await self._release(pooled))
+
+    async def _create(self) -> PooledContext:
+        """
+        Create a new context with an open page.
+
+        Returns:
+            PooledContext: The new pooled context.
+        """
+        context = await self.browser.new_context()
+        page = await context.new_page()
+        if self.route_handler is not None:
+            await page.route("**/*", self.route_handler)
+        pooled = PooledContext(context, page)
+        self._contexts.append(pooled)
+        return pooled
+
+    async def _release(self, pooled: PooledContext) -> PooledContext:
+        """
+        Reset a leased context for reuse, or replace it if it failed or has served enough URLs.
+
+        Args:
+            pooled (PooledContext): The context being returned to the pool.
+
+        Returns:
+            PooledContext: The context to put back into the pool.
+        """
+        if not pooled.failed and pooled.pages_served < self.max_pages_per_context:
+            try:
+                await pooled.page.evaluate(CLEAR_STORAGE_SCRIPT)
+                await pooled.context.clear_cookies()
+                await pooled.page.goto("about:blank")
+                return pooled
+            except Exception as e:
+                logger.debug(f"Failed to reset browser context, recycling it: {e}")
+
+        await self._close_context(pooled)
+        return await self._create()
+
+    async def _close_context(self, pooled: PooledContext) -> None:
+        """
+        Close a context and stop tracking it.
+
+        Args:
+            pooled (PooledContext): The context to close.
+        """
+        if pooled in self._contexts:
+            self._contexts.remove(pooled)
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.debug(f"Failed to close browser context: {e}")
+
+
+@asynccontextmanager
+async def open_context_pool(
+    browser: Browser,
+    size: int,
+    max_pages_per_context: int,
+    route_handler: Optional[Callable[[Route], Awaitable[None]]] = None,
+) -> AsyncIterator[BrowserContextPool]:
+    """
+    Create a started BrowserContextPool and close it when the block exits.
+
+    Args:
+        browser (Browser): The Playwright browser to create contexts in.
+        size (int): Number of contexts in the pool.
+        max_pages_per_context (int): Number of URLs after which a context is recycled.
+        route_handler (Optional[Callable[[Route], Awaitable[None]]]): Request handler installed
+            on every pooled page.
+
+    Yields:
+        BrowserContextPool: The started pool.
+    """
+    pool = BrowserContextPool(browser, size, max_pages_per_context, route_handler)
+    try:
+        await pool.start()
+        yield pool
+    finally:
+        await pool.close()
@@ -2,11 +2,14 @@
 
 import asyncio
 from typing import Dict, Set, Optional
+from bigquery_utils import BigQueryBatchWriter
+from scrape_cache import ScrapeResultCache
+from job_store import JobStore
+from job_progress import JobProgress
 
-job_statuses: Dict[str, str] = {}
+job_store: Optional[JobStore] = None
 """
-Dictionary to store the status of jobs.
-Keys are job IDs, values are status strings.
+Store of job statuses and progress checkpoints, created at application startup.
 """
 
 active_jobs: Set[str] = set()
@@ -14,6 +17,11 @@ active_jobs: Set[str] = set()
 Set of active job IDs.
 """
 
+job_progress: Dict[str, JobProgress] = {}
+"""
+Progress of the jobs started by this process, keyed by job ID, dropped a while after they end.
+"""
+
 shutdown_event: asyncio.Event = asyncio.Event()
 """
 Event to signal application shutdown.
@@ -23,3 +31,18 @@ shutdown_timer_task: Optional[asyncio.Task] = None
 """
 Task for the shutdown timer.
 """
+
+resumed_job_tasks: Set[asyncio.Task] = set()
+"""
+Tasks of the jobs resumed at application startup, referenced until they finish.
+"""
+
+bq_writer: Optional[BigQueryBatchWriter] = None
+"""
+Batch writer for scrape results, created at application startup.
+"""
+
+scrape_cache: Optional[ScrapeResultCache] = None
+"""
+Cache of recent scrape outcomes by creative page URL, created at application startup.
+"""
@@ -0,0 +1,330 @@
+# host_scheduler.py
+
+import asyncio
+import time
+from collections import deque
+from urllib.parse import urlsplit
+from config_loader import config
+from logging_config import logger
+from metrics import ROW_QUEUE_DEPTH
+from typing import Any, Deque, Dict, Optional, Set
+
+
+def get_host(row: Dict[str, Any]) -> str:
+    """
+    Get the host a row's creative page URL points at.
+
+    Args:
+        row (Dict[str, Any]): The row data containing the URL.
+
+    Returns:
+        str: The lowercase host name, or an empty string if the URL has none or is malformed.
+
+    Example:
+        >>> get_host({"creative_page_url": "https://AdsTransparency.google.com/advertiser/AR1"})
+        'adstransparency.google.com'
+        >>> get_host({"creative_page_url": "http://[::1"})
+        ''
+    """
+    try:
+        return (urlsplit(row.get("creative_page_url") or "").hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+class HostLimiter:
+    """
+    Rate and concurrency limits of a single host.
+
+    Requests are paced by a token bucket refilled at `requests_per_second`, holding at most
+    `burst` tokens. The number of concurrent requests is limited by an AIMD controller: the
+    limit is multiplied by `decrease_factor` when a request is throttled (a timeout or an HTTP
+    429), and grows by about one per limit's worth of responses faster than
+    `fast_response_seconds`.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int,
+        initial_concurrency: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        fast_response_seconds: float,
+        decrease_factor: float,
+    ):
+        """
+        Args:
+            requests_per_second (float): Rate at which the token bucket is refilled.
+            burst (int): Capacity of the token bucket.
+            initial_concurrency (int): Concurrency limit the host starts with.
+            min_concurrency (int): Lowest concurrency limit after backing off.
+            max_concurrency (int): Highest concurrency limit after ramping up.
+            fast_response_seconds (float): Response time under which the limit is increased.
+            decrease_factor (float): Factor applied to the limit when a request is throttled.
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.fast_response_seconds = fast_response_seconds
+        self.decrease_factor = decrease_factor
+        self.concurrency_limit = float(initial_concurrency)
+        self.in_flight = 0
+        self.tokens = float(burst)
+        self._refilled_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.burst,
+            self.tokens + (now - self._refilled_at) * self.requests_per_second,
+        )
+        self._refilled_at = now
+
+    def has_capacity(self) -> bool:
+        """
+        Check whether another request fits within the concurrency limit.
+
+        Returns:
+            bool: True if fewer requests than the limit are in flight.
+        """
+        return self.in_flight < int(self.concurrency_limit)
+
+    def seconds_until_token(self, now: float) -> float:
+        """
+        Get how long until a token is available.
+
+        Args:
+            now (float): The current `time.monotonic()` value.
+
+        Returns:
+            float: Seconds until a request may start, 0 if one may start now.
+        """
+        self._refill(now)
+        return max(0.0, (1 - self.tokens) / self.requests_per_second)
+
+    def start(self) -> None:
+        """
+        Take a token and count a request as in flight.
+        """
+        self.tokens -= 1
+        self.in_flight += 1
+
+    def finish(self, throttled: bool, elapsed_seconds: float) -> None:
+        """
+        Count a request as finished and adjust the concurrency limit.
+
+        Args:
+            throttled (bool): Whether the host timed out or throttled the request.
+            elapsed_seconds (float): How long the request took.
+        """
+        self.in_flight -= 1
+        if throttled:
+            self.concurrency_limit = max(
+                self.min_concurrency, self.concurrency_limit * self.decrease_factor
+            )
+        elif elapsed_seconds <= self.fast_response_seconds:
+            self.concurrency_limit = min(
+                self.max_concurrency,
+                self.concurrency_limit + 1 / self.concurrency_limit,
+            )
+
+
+class HostScheduler:
+    """
+    A bounded queue of rows that hands them out fairly across hosts, within each host's limits.
+
+    Rows are queued per host, and `get` takes the next row round-robin from the hosts that have
+    both a free concurrency slot and a token, so a slow or throttling host only delays its own
+    rows. Every row returned by `get` must be passed to `release` once processed.
+
+    Rows being retried are queued with `requeue`, which never waits for space, so consumers
+    cannot block each other, but at most `max_queued_retries` retries wait at any time.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        limiter_settings: Dict[str, Any],
+        max_queued_retries: int = 0,
+    ):
+        """
+        Args:
+            maxsize (int): Maximum number of queued rows, across all hosts.
+            limiter_settings (Dict[str, Any]): Keyword arguments of every host's `HostLimiter`.
+            max_queued_retries (int): Maximum number of requeued rows waiting at any time.
+        """
+        self.maxsize = maxsize
+        self.limiter_settings = limiter_settings
+        self.max_queued_retries = max_queued_retries
+        self._queued_retries: Set[int] = set()
+        self.limiters: Dict[str, HostLimiter] = {}
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._rotation: Deque[str] = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+
+    async def put(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a row, waiting while the scheduler is full.
+
+        Args:
+            row (Dict[str, Any]): The row to queue.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._size < self.maxsize)
+            self._enqueue(row)
+
+    async def requeue(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue a row again for a retry, unless `max_queued_retries` retries are already waiting.
+
+        Must be called before the row's earlier attempt is released, so the scheduler is not
+        considered drained in between.
+
+        Args:
+            row (Dict[str, Any]): The row to retry.
+
+        Returns:
+            bool: True if the row was queued.
+        """
+        async with self._condition:
+            if len(self._queued_retries) >= self.max_queued_retries:
+                return False
+            self._queued_retries.add(id(row))
+            self._enqueue(row)
+            return True
+
+    def _enqueue(self, row: Dict[str, Any]) -> None:
+        """
+        Append a row to its host's queue and wake up waiting consumers. Must hold the lock.
+
+        Args:
+            row (Dict[str, Any]): The row to queue.
+        """
+        host = get_host(row)
+        if host not in self.limiters:
+            self.limiters[host] = HostLimiter(**self.limiter_settings)
+        if host not in self._queues:
+            self._queues[host] = deque()
+            self._rotation.append(host)
+        self._queues[host].append(row)
+        self._size += 1
+        ROW_QUEUE_DEPTH.inc()
+        self._condition.notify_all()
+
+    async def close(self) -> None:
+        """
+        Mark that no more rows will be queued, so `get` returns None once the queue is drained.
+        """
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def clear(self) -> None:
+        """
+        Drop the queued rows, once the consumers have been stopped before draining the scheduler.
+        """
+        ROW_QUEUE_DEPTH.dec(self._size)
+        self._queues.clear()
+        self._rotation.clear()
+        self._queued_retries.clear()
+        self._size = 0
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Take the next row a host is ready for, waiting until there is one.
+
+        Returns:
+            Optional[Dict[str, Any]]: The row, or None once the scheduler is closed and drained,
+            and no row is in flight that could still be requeued.
+        """
+        async with self._condition:
+            while True:
+                if (
+                    self._closed
+                    and self._size == 0
+                    and not any(limiter.in_flight for limiter in self.limiters.values())
+                ):
+                    return None
+
+                now = time.monotonic()
+                wait_seconds: Optional[float] = None
+                for _ in range(len(self._rotation)):
+                    host = self._rotation[0]
+                    self._rotation.rotate(-1)
+                    limiter = self.limiters[host]
+                    if not limiter.has_capacity():
+                        continue
+                    delay = limiter.seconds_until_token(now)
+                    if delay > 0:
+                        wait_seconds = (
+                            delay if wait_seconds is None else min(wait_seconds, delay)
+                        )
+                        continue
+
+                    limiter.start()
+                    queue = self._queues[host]
+                    row = queue.popleft()
+                    if not queue:
+                        del self._queues[host]
+                        self._rotation.remove(host)
+                    self._size -= 1
+                    ROW_QUEUE_DEPTH.dec()
+                    self._queued_retries.discard(id(row))
+                    self._condition.notify_all()
+                    return row
+
+                # Wait for a row to be queued or released, or for the earliest token.
+                try:
+                    await asyncio.wait_for(self._condition.wait(), wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(
+        self, row: Dict[str, Any], throttled: bool, elapsed_seconds: float
+    ) -> None:
+        """
+        Report a row returned by `get` as processed, adjusting its host's concurrency limit.
+
+        Args:
+            row (Dict[str, Any]): The processed row.
+            throttled (bool): Whether the host timed out or throttled the request.
+            elapsed_seconds (float): How long processing the row took.
+        """
+        host = get_host(row)
+        async with self._condition:
+            limiter = self.limiters[host]
+            previous_limit = int(limiter.concurrency_limit)
+            limiter.finish(throttled, elapsed_seconds)
+            if int(limiter.concurrency_limit) != previous_limit:
+                logger.debug(
+                    f"Concurrency limit for {host or 'unknown host'} changed from "
+                    f"{previous_limit} to {int(limiter.concurrency_limit)}"
+                )
+            self._condition.notify_all()
+
+
+def create_host_scheduler() -> HostScheduler:
+    """
+    Create a host scheduler with the limits configured under `host_limits`.
+
+    Returns:
+        HostScheduler: The scheduler, bounded by `concurrency.row_queue_size` rows, and by
+        `retry.max_queued_retries` requeued rows.
+    """
+    limits = config["host_limits"]
+    return HostScheduler(
+        maxsize=config["concurrency"]["row_queue_size"],
+        max_queued_retries=config["retry"]["max_queued_retries"],
+        limiter_settings={
+            "requests_per_second": limits["requests_per_second"],
+            "burst": limits["burst"],
+            "initial_concurrency": limits["initial_concurrency"],
+            "min_concurrency": limits["min_concurrency"],
+            "max_concurrency": limits["max_concurrency"],
+            "fast_response_seconds": limits["fast_response_seconds"],
+            "decrease_factor": limits["decrease_factor"],
+        },
+    )
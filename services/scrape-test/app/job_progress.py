@@ -0,0 +1,179 @@
+# job_progress.py
+
+import asyncio
+import time
+from models import JobProgressResponse
+from typing import Dict, List, Optional, Set
+
+
+def create_counters() -> Dict[str, int]:
+    """
+    Create the progress counters of an advertiser within a job or worker shard.
+
+    Returns:
+        Dict[str, int]: The counters, all set to zero.
+    """
+    return {
+        "total_rows": 0,
+        "cached_skips": 0,
+        "resumed_skips": 0,
+        "total_urls_processed": 0,
+        "successful_scrapes": 0,
+        "timeouts_inserted": 0,
+        "permanent_failures": 0,
+        "results_dropped": 0,
+        "retries_queued": 0,
+        "http_tier_attempts": 0,
+        "http_tier_hits": 0,
+        "browser_tier_attempts": 0,
+        "browser_tier_hits": 0,
+    }
+
+
+def sum_counters(counters_by_advertiser: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+    """
+    Add up the counters of every advertiser of a job.
+
+    Args:
+        counters_by_advertiser (Dict[str, Dict[str, int]]): Counters keyed by advertiser ID.
+
+    Returns:
+        Dict[str, int]: The job's total counters.
+    """
+    totals = create_counters()
+    for counters in counters_by_advertiser.values():
+        for key, value in counters.items():
+            totals[key] += value
+    return totals
+
+
+class JobProgress:
+    """
+    Progress counters of a job, per advertiser, and the streams following them.
+
+    Counters are plain dicts updated in place from the event loop's thread, and an increment
+    never spans an `await`, so they need no lock. Whoever updates the counters calls `notify`,
+    which wakes up the coroutines waiting in `wait_for_update`; it costs nothing while nobody
+    is waiting.
+    """
+
+    def __init__(self, advertiser_ids: List[str]):
+        """
+        Args:
+            advertiser_ids (List[str]): The advertiser IDs of the job, which may be empty when the
+                rows decide which advertisers the job covers.
+        """
+        self.counters_by_advertiser: Dict[str, Dict[str, int]] = {
+            advertiser_id: create_counters() for advertiser_id in advertiser_ids
+        }
+        self.expected_rows = 0
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self._waiters: Set[asyncio.Future] = set()
+
+    def counters(self, advertiser_id: str) -> Dict[str, int]:
+        """
+        Get the counters of an advertiser, creating them on its first row.
+
+        Args:
+            advertiser_id (str): The advertiser ID.
+
+        Returns:
+            Dict[str, int]: The advertiser's counters, to update in place.
+        """
+        counters = self.counters_by_advertiser.get(advertiser_id)
+        if counters is None:
+            counters = self.counters_by_advertiser[advertiser_id] = create_counters()
+        return counters
+
+    def add(self, counters_by_advertiser: Dict[str, Dict[str, int]]) -> None:
+        """
+        Add counters collected elsewhere, such as in a worker process, and notify the waiters.
+
+        Args:
+            counters_by_advertiser (Dict[str, Dict[str, int]]): Counters keyed by advertiser ID.
+        """
+        for advertiser_id, added in counters_by_advertiser.items():
+            counters = self.counters(advertiser_id)
+            for key, value in added.items():
+                counters[key] += value
+        self.notify()
+
+    def notify(self) -> None:
+        """
+        Wake up the coroutines waiting for the counters to change.
+        """
+        waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def finish(self) -> None:
+        """
+        Stop the clock of the job's throughput and notify the waiters.
+        """
+        self.finished_at = time.monotonic()
+        self.notify()
+
+    async def wait_for_update(self, timeout: float) -> bool:
+        """
+        Wait until the counters are updated.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if the counters were updated, False if the timeout expired first.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters.discard(waiter)
+
+    def snapshot(self, job_id: str, status: str) -> JobProgressResponse:
+        """
+        Summarize the job's progress, with its throughput and estimated time remaining.
+
+        Rows skipped as cached or already processed count as done, but not towards the
+        throughput, which only counts scraped URLs.
+
+        Args:
+            job_id (str): The unique identifier for the job.
+            status (str): The job's current status.
+
+        Returns:
+            JobProgressResponse: The job's progress.
+        """
+        totals = sum_counters(self.counters_by_advertiser)
+        elapsed_seconds = (self.finished_at or time.monotonic()) - self.started_at
+        total_rows = max(self.expected_rows, totals["total_rows"])
+        processed_rows = (
+            totals["total_urls_processed"]
+            + totals["cached_skips"]
+            + totals["resumed_skips"]
+        )
+        urls_per_second = (
+            totals["total_urls_processed"] / elapsed_seconds if elapsed_seconds else 0.0
+        )
+        eta_seconds = None
+        if self.finished_at is None and urls_per_second:
+            eta_seconds = max(0, total_rows - processed_rows) / urls_per_second
+
+        return JobProgressResponse(
+            job_id=job_id,
+            status=status,
+            processed_rows=processed_rows,
+            total_rows=total_rows,
+            successful_scrapes=totals["successful_scrapes"],
+            timeouts_inserted=totals["timeouts_inserted"],
+            permanent_failures=totals["permanent_failures"],
+            elapsed_seconds=round(elapsed_seconds, 1),
+            urls_per_second=round(urls_per_second, 2),
+            eta_seconds=None if eta_seconds is None else round(eta_seconds, 1),
+            advertiser_progress=self.counters_by_advertiser,
+        )
@@ -0,0 +1,414 @@
+# job_store.py
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime, timezone
+from config_loader import config
+from logging_config import logger
+from models import JobSource, ScrapeStatus
+from typing import Dict, List, Optional, Set, Tuple
+
+INCOMPLETE_STATUSES: Tuple[str, ...] = ("Pending", "Running")
+"""
+Job statuses of jobs that have not finished, and are resumed when the service starts.
+"""
+
+SQLITE_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    advertiser_ids TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT 'creatives',
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_progress (
+    job_id TEXT NOT NULL,
+    creative_id TEXT NOT NULL,
+    PRIMARY KEY (job_id, creative_id)
+);
+CREATE TABLE IF NOT EXISTS unresolvable_urls (
+    creative_page_url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+"""
+"""
+Tables of the SQLite job store: one row per job, with its advertiser IDs as a JSON array and its
+JobSource, one row per processed creative of a job, and one row per creative page URL that
+failed permanently.
+"""
+
+
+class JobStore(ABC):
+    """
+    Interface of the stores recording job statuses and per-row progress checkpoints.
+
+    Implementations must be safe to call from several threads, and their methods are
+    expected to be quick enough to call from the event loop.
+    """
+
+    @abstractmethod
+    def create_job(
+        self,
+        job_id: str,
+        advertiser_ids: List[str],
+        source: JobSource = JobSource.CREATIVES,
+    ) -> None:
+        """
+        Record a new job with the status "Pending".
+
+        Args:
+            job_id (str): The unique identifier for the job.
+            advertiser_ids (List[str]): The advertiser IDs the job processes.
+            source (JobSource): The table the job reads its rows from.
+        """
+
+    @abstractmethod
+    def set_status(self, job_id: str, status: str) -> None:
+        """
+        Update the status of a job.
+
+        Args:
+            job_id (str): The unique identifier for the job.
+            status (str): The new status.
+        """
+
+    @abstractmethod
+    def get_status(self, job_id: str) -> Optional[str]:
+        """
+        Get the status of a job.
+
+        Args:
+            job_id (str): The unique identifier for the job.
+
+        Returns:
+            Optional[str]: The job's status, or None if the job is unknown.
+        """
+
+    @abstractmethod
+    def get_incomplete_jobs(self) -> List[Tuple[str, List[str], JobSource]]:
+        """
+        List the jobs that are pending or running.
+
+        Returns:
+            List[Tuple[str, List[str], JobSource]]: The job IDs, advertiser IDs and sources of
+            the jobs.
+        """
+
+    @abstractmethod
+    def record_processed(self, job_id: str, creative_ids: List[str]) -> None:
+        """
+        Checkpoint creatives of a job as processed, with their results committed.
+
+        Args:
+            job_id (str): The unique identifier for the job.
+            creative_ids (List[str]): The processed creative IDs.
+        """
+
+    @abstractmethod
+    def get_processed(self, job_id: str) -> Set[str]:
+        """
+        Get the creatives of a job checkpointed as processed.
+
+        Args:
+            job_id (str): The unique identifier for the job.
+
+        Returns:
+            Set[str]: The processed creative IDs.
+        """
+
+    @abstractmethod
+    def record_unresolvable(self, creative_page_url: str, status: ScrapeStatus) -> None:
+        """
+        Record that a creative page failed permanently, so retrying its timeouts is pointless.
+
+        Args:
+            creative_page_url (str): The creative page URL.
+            status (ScrapeStatus): The permanent outcome, NOT_FOUND or HTTP_ERROR.
+        """
+
+    @abstractmethod
+    def get_unresolvable_urls(self) -> Set[str]:
+        """
+        Get the creative page URLs recorded as failing permanently.
+
+        Returns:
+            Set[str]: The creative page URLs.
+        """
+
+    def close(self) -> None:
+        """
+        Release the store's resources.
+        """
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Job store keeping everything in memory, so nothing survives a restart.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, Tuple[List[str], JobSource, str]] = {}
+        self._processed: Dict[str, Set[str]] = defaultdict(set)
+        self._unresolvable_urls: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def create_job(
+        self,
+        job_id: str,
+        advertiser_ids: List[str],
+        source: JobSource = JobSource.CREATIVES,
+    ) -> None:
+        with self._lock:
+            self._jobs[job_id] = (list(advertiser_ids), source, "Pending")
+
+    def set_status(self, job_id: str, status: str) -> None:
+        with self._lock:
+            advertiser_ids, source, _ = self._jobs[job_id]
+            self._jobs[job_id] = (advertiser_ids, source, status)
+
+    def get_status(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job[2] if job else None
+
+    def get_incomplete_jobs(self) -> List[Tuple[str, List[str], JobSource]]:
+        with self._lock:
+            return [
+                (job_id, list(advertiser_ids), source)
+                for job_id, (advertiser_ids, source, status) in self._jobs.items()
+                if status in INCOMPLETE_STATUSES
+            ]
+
+    def record_processed(self, job_id: str, creative_ids: List[str]) -> None:
+        with self._lock:
+            self._processed[job_id].update(creative_ids)
+
+    def get_processed(self, job_id: str) -> Set[str]:
+        with self._lock:
+            return set(self._processed.get(job_id, ()))
+
+    def record_unresolvable(self, creative_page_url: str, status: ScrapeStatus) -> None:
+        with self._lock:
+            self._unresolvable_urls.add(creative_page_url)
+
+    def get_unresolvable_urls(self) -> Set[str]:
+        with self._lock:
+            return set(self._unresolvable_urls)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store persisted in a local SQLite database file.
+
+    The database can be shared by the worker processes of a job, as SQLite serialises writes
+    across processes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of the database file, created along with its directory if missing.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(SQLITE_SCHEMA)
+
+    def create_job(
+        self,
+        job_id: str,
+        advertiser_ids: List[str],
+        source: JobSource = JobSource.CREATIVES,
+    ) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO jobs "
+                "(job_id, advertiser_ids, source, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, 'Pending', ?, ?)",
+                (job_id, json.dumps(advertiser_ids), source.value, now, now),
+            )
+
+    def set_status(self, job_id: str, status: str) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                (status, now, job_id),
+            )
+
+    def get_status(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_incomplete_jobs(self) -> List[Tuple[str, List[str], JobSource]]:
+        placeholders = ", ".join("?" for _ in INCOMPLETE_STATUSES)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT job_id, advertiser_ids, source FROM jobs "
+                f"WHERE status IN ({placeholders}) ORDER BY created_at",
+                INCOMPLETE_STATUSES,
+            ).fetchall()
+        return [
+            (job_id, json.loads(advertiser_ids), JobSource(source))
+            for job_id, advertiser_ids, source in rows
+        ]
+
+    def record_processed(self, job_id: str, creative_ids: List[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO job_progress (job_id, creative_id) VALUES (?, ?)",
+                [(job_id, creative_id) for creative_id in creative_ids],
+            )
+
+    def get_processed(self, job_id: str) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT creative_id FROM job_progress WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return {creative_id for (creative_id,) in rows}
+
+    def record_unresolvable(self, creative_page_url: str, status: ScrapeStatus) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO unresolvable_urls "
+                "(creative_page_url, status, recorded_at) VALUES (?, ?, ?)",
+                (creative_page_url, status.value, now),
+            )
+
+    def get_unresolvable_urls(self) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT creative_page_url FROM unresolvable_urls"
+            ).fetchall()
+        return {creative_page_url for (creative_page_url,) in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class JobCheckpointer:
+    """
+    Collects the creatives a job has processed and checkpoints them in batches.
+
+    A creative is only checkpointed once the row written for its result, if any, is durable, as
+    reported by the future `BigQueryBatchWriter.add` returned for it, so a resumed job never skips
+    a lost result. Checkpoints never commit the writer themselves: with a sink that stages rows,
+    results become durable when the job's final commit makes them visible. Creatives whose row
+    was dropped are never checkpointed, and are counted in their advertiser's `results_dropped`.
+    """
+
+    def __init__(self, job_store: JobStore, job_id: str, interval_rows: int):
+        """
+        Args:
+            job_store (JobStore): Where checkpoints are recorded.
+            job_id (str): The unique identifier for the job.
+            interval_rows (int): Number of newly processed rows that triggers a checkpoint.
+        """
+        self.job_store = job_store
+        self.job_id = job_id
+        self.interval_rows = interval_rows
+        self._pending: List[Tuple[str, Optional[asyncio.Future], Dict[str, int]]] = []
+        self._next_checkpoint_rows = interval_rows
+        self._lock = asyncio.Lock()
+
+    async def row_processed(
+        self,
+        creative_id: str,
+        written: Optional[asyncio.Future],
+        counters: Dict[str, int],
+    ) -> None:
+        """
+        Record a processed creative, checkpointing once enough rows are pending.
+
+        Args:
+            creative_id (str): The processed creative ID.
+            written (Optional[asyncio.Future]): The future of the row written for the creative's
+                result, or None if no row was written.
+            counters (Dict[str, int]): The progress counters of the creative's advertiser.
+        """
+        self._pending.append((creative_id, written, counters))
+        if len(self._pending) >= self._next_checkpoint_rows:
+            await self.checkpoint()
+
+    async def checkpoint(self, wait: bool = False) -> None:
+        """
+        Record the pending creatives whose results are durable as processed.
+
+        Creatives whose rows are still being written stay pending for the next checkpoint.
+
+        Args:
+            wait (bool): Whether to wait for every pending row to be written or dropped first,
+                for the job's final checkpoint after the writer has been committed.
+        """
+        async with self._lock:
+            if wait:
+                await asyncio.gather(
+                    *(written for _, written, _ in self._pending if written is not None)
+                )
+
+            creative_ids = []
+            dropped = 0
+            still_pending = []
+            for creative_id, written, counters in self._pending:
+                if written is None or (written.done() and written.result()):
+                    creative_ids.append(creative_id)
+                elif written.done():
+                    counters["results_dropped"] += 1
+                    dropped += 1
+                else:
+                    still_pending.append((creative_id, written, counters))
+            self._pending = still_pending
+            self._next_checkpoint_rows = len(still_pending) + self.interval_rows
+
+            if dropped:
+                logger.error(
+                    f"Results of {dropped} rows of job {self.job_id} were dropped, "
+                    "not checkpointing them"
+                )
+            if creative_ids:
+                self.job_store.record_processed(self.job_id, creative_ids)
+                logger.debug(
+                    f"Checkpointed {len(creative_ids)} processed rows of job {self.job_id}"
+                )
+
+
+def create_job_store() -> JobStore:
+    """
+    Create the job store selected by the `job_store` configuration.
+
+    The `backend` setting selects `sqlite` (persisted in `sqlite_path`) or `memory`.
+
+    Returns:
+        JobStore: The configured job store.
+
+    Raises:
+        ValueError: If the configured backend is unknown.
+    """
+    store_config = config["job_store"]
+    backend = store_config.get("backend", "sqlite")
+
+    if backend == "sqlite":
+        store = SQLiteJobStore(store_config["sqlite_path"])
+    elif backend == "memory":
+        store = InMemoryJobStore()
+    else:
+        raise ValueError(f"Unknown job store backend: {backend}")
+
+    logger.info(f"Recording jobs in the '{backend}' job store.")
+    return store
@@ -0,0 +1,106 @@
+# metrics.py
+
+import os
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from typing import Tuple
+
+SECONDS_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 60)
+"""
+Histogram buckets for latencies, from fast BigQuery writes up to the longest navigation timeout.
+"""
+
+PAGE_LOAD_SECONDS = Histogram(
+    "scrape_page_load_seconds",
+    "Time taken by the browser to navigate to a creative page.",
+    ["wait_until"],
+    buckets=SECONDS_BUCKETS,
+)
+"""
+Duration of `page.goto`, labelled by the load state it waits for: `commit` on the fast path,
+`load` otherwise.
+"""
+
+TIME_TO_IFRAME_SECONDS = Histogram(
+    "scrape_time_to_iframe_seconds",
+    "Time from starting to load a creative page until its YouTube frame is found.",
+    buckets=SECONDS_BUCKETS,
+)
+"""
+Time to find a YouTube frame in the browser, observed for pages where one is found.
+"""
+
+BIGQUERY_WRITE_SECONDS = Histogram(
+    "bigquery_write_seconds",
+    "Time taken to write a batch of rows to BigQuery.",
+    ["table"],
+    buckets=SECONDS_BUCKETS,
+)
+"""
+Duration of the batch writer's sink writes, labelled by destination table.
+"""
+
+ROW_QUEUE_DEPTH = Gauge(
+    "scrape_row_queue_depth",
+    "Number of rows waiting in the host schedulers to be scraped.",
+    multiprocess_mode="livesum",
+)
+"""
+Rows queued across the host schedulers of all running jobs.
+"""
+
+ACTIVE_BROWSER_CONTEXTS = Gauge(
+    "scrape_active_browser_contexts",
+    "Number of browser contexts leased to scrape a URL.",
+    multiprocess_mode="livesum",
+)
+"""
+Pooled browser contexts currently in use, across all context pools.
+"""
+
+SCRAPE_OUTCOMES = Counter(
+    "scrape_outcomes_total",
+    "Final outcomes of scraped rows.",
+    ["job_id", "advertiser_id", "outcome"],
+)
+"""
+Rows scraped, labelled by job, advertiser and ScrapeStatus value. Every job adds its own series,
+so the series of finished jobs only go away when the service restarts.
+"""
+
+SCRAPE_RETRIES = Counter(
+    "scrape_retries_total",
+    "Rows requeued for another scrape attempt after a transient failure.",
+    ["job_id", "advertiser_id"],
+)
+"""
+Retries queued, labelled by job and advertiser.
+"""
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render the metrics in the Prometheus text format.
+
+    When `PROMETHEUS_MULTIPROC_DIR` is set in the environment before the service starts, the
+    metrics of every process, including the worker processes of `concurrency.worker_processes`,
+    are written to that directory and aggregated here. Otherwise only this process's metrics
+    are rendered.
+
+    Returns:
+        Tuple[bytes, str]: The rendered metrics and their content type.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,7 +1,8 @@
 # models.py
 
+from enum import Enum
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class JobCreateResponse(BaseModel):
@@ -19,6 +20,22 @@ class JobCreateResponse(BaseModel):
     )
 
 
+class BatchJobCreateRequest(BaseModel):
+    """
+    Request model for starting a job over several advertisers.
+
+    Attributes:
+        advertiser_ids (List[str]): Advertiser IDs to process in the job.
+    """
+
+    advertiser_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Advertiser IDs to process in the job",
+        example=["AR00642912486307135489", "AR17828074650563772417"],
+    )
+
+
 class JobStatusResponse(BaseModel):
     """
     Response model for job status.
@@ -26,6 +43,8 @@ class JobStatusResponse(BaseModel):
     Attributes:
         job_id (str): Unique identifier for the job.
         status (str): Current status of the job.
+        advertiser_progress (Optional[Dict[str, Dict[str, int]]]): Progress counters per
+            advertiser, for jobs started by this instance.
     """
 
     job_id: str = Field(
@@ -34,6 +53,76 @@ class JobStatusResponse(BaseModel):
         example="123e4567-e89b-12d3-a456-426614174000",
     )
     status: str = Field(..., description="Current status of the job", example="Running")
+    advertiser_progress: Optional[Dict[str, Dict[str, int]]] = Field(
+        None,
+        description="Progress counters per advertiser, for jobs started by this instance",
+        example={
+            "AR00642912486307135489": {
+                "total_rows": 120,
+                "total_urls_processed": 80,
+                "successful_scrapes": 41,
+            }
+        },
+    )
+
+
+class JobProgressResponse(BaseModel):
+    """
+    Response model for the progress of a job, as streamed by `/job_status/{job_id}/stream`.
+
+    Attributes:
+        job_id (str): Unique identifier for the job.
+        status (str): Current status of the job.
+        processed_rows (int): Rows scraped or skipped so far.
+        total_rows (int): Rows the job has to process.
+        successful_scrapes (int): Rows a YouTube link was found for.
+        timeouts_inserted (int): Rows written to the timeouts table.
+        permanent_failures (int): Rows whose page returned a permanent error.
+        elapsed_seconds (float): Time since the job started running.
+        urls_per_second (float): URLs scraped per second since the job started running.
+        eta_seconds (Optional[float]): Estimated time until the job completes.
+        advertiser_progress (Dict[str, Dict[str, int]]): Progress counters per advertiser.
+    """
+
+    job_id: str = Field(
+        ...,
+        description="Unique identifier for the job",
+        example="123e4567-e89b-12d3-a456-426614174000",
+    )
+    status: str = Field(..., description="Current status of the job", example="Running")
+    processed_rows: int = Field(
+        ..., description="Rows scraped or skipped so far", example=80
+    )
+    total_rows: int = Field(..., description="Rows the job has to process", example=120)
+    successful_scrapes: int = Field(
+        ..., description="Rows a YouTube link was found for", example=41
+    )
+    timeouts_inserted: int = Field(
+        ..., description="Rows written to the timeouts table", example=3
+    )
+    permanent_failures: int = Field(
+        ..., description="Rows whose page returned a permanent error", example=2
+    )
+    elapsed_seconds: float = Field(
+        ..., description="Time since the job started running", example=95.2
+    )
+    urls_per_second: float = Field(
+        ..., description="URLs scraped per second since the job started", example=0.84
+    )
+    eta_seconds: Optional[float] = Field(
+        None, description="Estimated time until the job completes", example=47.6
+    )
+    advertiser_progress: Dict[str, Dict[str, int]] = Field(
+        ...,
+        description="Progress counters per advertiser",
+        example={
+            "AR00642912486307135489": {
+                "total_rows": 120,
+                "total_urls_processed": 80,
+                "successful_scrapes": 41,
+            }
+        },
+    )
 
 
 class BigQueryRow(BaseModel):
@@ -69,3 +158,72 @@ class BigQueryRow(BaseModel):
         description="Standard YouTube watch URL",
         example="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
     )
+
+
+class JobSource(str, Enum):
+    """
+    Table a job reads the rows to scrape from.
+    """
+
+    CREATIVES = "creatives"
+    TIMEOUTS = "timeouts"
+
+
+class ScrapeStatus(str, Enum):
+    """
+    Outcome of scraping a creative page URL.
+    """
+
+    FOUND = "found"
+    NOT_FOUND = "not_found"
+    TIMEOUT = "timeout"
+    HTTP_ERROR = "http_error"
+    CRASHED = "crashed"
+
+
+class ScrapeResult(BaseModel):
+    """
+    Model representing the outcome of scraping a creative page URL.
+
+    Attributes:
+        status (ScrapeStatus): The outcome of the scrape.
+        youtube_url (Optional[str]): The YouTube embed URL, if found.
+        http_status (Optional[int]): Status code of the page's document, for HTTP errors.
+        error (Optional[str]): The error message, for failed scrapes.
+    """
+
+    status: ScrapeStatus = Field(
+        ..., description="Outcome of the scrape", example=ScrapeStatus.FOUND
+    )
+    youtube_url: Optional[str] = Field(
+        None,
+        description="YouTube embed URL, if found",
+        example="https://www.youtube.com/embed/dQw4w9WgXcQ",
+    )
+    http_status: Optional[int] = Field(
+        None, description="Status code of the page's document", example=503
+    )
+    error: Optional[str] = Field(
+        None, description="Error message of a failed scrape", example="Timeout 20000ms"
+    )
+
+    @property
+    def is_throttled(self) -> bool:
+        """
+        Whether the host timed out or rate limited the scrape.
+        """
+        return self.status == ScrapeStatus.TIMEOUT or self.http_status == 429
+
+    @property
+    def is_transient(self) -> bool:
+        """
+        Whether the failure may succeed on a retry: timeouts, crashes, HTTP 429 and 5xx errors.
+
+        Pages that were not found, and other HTTP or network errors, such as a 404 or a DNS
+        failure, are permanent.
+        """
+        if self.status in (ScrapeStatus.TIMEOUT, ScrapeStatus.CRASHED):
+            return True
+        return self.status == ScrapeStatus.HTTP_ERROR and (
+            self.http_status == 429 or (self.http_status or 0) >= 500
+        )
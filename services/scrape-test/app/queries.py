@@ -12,14 +12,71 @@ SELECT
 FROM
     `{table}`
 WHERE
-    advertiser_id = @advertiser_id
+    advertiser_id IN UNNEST(@advertiser_ids)
     AND advertiser_id IS NOT NULL
     AND creative_id IS NOT NULL
     AND creative_page_url IS NOT NULL
+    AND MOD(ABS(FARM_FINGERPRINT(creative_id)), @shard_count) = @shard_index
 """
 """
-SQL query to retrieve rows for a specific advertiser ID.
+SQL query to retrieve the rows of one or more advertiser IDs.
+
+Rows are split into `@shard_count` shards by creative ID and only shard `@shard_index` is
+returned; a shard count of 1 returns every row.
 
 Parameters:
     table (str): The fully qualified BigQuery table name.
 """
+
+GET_RESOLVED_URLS_QUERY: str = """
+SELECT DISTINCT
+    creative_page_url
+FROM
+    `{table}`
+WHERE
+    advertiser_id IN UNNEST(@advertiser_ids)
+    AND youtube_video_url IS NOT NULL
+"""
+"""
+SQL query to retrieve the creative page URLs of one or more advertisers that already have a
+YouTube link.
+
+Parameters:
+    table (str): The fully qualified BigQuery table name of the YouTube links table.
+"""
+
+GET_TIMEOUT_ROWS_QUERY: str = """
+SELECT DISTINCT
+    timeouts.advertiser_id,
+    timeouts.creative_id,
+    timeouts.creative_page_url
+FROM
+    `{table}` AS timeouts
+WHERE
+    (
+        ARRAY_LENGTH(@advertiser_ids) = 0
+        OR timeouts.advertiser_id IN UNNEST(@advertiser_ids)
+    )
+    AND timeouts.advertiser_id IS NOT NULL
+    AND timeouts.creative_id IS NOT NULL
+    AND timeouts.creative_page_url IS NOT NULL
+    AND MOD(ABS(FARM_FINGERPRINT(timeouts.creative_id)), @shard_count) = @shard_index
+    AND NOT EXISTS (
+        SELECT
+            1
+        FROM
+            `{youtube_links_table}` AS youtube_links
+        WHERE
+            youtube_links.creative_page_url = timeouts.creative_page_url
+    )
+"""
+"""
+SQL query to retrieve the rows of the timeouts table that have not been resolved since, for
+`@advertiser_ids` or, if the array is empty, for all advertisers.
+
+Rows are sharded like GET_ROWS_QUERY.
+
+Parameters:
+    table (str): The fully qualified BigQuery table name of the timeouts table.
+    youtube_links_table (str): The fully qualified BigQuery table name of the YouTube links table.
+"""
@@ -1,15 +1,59 @@
 # routes.py
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Path
-from models import JobCreateResponse, JobStatusResponse
+import asyncio
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Path, Response
+from fastapi.responses import StreamingResponse
+from models import (
+    BatchJobCreateRequest,
+    JobCreateResponse,
+    JobSource,
+    JobStatusResponse,
+)
 from scraper import process_job
+from job_store import INCOMPLETE_STATUSES
+from job_progress import JobProgress
+from config_loader import config
+from metrics import render_metrics
 from logging_config import logger
 import global_vars
 import uuid
+from typing import AsyncIterator, List
 
 router = APIRouter()
 
 
+def schedule_job(
+    advertiser_ids: List[str],
+    background_tasks: BackgroundTasks,
+    source: JobSource = JobSource.CREATIVES,
+) -> str:
+    """
+    Record a new job for the given advertiser IDs and schedule it as a background task.
+
+    Args:
+        advertiser_ids (List[str]): The IDs of the advertisers to process.
+        background_tasks (BackgroundTasks): FastAPI background tasks.
+        source (JobSource): The table the job reads its rows from.
+
+    Returns:
+        str: The job ID of the scheduled job.
+    """
+    job_id = str(uuid.uuid4())
+    global_vars.job_store.create_job(job_id, advertiser_ids, source)
+    global_vars.active_jobs.add(job_id)
+
+    # Cancel the shutdown timer if it's running
+    if (
+        global_vars.shutdown_timer_task is not None
+        and not global_vars.shutdown_timer_task.done()
+    ):
+        global_vars.shutdown_timer_task.cancel()
+        logger.info("Shutdown timer canceled due to new job submission.")
+
+    background_tasks.add_task(process_job, job_id, advertiser_ids, source)
+    return job_id
+
+
 @router.post(
     "/start_job",
     response_model=JobCreateResponse,
@@ -32,20 +76,73 @@ async def start_job(
     Returns:
         JobCreateResponse: Contains the job ID of the started job.
     """
-    job_id = str(uuid.uuid4())
-    global_vars.job_statuses[job_id] = "Pending"
-    global_vars.active_jobs.add(job_id)
+    job_id = schedule_job([advertiser_id], background_tasks)
+    logger.info(f"Job {job_id} started for advertiser_id {advertiser_id}")
+    return JobCreateResponse(job_id=job_id)
 
-    # Cancel the shutdown timer if it's running
-    if (
-        global_vars.shutdown_timer_task is not None
-        and not global_vars.shutdown_timer_task.done()
-    ):
-        global_vars.shutdown_timer_task.cancel()
-        logger.info("Shutdown timer canceled due to new job submission.")
 
-    background_tasks.add_task(process_job, job_id, advertiser_id)
-    logger.info(f"Job {job_id} started for advertiser_id {advertiser_id}")
+@router.post(
+    "/start_batch_job",
+    response_model=JobCreateResponse,
+    summary="Start a new scraping job for several advertisers",
+    tags=["Jobs"],
+)
+async def start_batch_job(
+    request: BatchJobCreateRequest,
+    background_tasks: BackgroundTasks = None,
+):
+    """
+    Start a single scraping job for several advertiser IDs.
+
+    The rows of all advertisers are fetched with one query and scraped with one browser, and
+    progress is reported per advertiser by `/job_status`.
+
+    Args:
+        request (BatchJobCreateRequest): The IDs of the advertisers to process.
+        background_tasks (BackgroundTasks): FastAPI background tasks.
+
+    Returns:
+        JobCreateResponse: Contains the job ID of the started job.
+    """
+    advertiser_ids = list(dict.fromkeys(request.advertiser_ids))
+    job_id = schedule_job(advertiser_ids, background_tasks)
+    logger.info(
+        f"Job {job_id} started for {len(advertiser_ids)} advertiser_ids: "
+        f"{', '.join(advertiser_ids)}"
+    )
+    return JobCreateResponse(job_id=job_id)
+
+
+@router.post(
+    "/retry_timeouts",
+    response_model=JobCreateResponse,
+    summary="Start a job re-processing the timeouts table",
+    tags=["Jobs"],
+)
+async def retry_timeouts(
+    advertiser_ids: List[str] = Query(
+        [],
+        description="Advertiser IDs whose timeouts to retry, all advertisers if omitted",
+        example=["AR00642912486307135489"],
+    ),
+    background_tasks: BackgroundTasks = None,
+):
+    """
+    Start a job scraping again the rows of the timeouts table that have not been resolved since.
+
+    Args:
+        advertiser_ids (List[str]): The IDs of the advertisers whose timeouts to retry.
+        background_tasks (BackgroundTasks): FastAPI background tasks.
+
+    Returns:
+        JobCreateResponse: Contains the job ID of the started job.
+    """
+    advertiser_ids = list(dict.fromkeys(advertiser_ids))
+    job_id = schedule_job(advertiser_ids, background_tasks, JobSource.TIMEOUTS)
+    logger.info(
+        f"Job {job_id} started retrying timeouts for "
+        f"{', '.join(advertiser_ids) or 'all advertisers'}"
+    )
     return JobCreateResponse(job_id=job_id)
 
 
@@ -69,11 +166,102 @@ async def job_status(
         job_id (str): The ID of the job to check.
 
     Returns:
-        JobStatusResponse: Contains the job ID and its current status.
+        JobStatusResponse: Contains the job ID, its current status and its per-advertiser progress.
     """
-    status = global_vars.job_statuses.get(job_id)
+    status = global_vars.job_store.get_status(job_id)
     if status is None:
         logger.error(f"Job {job_id} not found")
         raise HTTPException(status_code=404, detail="Job not found")
     logger.info(f"Job {job_id} status requested: {status}")
-    return JobStatusResponse(job_id=job_id, status=status)
+    progress = global_vars.job_progress.get(job_id)
+    return JobStatusResponse(
+        job_id=job_id,
+        status=status,
+        advertiser_progress=progress.counters_by_advertiser if progress else None,
+    )
+
+
+async def stream_job_progress(job_id: str) -> AsyncIterator[str]:
+    """
+    Yield Server-Sent Events with a job's progress until the job is no longer pending or running.
+
+    An event is sent when the job's counters change, at most every
+    `progress_stream.min_interval_seconds`, and at least every
+    `progress_stream.heartbeat_seconds` to keep the connection open.
+
+    Args:
+        job_id (str): The ID of the job to follow.
+
+    Yields:
+        str: `progress` events whose data is a JSON-encoded JobProgressResponse.
+    """
+    stream_config = config["progress_stream"]
+    progress = JobProgress([])
+    while True:
+        status = global_vars.job_store.get_status(job_id)
+        # A job gets its progress once it starts running, and drops it a while after it ends,
+        # so the stream keeps the last progress it saw.
+        progress = global_vars.job_progress.get(job_id) or progress
+        snapshot = progress.snapshot(job_id, status)
+        yield f"event: progress\ndata: {snapshot.model_dump_json()}\n\n"
+        if status not in INCOMPLETE_STATUSES:
+            return
+
+        await progress.wait_for_update(stream_config["heartbeat_seconds"])
+        # Coalesce the updates of the rows processed meanwhile into the next event.
+        await asyncio.sleep(stream_config["min_interval_seconds"])
+
+
+@router.get(
+    "/job_status/{job_id}/stream",
+    response_class=StreamingResponse,
+    summary="Stream the progress of a job",
+    tags=["Jobs"],
+)
+async def job_status_stream(
+    job_id: str = Path(
+        ...,
+        description="Job ID to stream the progress of",
+        example="123e4567-e89b-12d3-a456-426614174000",
+    )
+):
+    """
+    Stream a job's progress as Server-Sent Events, until the job completes or fails.
+
+    Each event carries the job's processed and total rows, successes, timeouts, throughput and
+    estimated time remaining. With `concurrency.worker_processes` above 1, progress only
+    advances as each worker process finishes.
+
+    Args:
+        job_id (str): The ID of the job to follow.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` of JobProgressResponse events.
+    """
+    if global_vars.job_store.get_status(job_id) is None:
+        logger.error(f"Job {job_id} not found")
+        raise HTTPException(status_code=404, detail="Job not found")
+    logger.info(f"Job {job_id} progress stream opened")
+    return StreamingResponse(
+        stream_job_progress(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    summary="Get the service's metrics in the Prometheus text format",
+    tags=["Monitoring"],
+)
+async def metrics():
+    """
+    Expose page load, time-to-iframe and BigQuery write latency histograms, the row queue depth,
+    the number of active browser contexts, and scrape outcome counters by job and advertiser.
+
+    Returns:
+        Response: The metrics in the Prometheus text exposition format.
+    """
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
@@ -0,0 +1,109 @@
+# scrape_cache.py
+
+import time
+from collections import OrderedDict
+from config_loader import config
+from typing import Optional
+
+
+class ScrapeResultCache:
+    """
+    In-process cache of scrape outcomes, keyed by creative_page_url.
+
+    Every outcome is kept for a limited time: resolved and not-found URLs for `ttl_seconds`,
+    and timed-out URLs for `timeout_cooldown_seconds`, after which they are scraped again. The
+    cache holds at most `max_entries` URLs, evicting the least recently recorded first.
+
+    The cache also covers rows that were scraped but are not yet visible in BigQuery, because
+    they are still buffered by the batch writer or sit in an uncommitted write stream.
+    """
+
+    def __init__(
+        self, max_entries: int, ttl_seconds: float, timeout_cooldown_seconds: float
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of URLs kept in the cache.
+            ttl_seconds (float): How long a resolved or not-found URL is skipped.
+            timeout_cooldown_seconds (float): How long a timed-out URL is skipped before it is retried.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.timeout_cooldown_seconds = timeout_cooldown_seconds
+        self._expires_at: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def should_skip(self, url: str) -> bool:
+        """
+        Check whether a URL was scraped recently enough to be skipped.
+
+        Args:
+            url (str): The creative page URL.
+
+        Returns:
+            bool: True if the URL has an outcome that has not expired yet.
+        """
+        expires_at: Optional[float] = self._expires_at.get(url)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._expires_at[url]
+            return False
+        return True
+
+    def mark_resolved(self, url: str) -> None:
+        """
+        Record that a YouTube link was found for a URL.
+
+        Args:
+            url (str): The creative page URL.
+        """
+        self._put(url, self.ttl_seconds)
+
+    def mark_not_found(self, url: str) -> None:
+        """
+        Record that a URL was scraped without finding a YouTube link.
+
+        Args:
+            url (str): The creative page URL.
+        """
+        self._put(url, self.ttl_seconds)
+
+    def mark_timed_out(self, url: str) -> None:
+        """
+        Record that scraping a URL timed out, so it is retried after the cool-down.
+
+        Args:
+            url (str): The creative page URL.
+        """
+        self._put(url, self.timeout_cooldown_seconds)
+
+    def _put(self, url: str, ttl_seconds: float) -> None:
+        """
+        Store a URL's expiry time, evicting the oldest entries beyond `max_entries`.
+
+        Args:
+            url (str): The creative page URL.
+            ttl_seconds (float): How long the URL is skipped.
+        """
+        self._expires_at[url] = time.monotonic() + ttl_seconds
+        self._expires_at.move_to_end(url)
+        while len(self._expires_at) > self.max_entries:
+            self._expires_at.popitem(last=False)
+
+
+def create_scrape_cache() -> ScrapeResultCache:
+    """
+    Create the scrape result cache configured under `cache` in the configuration.
+
+    Returns:
+        ScrapeResultCache: The cache.
+    """
+    cache_config = config["cache"]
+    return ScrapeResultCache(
+        max_entries=cache_config["max_entries"],
+        ttl_seconds=cache_config["ttl_seconds"],
+        timeout_cooldown_seconds=cache_config["timeout_cooldown_seconds"],
+    )
@@ -1,216 +1,863 @@
 # scraper.py
 
 import asyncio
-from playwright.async_api import async_playwright, Browser, BrowserContext
-from bigquery_utils import get_rows_from_bq, insert_row_to_bq
-from utils import convert_embed_to_watch_url
+import multiprocessing
+import httpx
+from concurrent.futures import ProcessPoolExecutor
+from playwright.async_api import (
+    async_playwright,
+    Error as PlaywrightError,
+    Frame,
+    Page,
+    Request,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
+from bigquery_utils import (
+    create_batch_writer,
+    get_row_pages_from_bq,
+    get_resolved_urls_from_bq,
+)
+from utils import convert_embed_to_watch_url, extract_youtube_embed_url
+from scrape_cache import create_scrape_cache
+from job_store import JobCheckpointer, create_job_store
+from context_pool import BrowserContextPool, open_context_pool
+from host_scheduler import HostScheduler, create_host_scheduler
+from job_progress import JobProgress, sum_counters
 from logging_config import logger
+from metrics import (
+    PAGE_LOAD_SECONDS,
+    SCRAPE_OUTCOMES,
+    SCRAPE_RETRIES,
+    TIME_TO_IFRAME_SECONDS,
+)
 from config_loader import config
 import global_vars
-from models import BigQueryRow
+from models import BigQueryRow, JobSource, ScrapeResult, ScrapeStatus
 from pydantic import ValidationError
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+COLLECT_IFRAME_SOURCES_SCRIPT: str = """
+() => {
+    const sources = [];
+    const collect = (doc) => {
+        for (const iframe of doc.querySelectorAll("iframe")) {
+            for (const name of ["src", "data-src", "data-lazy-src"]) {
+                const value = iframe.getAttribute(name);
+                if (value) {
+                    try { sources.push(new URL(value, doc.baseURI).href); } catch (e) {}
+                }
+            }
+            let child = null;
+            try { child = iframe.contentDocument; } catch (e) {}
+            if (child) collect(child);
+        }
+    };
+    collect(document);
+    return sources;
+}
+"""
+"""
+Script collecting the absolute `src`, `data-src` and `data-lazy-src` URLs of the iframes of a page
+and of its same-origin nested documents. Cross-origin frames are covered by `page.frames`.
+"""
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used by the HTTP extraction tier.
+
+    Returns:
+        httpx.AsyncClient: A client following redirects, with keep-alive connections shared
+        across URLs and capped at `scraper.http_tier.max_connections`.
+    """
+    http_config = config["scraper"]["http_tier"]
+    return httpx.AsyncClient(
+        timeout=http_config["timeout_seconds"],
+        limits=httpx.Limits(
+            max_connections=http_config["max_connections"],
+            max_keepalive_connections=http_config["max_connections"],
+        ),
+        headers={"User-Agent": http_config["user_agent"]},
+        follow_redirects=True,
+    )
+
+
+async def fetch_youtube_link_over_http(
+    url: str, http_client: httpx.AsyncClient
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Fetch a URL without a browser and search the returned HTML for an iframe embedding a YouTube
+    video, see `extract_youtube_embed_url`.
+
+    Errors are not reported as timeouts: any failure simply escalates the URL to the browser tier.
+
+    Args:
+        url (str): The URL to fetch.
+        http_client (httpx.AsyncClient): The pooled HTTP client.
+
+    Returns:
+        Tuple[Optional[str], Optional[int]]: The YouTube embed URL if an iframe of the response
+        embeds one, or None; and the response's status code, or None if no response was received.
+    """
+    try:
+        response = await http_client.get(url)
+    # Malformed URLs raise InvalidURL or ValueError, which are not HTTPErrors.
+    except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+        logger.debug(f"HTTP fetch of {url} failed, escalating to the browser: {e}")
+        return None, None
+
+    if response.is_error:
+        logger.debug(
+            f"HTTP fetch of {url} returned {response.status_code}, escalating to the browser"
+        )
+        return None, response.status_code
+
+    return extract_youtube_embed_url(response.text), response.status_code
+
+
+async def block_unneeded_resources(route: Route) -> None:
+    """
+    Abort requests that are not needed to find a YouTube embed, and continue all others.
+
+    Requests are aborted if their resource type is in `scraper.blocked_resource_types`, or their
+    URL contains one of `scraper.blocked_url_patterns` (analytics and ad trackers). Documents,
+    including iframes, are never blocked, so embedded frames still load.
+
+    Args:
+        route (Route): The intercepted request's route.
+    """
+    request = route.request
+    scraper_config = config["scraper"]
+    if request.resource_type != "document" and (
+        request.resource_type in scraper_config["blocked_resource_types"]
+        or any(
+            pattern in request.url for pattern in scraper_config["blocked_url_patterns"]
+        )
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def find_youtube_in_frames(page: Page) -> Optional[str]:
+    """
+    Find a YouTube frame or iframe anywhere in a page's frame tree, in at most one round-trip.
+
+    The URLs of `page.frames`, which Playwright already tracks for every frame of the tree, are
+    checked first. Only if none is a YouTube frame is the page searched, with a single
+    evaluation of COLLECT_IFRAME_SOURCES_SCRIPT, for iframes whose source is a YouTube URL but
+    which have not loaded, such as lazy-loaded iframes.
+
+    Args:
+        page (Page): The loaded page to search.
+
+    Returns:
+        Optional[str]: The URL of the first YouTube frame or iframe source found, or None.
+    """
+    for frame in page.frames:
+        if "youtube.com" in frame.url:
+            logger.debug(f"Found YouTube frame: {frame.url}")
+            return frame.url
+
+    for source in await page.evaluate(COLLECT_IFRAME_SOURCES_SCRIPT):
+        if "youtube.com" in source:
+            logger.debug(f"Found YouTube iframe with src: {source}")
+            return source
+    return None
+
+
+async def wait_for_youtube_frame(
+    page: Page, url: str, timeout_ms: int, navigation_timeout_ms: int
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Navigate to a URL and return as soon as a youtube.com frame or frame navigation is observed.
+
+    Args:
+        page (Page): The Playwright page to load the URL in.
+        url (str): The URL to load.
+        timeout_ms (int): How long to wait for a YouTube frame after the page has been committed.
+        navigation_timeout_ms (int): How long to wait for the page to be committed.
+
+    Returns:
+        Tuple[Optional[str], Optional[int]]: The YouTube frame URL, or None if none was observed
+        in time or the page returned an HTTP error; and the status code of the page's document.
+    """
+    found: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def on_youtube_url(youtube_url: str) -> None:
+        if "youtube.com" in youtube_url and not found.done():
+            found.set_result(youtube_url)
+
+    def on_frame_navigated(frame: Frame) -> None:
+        if frame != page.main_frame:
+            on_youtube_url(frame.url)
+
+    def on_request(request: Request) -> None:
+        if request.is_navigation_request() and request.frame != page.main_frame:
+            on_youtube_url(request.url)
 
+    page.on("framenavigated", on_frame_navigated)
+    page.on("request", on_request)
+    try:
+        with PAGE_LOAD_SECONDS.labels("commit").time():
+            response = await page.goto(
+                url, wait_until="commit", timeout=navigation_timeout_ms
+            )
+        http_status = response.status if response else None
+        if http_status is not None and http_status >= 400:
+            return None, http_status
+        try:
+            return await asyncio.wait_for(found, timeout=timeout_ms / 1000), http_status
+        except asyncio.TimeoutError:
+            return None, http_status
+    finally:
+        page.remove_listener("framenavigated", on_frame_navigated)
+        page.remove_listener("request", on_request)
 
-async def scrape_youtube_link(url: str, context: BrowserContext) -> str:
+
+async def scrape_youtube_link(
+    url: str, page: Page, navigation_timeout_ms: int
+) -> ScrapeResult:
     """
     Scrape a given URL to find embedded YouTube links.
 
+    With `scraper.fast_path` enabled the scrape ends as soon as a YouTube frame is observed, and
+    only pages where none shows up quickly are waited on until the network is idle.
+
     Args:
         url (str): The URL to scrape.
-        context (BrowserContext): The Playwright browser context.
+        page (Page): The pooled Playwright page to load the URL in.
+        navigation_timeout_ms (int): Timeout of the navigation, and of waiting for network idle.
 
     Returns:
-        str: The YouTube embed URL if found, "timeout_error" if a timeout occurs, or None if not found.
+        ScrapeResult: FOUND with the YouTube embed URL, NOT_FOUND, HTTP_ERROR if the page
+        returned an error status or could not be reached, TIMEOUT, or CRASHED for any other error.
     """
-    page = await context.new_page()
-
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
     try:
-        await page.goto(url, timeout=20000)
-        await page.wait_for_load_state("networkidle", timeout=20000)
-
-        async def find_youtube_in_frames(frames) -> str:
-            for frame in frames:
-                if "youtube.com" in frame.url:
-                    logger.debug(f"Found YouTube iframe with src: {frame.url}")
-                    return frame.url
-
-                iframe_elements = await frame.query_selector_all("iframe")
-                for iframe in iframe_elements:
-                    child_frame = await iframe.content_frame()
-                    if child_frame:
-                        result = await find_youtube_in_frames([child_frame])
-                        if result:
-                            return result
-            return None
+        if config["scraper"]["fast_path"]:
+            youtube_url, http_status = await wait_for_youtube_frame(
+                page, url, config["scraper"]["fast_path_wait_ms"], navigation_timeout_ms
+            )
+            if youtube_url:
+                logger.debug(f"Found YouTube frame on the fast path: {youtube_url}")
+                TIME_TO_IFRAME_SECONDS.observe(loop.time() - started_at)
+                return ScrapeResult(status=ScrapeStatus.FOUND, youtube_url=youtube_url)
+        else:
+            with PAGE_LOAD_SECONDS.labels("load").time():
+                response = await page.goto(url, timeout=navigation_timeout_ms)
+            http_status = response.status if response else None
 
-        youtube_url = await find_youtube_in_frames(page.frames)
+        if http_status is not None and http_status >= 400:
+            logger.warning(f"{url} returned HTTP {http_status}")
+            return ScrapeResult(status=ScrapeStatus.HTTP_ERROR, http_status=http_status)
+
+        await page.wait_for_load_state("networkidle", timeout=navigation_timeout_ms)
+        youtube_url = await find_youtube_in_frames(page)
 
         if youtube_url:
-            return youtube_url
+            TIME_TO_IFRAME_SECONDS.observe(loop.time() - started_at)
+            return ScrapeResult(status=ScrapeStatus.FOUND, youtube_url=youtube_url)
         else:
             logger.debug("No YouTube iframe found.")
-            return None
-
+            return ScrapeResult(status=ScrapeStatus.NOT_FOUND)
+
+    except PlaywrightTimeoutError as e:
+        logger.error(f"Timed out scraping {url}: {e}")
+        return ScrapeResult(status=ScrapeStatus.TIMEOUT, error=str(e))
+    except PlaywrightError as e:
+        # Network failures such as DNS errors or refused connections are reported as net::ERR_*.
+        if "net::ERR_" in str(e):
+            logger.warning(f"Could not reach {url}: {e}")
+            return ScrapeResult(status=ScrapeStatus.HTTP_ERROR, error=str(e))
+        logger.error(f"An error occurred while scraping {url}: {e}")
+        return ScrapeResult(status=ScrapeStatus.CRASHED, error=str(e))
     except Exception as e:
         logger.error(f"An error occurred while scraping {url}: {e}")
-        return "timeout_error"
-    finally:
-        await page.close()
+        return ScrapeResult(status=ScrapeStatus.CRASHED, error=str(e))
 
 
 async def process_url(
     row: Dict[str, Any],
-    browser: Browser,
+    attempt: int,
+    http_client: httpx.AsyncClient,
+    context_pool: BrowserContextPool,
     counters: Dict[str, int],
-    lock: asyncio.Lock,
-    sem: asyncio.Semaphore,
-    loop: asyncio.AbstractEventLoop,
-) -> None:
+) -> ScrapeResult:
     """
-    Process a single URL from the row data.
+    Scrape a single URL from the row data.
+
+    The URL is first searched with a plain HTTP fetch, when `scraper.http_tier.enabled` is set
+    and on the first attempt only, and only leases a browser context if that finds no iframe
+    embedding a YouTube video. Pages the HTTP fetch finds to be gone (404 or 410) are not loaded
+    in the browser, and neither are pages of a host that rate limited it (429): the row fails as
+    throttled, so the host's limits back off and the row is retried in the browser tier.
+    Attempt `n` uses the `n`-th of `retry.navigation_timeouts_ms`.
 
     Args:
         row (Dict[str, Any]): The row data containing the URL and identifiers.
-        browser (Browser): The Playwright browser instance.
-        counters (Dict[str, int]): Shared counters for tracking progress.
-        lock (asyncio.Lock): Lock for synchronizing access to shared counters.
-        sem (asyncio.Semaphore): Semaphore for controlling concurrency.
-        loop (asyncio.AbstractEventLoop): The event loop.
-    """
-    async with sem:
-        async with lock:
-            counters["total_urls_processed"] += 1
-
-        url = row.get("creative_page_url")
-        if not url:
-            return
+        attempt (int): Zero-based number of the attempt at scraping the row.
+        http_client (httpx.AsyncClient): Pooled HTTP client for the HTTP tier.
+        context_pool (BrowserContextPool): Pool of browser contexts to scrape in.
+        counters (Dict[str, int]): The advertiser's progress counters.
 
-        logger.info(
-            f"Processing URL {counters['total_urls_processed']}/{counters['total_rows']}: {url}"
-        )
+    Returns:
+        ScrapeResult: The outcome of the scrape.
+    """
+    url = row.get("creative_page_url")
+    if not url:
+        return ScrapeResult(status=ScrapeStatus.NOT_FOUND)
+
+    logger.info(
+        f"Processing URL {counters['total_urls_processed'] + 1}/{counters['total_rows']}"
+        + (f" (attempt {attempt + 1})" if attempt else "")
+        + f": {url}"
+    )
+
+    if config["scraper"]["http_tier"]["enabled"] and attempt == 0:
+        youtube_link, status_code = await fetch_youtube_link_over_http(url, http_client)
+        counters["http_tier_attempts"] += 1
+        if youtube_link:
+            counters["http_tier_hits"] += 1
+            return ScrapeResult(status=ScrapeStatus.FOUND, youtube_url=youtube_link)
+        if status_code in (404, 410, 429):
+            return ScrapeResult(status=ScrapeStatus.HTTP_ERROR, http_status=status_code)
+
+    navigation_timeouts_ms = config["retry"]["navigation_timeouts_ms"]
+    navigation_timeout_ms = navigation_timeouts_ms[
+        min(attempt, len(navigation_timeouts_ms) - 1)
+    ]
+    async with context_pool.acquire() as pooled:
+        result = await scrape_youtube_link(url, pooled.page, navigation_timeout_ms)
+        if result.status in (ScrapeStatus.TIMEOUT, ScrapeStatus.CRASHED):
+            pooled.mark_failed()
+    counters["browser_tier_attempts"] += 1
+    if result.status == ScrapeStatus.FOUND:
+        counters["browser_tier_hits"] += 1
+    return result
+
+
+async def record_result(
+    row: Dict[str, Any],
+    result: ScrapeResult,
+    counters: Dict[str, int],
+) -> Optional[asyncio.Future]:
+    """
+    Record the final outcome of scraping a row.
 
-        context = await browser.new_context()
-        youtube_link = await scrape_youtube_link(url, context)
-        await context.close()
-
-        if (
-            youtube_link
-            and youtube_link != "timeout_error"
-            and "youtube.com" in youtube_link
-        ):
-            logger.info(f"Found YouTube link: {youtube_link}")
-            async with lock:
-                counters["successful_scrapes"] += 1
-
-            youtube_watch_link = convert_embed_to_watch_url(youtube_link)
-            if not youtube_watch_link:
-                logger.warning(
-                    "Failed to convert embed URL to watch URL. Skipping insertion."
-                )
-                return
+    Found YouTube links are written to the YouTube links table, and transient failures that
+    ran out of retries to the timeouts table, from which `/retry_timeouts` re-processes them.
+    Pages without a YouTube link and permanent errors are recorded in the scrape cache, and as
+    unresolvable in the job store, so `/retry_timeouts` does not scrape them again.
 
-            try:
-                row_data = BigQueryRow(
-                    advertiser_id=row["advertiser_id"],
-                    creative_id=row["creative_id"],
-                    creative_page_url=row["creative_page_url"],
-                    youtube_video_url=youtube_link,
-                    youtube_watch_url=youtube_watch_link,
-                )
-            except ValidationError as e:
-                logger.error(f"Data validation error: {e}")
-                return  # Skip insertion if validation fails
+    Args:
+        row (Dict[str, Any]): The row data containing the URL and identifiers.
+        result (ScrapeResult): The outcome of the row's last scrape attempt.
+        counters (Dict[str, int]): The advertiser's progress counters.
 
-            destination_table = config["bigquery"]["tables"]["youtube_links"]
-            await loop.run_in_executor(
-                None, insert_row_to_bq, row_data, destination_table
+    Returns:
+        Optional[asyncio.Future]: The future of the row written to BigQuery, see
+        `BigQueryBatchWriter.add`, or None if no row was written.
+    """
+    counters["total_urls_processed"] += 1
+
+    url = row.get("creative_page_url")
+    if not url:
+        return None
+
+    youtube_link = result.youtube_url
+    if (
+        result.status == ScrapeStatus.FOUND
+        and youtube_link
+        and "youtube.com" in youtube_link
+    ):
+        logger.info(f"Found YouTube link: {youtube_link}")
+        counters["successful_scrapes"] += 1
+
+        youtube_watch_link = convert_embed_to_watch_url(youtube_link)
+        if not youtube_watch_link:
+            logger.warning(
+                "Failed to convert embed URL to watch URL. Skipping insertion."
             )
+            return None
 
-            logger.info(f"Total successful scrapes: {counters['successful_scrapes']}")
+        try:
+            row_data = BigQueryRow(
+                advertiser_id=row["advertiser_id"],
+                creative_id=row["creative_id"],
+                creative_page_url=row["creative_page_url"],
+                youtube_video_url=youtube_link,
+                youtube_watch_url=youtube_watch_link,
+            )
+        except ValidationError as e:
+            logger.error(f"Data validation error: {e}")
+            return None  # Skip insertion if validation fails
 
-        elif youtube_link == "timeout_error":
-            logger.info("Scraping timed out. Inserting row into timeouts table.")
-            async with lock:
-                counters["timeouts_inserted"] += 1
+        destination_table = config["bigquery"]["tables"]["youtube_links"]
+        written = await global_vars.bq_writer.add(row_data, destination_table)
 
-            try:
-                row_data = BigQueryRow(
-                    advertiser_id=row["advertiser_id"],
-                    creative_id=row["creative_id"],
-                    creative_page_url=row["creative_page_url"],
-                    youtube_video_url=None,
-                    youtube_watch_url=None,
-                )
-            except ValidationError as e:
-                logger.error(f"Data validation error: {e}")
-                return  # Skip insertion if validation fails
+        def mark_resolved_once_written(future: asyncio.Future) -> None:
+            # Only cached once its row is written, so URLs whose row was dropped are scraped again.
+            if future.result():
+                global_vars.scrape_cache.mark_resolved(url)
 
-            destination_table = config["bigquery"]["tables"]["timeouts"]
-            await loop.run_in_executor(
-                None, insert_row_to_bq, row_data, destination_table
+        written.add_done_callback(mark_resolved_once_written)
+
+        logger.info(f"Total successful scrapes: {counters['successful_scrapes']}")
+        return written
+
+    elif result.is_transient:
+        logger.info(
+            f"Scraping failed with {result.status.value}. Inserting row into timeouts table."
+        )
+        counters["timeouts_inserted"] += 1
+        global_vars.scrape_cache.mark_timed_out(url)
+
+        try:
+            row_data = BigQueryRow(
+                advertiser_id=row["advertiser_id"],
+                creative_id=row["creative_id"],
+                creative_page_url=row["creative_page_url"],
+                youtube_video_url=None,
+                youtube_watch_url=None,
             )
+        except ValidationError as e:
+            logger.error(f"Data validation error: {e}")
+            return None  # Skip insertion if validation fails
 
-            logger.info(f"Total timeouts inserted: {counters['timeouts_inserted']}")
+        destination_table = config["bigquery"]["tables"]["timeouts"]
+        written = await global_vars.bq_writer.add(row_data, destination_table)
 
-        else:
-            logger.info("No YouTube link found, moving to next URL.")
+        logger.info(f"Total timeouts inserted: {counters['timeouts_inserted']}")
+        return written
 
-        logger.debug(
-            f"Total URLs processed so far: {counters['total_urls_processed']}/{counters['total_rows']}"
+    elif result.status == ScrapeStatus.HTTP_ERROR:
+        logger.info(
+            f"Page failed permanently ({result.http_status or result.error}), not retrying."
         )
+        counters["permanent_failures"] += 1
+        global_vars.scrape_cache.mark_not_found(url)
+        global_vars.job_store.record_unresolvable(url, result.status)
+
+    else:
+        logger.info("No YouTube link found, moving to next URL.")
+        global_vars.scrape_cache.mark_not_found(url)
+        global_vars.job_store.record_unresolvable(url, result.status)
+
+    logger.debug(
+        f"Total URLs processed so far: {counters['total_urls_processed']}/{counters['total_rows']}"
+    )
+    return None
+
+
+async def produce_rows(
+    pages: Iterator[List[Dict[str, Any]]],
+    scheduler: HostScheduler,
+    progress: JobProgress,
+    skipped_urls: Set[str],
+    processed_creative_ids: Set[str],
+    use_cache: bool = True,
+) -> None:
+    """
+    Download pages of rows and queue the rows that still need scraping on the scheduler.
 
+    Pages are downloaded in a thread as the scheduler drains, so at most
+    `concurrency.row_queue_size` rows plus one page are held in memory. Once all pages are read,
+    the scheduler is closed to stop the consumers.
 
-async def process_job(job_id: str, advertiser_id: str) -> None:
+    Args:
+        pages (Iterator[List[Dict[str, Any]]]): Pages of rows from `get_row_pages_from_bq`.
+        scheduler (HostScheduler): The bounded per-host queue feeding the consumers.
+        progress (JobProgress): The job's progress, updated with the number of fetched and
+            skipped rows.
+        skipped_urls (Set[str]): Creative page URLs not to scrape, such as URLs already stored
+            with a YouTube link.
+        processed_creative_ids (Set[str]): Creative IDs checkpointed by an earlier run of the job.
+        use_cache (bool): Whether to also skip rows found in the scrape cache.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        page = await loop.run_in_executor(None, next, pages, None)
+        if page is None:
+            break
+        for row in page:
+            counters = progress.counters(row["advertiser_id"])
+            counters["total_rows"] += 1
+            if row["creative_id"] in processed_creative_ids:
+                counters["resumed_skips"] += 1
+                continue
+            url = row["creative_page_url"]
+            if url in skipped_urls or (
+                use_cache and global_vars.scrape_cache.should_skip(url)
+            ):
+                counters["cached_skips"] += 1
+                continue
+            await scheduler.put(row)
+        progress.notify()
+
+    await scheduler.close()
+
+
+async def consume_rows(
+    job_id: str,
+    scheduler: HostScheduler,
+    http_client: httpx.AsyncClient,
+    context_pool: BrowserContextPool,
+    progress: JobProgress,
+    checkpointer: JobCheckpointer,
+) -> None:
     """
-    Process a scraping job for a given advertiser ID.
+    Scrape rows taken from the scheduler one at a time, until it is closed and drained.
+
+    Each row's processing time, and whether its host throttled it, is reported back to the
+    scheduler to adapt the host's concurrency limit. Transient failures are requeued on the
+    scheduler with the next, longer navigation timeout until `retry.navigation_timeouts_ms` is
+    exhausted or `retry.max_queued_retries` retries are waiting; only then is the outcome recorded.
 
     Args:
-        job_id (str): The unique identifier for the job.
-        advertiser_id (str): The advertiser ID to process.
+        job_id (str): The unique identifier for the job, used to label its metrics.
+        scheduler (HostScheduler): The scheduler fed by `produce_rows`.
+        http_client (httpx.AsyncClient): Pooled HTTP client for the HTTP tier.
+        context_pool (BrowserContextPool): Pool of browser contexts to scrape in.
+        progress (JobProgress): The job's progress, notified as rows are processed.
+        checkpointer (JobCheckpointer): Checkpointer the processed rows are reported to.
     """
-    job_statuses = global_vars.job_statuses
-    active_jobs = global_vars.active_jobs
+    loop = asyncio.get_running_loop()
+    max_attempts = len(config["retry"]["navigation_timeouts_ms"])
+    while True:
+        row = await scheduler.get()
+        if row is None:
+            return
+        counters = progress.counters(row["advertiser_id"])
+        attempt = row.get("scrape_attempt", 0)
+        started_at = loop.time()
+        result = ScrapeResult(status=ScrapeStatus.CRASHED)
+        retried = False
+        try:
+            result = await process_url(
+                row, attempt, http_client, context_pool, counters
+            )
+            # Requeue before releasing the row, so the scheduler cannot drain in between.
+            retried = (
+                result.is_transient
+                and attempt + 1 < max_attempts
+                and await scheduler.requeue({**row, "scrape_attempt": attempt + 1})
+            )
+        finally:
+            await scheduler.release(row, result.is_throttled, loop.time() - started_at)
 
-    job_statuses[job_id] = "Running"
-    try:
-        loop = asyncio.get_running_loop()
-        rows = await loop.run_in_executor(None, get_rows_from_bq, advertiser_id)
-
-        counters = {
-            "total_rows": len(rows),
-            "total_urls_processed": 0,
-            "successful_scrapes": 0,
-            "timeouts_inserted": 0,
-        }
-        lock = asyncio.Lock()
-        sem = asyncio.Semaphore(config["concurrency"]["max_concurrent_tasks"])
+        if retried:
+            logger.info(
+                f"Scraping failed with {result.status.value}, queued attempt {attempt + 2} "
+                f"of {max_attempts}: {row['creative_page_url']}"
+            )
+            counters["retries_queued"] += 1
+            SCRAPE_RETRIES.labels(job_id, row["advertiser_id"]).inc()
+            continue
+
+        written = await record_result(row, result, counters)
+        SCRAPE_OUTCOMES.labels(job_id, row["advertiser_id"], result.status.value).inc()
+        progress.notify()
+        await checkpointer.row_processed(row["creative_id"], written, counters)
+
+
+async def scrape_rows(
+    job_id: str,
+    advertiser_ids: List[str],
+    progress: JobProgress,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    source: JobSource = JobSource.CREATIVES,
+) -> None:
+    """
+    Stream the rows of a job's advertisers from BigQuery and scrape them with one browser.
 
-        logger.info(
-            f"Starting processing {counters['total_rows']} URLs for advertiser_id {advertiser_id}"
-        )
+    The rows of all advertisers are fetched with a single query, and scraping starts as soon as
+    its first page is downloaded. A fixed set of `concurrency.max_concurrent_tasks` consumers
+    scrapes the rows, interleaved across hosts and within each host's limits by a
+    `HostScheduler`, writing results through `global_vars.bq_writer`. Rows already resolved in
+    BigQuery or in the scrape cache are skipped, as are rows checkpointed by an earlier run of
+    the same job, which is how a job resumes. Once every row is processed, the batch writer is
+    committed, and the rows whose results were written are checkpointed.
 
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=True)
+    A job reading from the timeouts table only gets rows the query found unresolved, skips the
+    URLs the job store records as failing permanently, and scrapes the others even if the scrape
+    cache holds a recent timeout for them.
 
+    Args:
+        job_id (str): The unique identifier for the job.
+        advertiser_ids (List[str]): The advertiser IDs to process.
+        progress (JobProgress): The job's progress, updated as the rows are processed.
+        shard_index (int): Index of the shard of the rows to scrape.
+        shard_count (int): Number of shards the rows are split into.
+        source (JobSource): The table the rows are read from.
+    """
+    loop = asyncio.get_running_loop()
+    use_cache = config["cache"]["enabled"] and source == JobSource.CREATIVES
+    skipped_urls: Set[str] = set()
+    if source == JobSource.TIMEOUTS:
+        skipped_urls = global_vars.job_store.get_unresolvable_urls()
+    elif use_cache:
+        skipped_urls = await loop.run_in_executor(
+            None, get_resolved_urls_from_bq, advertiser_ids
+        )
+    total_rows, pages = await loop.run_in_executor(
+        None, get_row_pages_from_bq, advertiser_ids, shard_index, shard_count, source
+    )
+    progress.expected_rows += total_rows
+    processed_creative_ids = global_vars.job_store.get_processed(job_id)
+    checkpointer = JobCheckpointer(
+        global_vars.job_store, job_id, config["job_store"]["checkpoint_interval_rows"]
+    )
+
+    consumers = config["concurrency"]["max_concurrent_tasks"]
+    scheduler = create_host_scheduler()
+
+    async with create_http_client() as http_client, async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+
+        async with open_context_pool(
+            browser,
+            size=consumers,
+            max_pages_per_context=config["concurrency"]["max_pages_per_context"],
+            route_handler=(
+                block_unneeded_resources if config["scraper"]["fast_path"] else None
+            ),
+        ) as context_pool:
             tasks = [
-                process_url(row, browser, counters, lock, sem, loop) for row in rows
+                asyncio.ensure_future(
+                    produce_rows(
+                        pages,
+                        scheduler,
+                        progress,
+                        skipped_urls,
+                        processed_creative_ids,
+                        use_cache,
+                    )
+                )
+            ] + [
+                asyncio.ensure_future(
+                    consume_rows(
+                        job_id,
+                        scheduler,
+                        http_client,
+                        context_pool,
+                        progress,
+                        checkpointer,
+                    )
+                )
+                for _ in range(consumers)
             ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # If one task failed, stop the others instead of leaving them blocked on the scheduler.
+                for task in tasks:
+                    task.cancel()
+                scheduler.clear()
+
+        await browser.close()
+
+    # Write and commit the job's remaining buffered rows, then checkpoint all that were written.
+    await global_vars.bq_writer.commit()
+    await checkpointer.checkpoint(wait=True)
+
+
+async def _scrape_shard(
+    job_id: str,
+    advertiser_ids: List[str],
+    shard_index: int,
+    shard_count: int,
+    source: JobSource,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Scrape a shard of a job's rows inside a worker process, with the process's own batch writer.
+
+    Args:
+        job_id (str): The unique identifier for the job.
+        advertiser_ids (List[str]): The advertiser IDs to process.
+        shard_index (int): Index of the shard to scrape.
+        shard_count (int): Number of shards the rows are split into.
+        source (JobSource): The table the rows are read from.
+
+    Returns:
+        Dict[str, Dict[str, int]]: The shard's counters, keyed by advertiser ID.
+    """
+    global_vars.bq_writer = create_batch_writer()
+    global_vars.scrape_cache = create_scrape_cache()
+    global_vars.job_store = create_job_store()
+    await global_vars.bq_writer.start()
+    try:
+        progress = JobProgress(advertiser_ids)
+        await scrape_rows(
+            job_id,
+            advertiser_ids,
+            progress,
+            shard_index,
+            shard_count,
+            source,
+        )
+        return progress.counters_by_advertiser
+    finally:
+        await global_vars.bq_writer.close()
+        global_vars.job_store.close()
+
+
+def run_scrape_shard(
+    job_id: str,
+    advertiser_ids: List[str],
+    shard_index: int,
+    shard_count: int,
+    source: JobSource,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Entry point of a worker process: scrape a shard of rows in a new event loop.
+
+    Args:
+        job_id (str): The unique identifier for the job.
+        advertiser_ids (List[str]): The advertiser IDs to process.
+        shard_index (int): Index of the shard to scrape.
+        shard_count (int): Number of shards the rows are split into.
+        source (JobSource): The table the rows are read from.
+
+    Returns:
+        Dict[str, Dict[str, int]]: The shard's counters, keyed by advertiser ID.
+    """
+    return asyncio.run(
+        _scrape_shard(job_id, advertiser_ids, shard_index, shard_count, source)
+    )
 
-            await asyncio.gather(*tasks)
 
-            await browser.close()
+async def scrape_rows_in_worker_processes(
+    job_id: str,
+    advertiser_ids: List[str],
+    progress: JobProgress,
+    worker_processes: int,
+    source: JobSource = JobSource.CREATIVES,
+) -> None:
+    """
+    Shard a job's rows across worker processes, each running its own browser, and add their
+    counters to the job's progress as each worker finishes.
+
+    Each worker streams its own shard from BigQuery, and writes and commits its own results
+    before it returns. Outcomes recorded by the workers are not added to this process's scrape
+    cache; resolved creatives are still skipped on later jobs through the BigQuery lookup.
+
+    Args:
+        job_id (str): The unique identifier for the job.
+        advertiser_ids (List[str]): The advertiser IDs to process.
+        progress (JobProgress): The job's progress, updated with the workers' totals.
+        worker_processes (int): Number of worker processes.
+        source (JobSource): The table the rows are read from.
+    """
+    logger.info(f"Scraping job {job_id} in {worker_processes} worker processes")
+
+    loop = asyncio.get_running_loop()
+    # Worker processes are spawned rather than forked, as forking a process with a running
+    # event loop and open Playwright connections is unsafe.
+    with ProcessPoolExecutor(
+        max_workers=worker_processes, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        shards = [
+            loop.run_in_executor(
+                executor,
+                run_scrape_shard,
+                job_id,
+                advertiser_ids,
+                shard_index,
+                worker_processes,
+                source,
+            )
+            for shard_index in range(worker_processes)
+        ]
+        for shard in asyncio.as_completed(shards):
+            progress.add(await shard)
+
+
+async def process_job(
+    job_id: str,
+    advertiser_ids: List[str],
+    source: JobSource = JobSource.CREATIVES,
+) -> None:
+    """
+    Process a scraping job for one or more advertiser IDs.
+
+    Progress is tracked per advertiser in `global_vars.job_progress` while the job runs, and
+    streamed by `/job_status/{job_id}/stream`. It is kept for
+    `progress_stream.finished_job_retention_seconds` after the job ends.
+
+    Args:
+        job_id (str): The unique identifier for the job.
+        advertiser_ids (List[str]): The advertiser IDs to process. A job re-processing the
+            timeouts table processes every advertiser in it when this is empty.
+        source (JobSource): The table the rows are read from.
+    """
+    job_store = global_vars.job_store
+    active_jobs = global_vars.active_jobs
+
+    progress = JobProgress(advertiser_ids)
+    global_vars.job_progress[job_id] = progress
+    job_store.set_status(job_id, "Running")
+    try:
+        logger.info(
+            f"Starting processing {source.value} URLs for "
+            f"{', '.join(advertiser_ids) or 'all advertisers'}"
+        )
+
+        worker_processes = config["concurrency"]["worker_processes"]
+        if worker_processes > 1:
+            await scrape_rows_in_worker_processes(
+                job_id, advertiser_ids, progress, worker_processes, source
+            )
+        else:
+            await scrape_rows(job_id, advertiser_ids, progress, source=source)
 
+        counters_by_advertiser = progress.counters_by_advertiser
+        counters = sum_counters(counters_by_advertiser)
         logger.info(f"Job {job_id} completed.")
+        for advertiser_id, advertiser_counters in counters_by_advertiser.items():
+            logger.info(
+                f"Advertiser {advertiser_id}: {advertiser_counters['total_urls_processed']}"
+                f"/{advertiser_counters['total_rows']} URLs processed, "
+                f"{advertiser_counters['successful_scrapes']} successful scrapes"
+            )
         logger.info(f"Total URLs processed: {counters['total_urls_processed']}")
+        logger.info(f"Total already scraped URLs skipped: {counters['cached_skips']}")
+        logger.info(f"Total URLs skipped on resume: {counters['resumed_skips']}")
         logger.info(f"Total successful scrapes: {counters['successful_scrapes']}")
         logger.info(f"Total timeouts inserted: {counters['timeouts_inserted']}")
-
-        job_statuses[job_id] = "Completed"
+        logger.info(f"Total retries queued: {counters['retries_queued']}")
+        logger.info(f"Total permanent failures: {counters['permanent_failures']}")
+        log_tier_hit_rates(counters)
+
+        if counters["results_dropped"]:
+            # These rows are neither checkpointed nor cached as resolved, so a new job for the
+            # same advertisers scrapes them again.
+            logger.error(
+                f"Job {job_id} failed to write the results of "
+                f"{counters['results_dropped']} rows."
+            )
+            job_store.set_status(
+                job_id,
+                f"Failed: the results of {counters['results_dropped']} rows could not be "
+                "written",
+            )
+        else:
+            job_store.set_status(job_id, "Completed")
     except Exception as e:
         logger.exception(f"Job {job_id} failed: {str(e)}")
-        job_statuses[job_id] = f"Failed: {str(e)}"
+        job_store.set_status(job_id, f"Failed: {str(e)}")
     finally:
+        progress.finish()
+        # Open streams hold on to the progress until they have sent their final event.
+        asyncio.get_running_loop().call_later(
+            config["progress_stream"]["finished_job_retention_seconds"],
+            global_vars.job_progress.pop,
+            job_id,
+            None,
+        )
         active_jobs.discard(job_id)
         if not active_jobs:
             if (
@@ -225,6 +872,38 @@ async def process_job(job_id: str, advertiser_id: str) -> None:
             logger.info(f"Active jobs remaining: {len(active_jobs)}")
 
 
+def resume_incomplete_jobs() -> None:
+    """
+    Restart the jobs left pending or running by a previous run of the service.
+
+    Resumed jobs skip the rows checkpointed before the restart.
+    """
+    for job_id, advertiser_ids, source in global_vars.job_store.get_incomplete_jobs():
+        logger.info(
+            f"Resuming {source.value} job {job_id} for advertiser_ids {advertiser_ids}"
+        )
+        global_vars.active_jobs.add(job_id)
+        task = asyncio.create_task(process_job(job_id, advertiser_ids, source))
+        global_vars.resumed_job_tasks.add(task)
+        task.add_done_callback(global_vars.resumed_job_tasks.discard)
+
+
+def log_tier_hit_rates(counters: Dict[str, int]) -> None:
+    """
+    Log how many URLs each extraction tier handled and how often it found a YouTube link.
+
+    Args:
+        counters (Dict[str, int]): The job's counters.
+    """
+    for tier in ("http", "browser"):
+        attempts = counters[f"{tier}_tier_attempts"]
+        hits = counters[f"{tier}_tier_hits"]
+        hit_rate = hits / attempts if attempts else 0.0
+        logger.info(
+            f"{tier.capitalize()} tier: {hits}/{attempts} URLs resolved ({hit_rate:.1%} hit rate)"
+        )
+
+
 async def shutdown_after_delay() -> None:
     """
     Initiates server shutdown after a specified delay.
@@ -1,7 +1,8 @@
 # utils.py
 
 import re
-from typing import Optional, Dict, Any
+from html import unescape
+from typing import Optional, Dict, Any, Mapping
 
 
 def convert_embed_to_watch_url(embed_url: str) -> Optional[str]:
@@ -27,12 +28,12 @@ def convert_embed_to_watch_url(embed_url: str) -> Optional[str]:
         return None
 
 
-def normalize_row_keys(row: Dict[str, Any]) -> Dict[str, Any]:
+def normalize_row_keys(row: Mapping[str, Any]) -> Dict[str, Any]:
     """
-    Normalize the keys of a dictionary to lowercase.
+    Normalize the keys of a dictionary, or a BigQuery row, to lowercase.
 
     Args:
-        row (Dict[str, Any]): The dictionary with keys to normalize.
+        row (Mapping[str, Any]): The dictionary or row with keys to normalize.
 
     Returns:
         Dict[str, Any]: The dictionary with lowercase keys.
@@ -42,3 +43,57 @@ def normalize_row_keys(row: Dict[str, Any]) -> Dict[str, Any]:
         {'advertiser_id': 'adv123', 'creative_id': 'crt456'}
     """
     return {key.lower(): value for key, value in row.items()}
+
+
+IFRAME_TAG_PATTERN = re.compile(r"<iframe\b[^>]*>", re.IGNORECASE)
+"""
+Pattern matching the opening tag of an iframe.
+"""
+
+IFRAME_SOURCE_ATTRIBUTE_PATTERN = re.compile(
+    r"(?<![\w-])(?:data-lazy-src|data-src|src)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))",
+    re.IGNORECASE,
+)
+"""
+Pattern matching the `src`, `data-src` or `data-lazy-src` attribute of a tag and capturing its
+double-quoted, single-quoted or unquoted value.
+"""
+
+YOUTUBE_EMBED_URL_PATTERN = re.compile(
+    r"^(?:https?:)?//(?:www\.)?youtube(?:-nocookie)?\.com/embed/"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+"""
+Pattern matching a YouTube embed URL and capturing its 11-character video ID.
+"""
+
+
+def extract_youtube_embed_url(html: str) -> Optional[str]:
+    """
+    Find the first YouTube video embedded with an iframe in a page's HTML.
+
+    Only the `src`, `data-src` and `data-lazy-src` attributes of iframes are searched, and only
+    for YouTube embed URLs, which are what the browser tier finds as frames. YouTube links
+    elsewhere in the page, such as in its footer or in inline scripts, are not embedded videos
+    of the creative, so pages referencing a video only that way are left to the browser tier.
+
+    Args:
+        html (str): The response body to search.
+
+    Returns:
+        Optional[str]: The video's embed URL, or None if no iframe embeds a YouTube video.
+
+    Example:
+        >>> extract_youtube_embed_url('<iframe src="https://www.youtube.com/embed/dQw4w9WgXcQ?rel=0">')
+        'https://www.youtube.com/embed/dQw4w9WgXcQ'
+        >>> extract_youtube_embed_url("<iframe src=about:blank data-src='//youtube.com/embed/dQw4w9WgXcQ'>")
+        'https://www.youtube.com/embed/dQw4w9WgXcQ'
+        >>> extract_youtube_embed_url('<a href="https://www.youtube.com/watch?v=dQw4w9WgXcQ">Help</a>')
+    """
+    for tag in IFRAME_TAG_PATTERN.findall(html):
+        for values in IFRAME_SOURCE_ATTRIBUTE_PATTERN.findall(tag):
+            source = unescape("".join(values)).strip()
+            match = YOUTUBE_EMBED_URL_PATTERN.match(source)
+            if match:
+                return f"https://www.youtube.com/embed/{match.group(1)}"
+    return None
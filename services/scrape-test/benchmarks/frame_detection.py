@@ -0,0 +1,360 @@
+# frame_detection.py
+
+"""
+Benchmark of YouTube frame detection on saved creative pages.
+
+Serves the HTML pages of `fixtures/` from a local HTTP server, loads each one in Chromium like
+`scrape_youtube_link` does, and runs both the former recursive frame search and the single-pass
+`find_youtube_in_frames` on it, reporting the Playwright round-trips and time each one takes.
+YouTube requests are answered with an empty page, so the benchmark runs offline.
+
+With `--in-memory`, the frame tree of each fixture is rebuilt from its HTML with in-memory stand-ins
+for Playwright's page, frames and iframe handles instead, so the round-trips can be counted
+without a browser. The command then fails if the single-pass search takes more than one.
+
+Usage, from `services/scrape-test`:
+
+    python benchmarks/frame_detection.py [--repeat N] [--in-memory]
+"""
+
+import argparse
+import asyncio
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from html.parser import HTMLParser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+os.environ.setdefault(
+    "CONFIG_FILE",
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "app", "config.yaml"
+    ),
+)
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+)
+
+from playwright.async_api import (
+    ElementHandle,
+    Frame,
+    Page,
+    Route,
+    async_playwright,
+)
+from scraper import find_youtube_in_frames
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+FIXTURES: Tuple[str, ...] = (
+    "direct_embed.html",
+    "nested_ad.html",
+    "lazy_embed.html",
+    "no_embed.html",
+)
+"""
+Top-level pages of `fixtures/` the benchmark loads; the other fixtures are their iframes.
+"""
+
+IN_MEMORY_BASE_URL = "http://fixtures.test/"
+"""
+Base URL of the fixtures in the in-memory frame trees.
+"""
+
+
+class RoundTripCounter:
+    """
+    Wraps Playwright objects to count the calls that make a round-trip to the browser.
+
+    Every coroutine method of the Playwright API sends a message to the browser and waits for
+    its reply, while properties such as `Page.frames` and `Frame.url` are answered locally.
+    """
+
+    def __init__(self):
+        self.round_trips = 0
+
+    def wrap(self, value: Any) -> Any:
+        """
+        Wrap a page, frame or element handle, or a list of them, to count its calls.
+
+        Args:
+            value (Any): The value returned by Playwright.
+
+        Returns:
+            Any: The counting proxy, or the value itself if it is not a Playwright object.
+        """
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        if isinstance(
+            value,
+            (Page, Frame, ElementHandle, FixturePage, FixtureFrame, FixtureIframe),
+        ):
+            return CountingProxy(value, self)
+        return value
+
+
+class CountingProxy:
+    """
+    Proxy of a Playwright object that counts its coroutine calls on a RoundTripCounter.
+    """
+
+    def __init__(self, target: Any, counter: RoundTripCounter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if not inspect.iscoroutinefunction(value):
+            return self._counter.wrap(value)
+
+        @functools.wraps(value)
+        async def counted(*args: Any, **kwargs: Any) -> Any:
+            self._counter.round_trips += 1
+            return self._counter.wrap(await value(*args, **kwargs))
+
+        return counted
+
+
+class FixtureFrame:
+    """
+    In-memory stand-in for a Playwright Frame, with the iframes of a fixture.
+    """
+
+    def __init__(self, url: str, iframes: List["FixtureIframe"]):
+        self.url = url
+        self.iframes = iframes
+
+    @property
+    def child_frames(self) -> List["FixtureFrame"]:
+        return [iframe.frame for iframe in self.iframes]
+
+    async def query_selector_all(self, selector: str) -> List["FixtureIframe"]:
+        return list(self.iframes)
+
+
+class FixtureIframe:
+    """
+    In-memory stand-in for the ElementHandle of an iframe, with its attributes and frame.
+    """
+
+    def __init__(self, attributes: Dict[str, str], frame: FixtureFrame):
+        self.attributes = attributes
+        self.frame = frame
+
+    async def content_frame(self) -> FixtureFrame:
+        return self.frame
+
+
+class FixturePage:
+    """
+    In-memory stand-in for a Playwright Page whose frames are built from a fixture.
+    """
+
+    def __init__(self, main_frame: FixtureFrame):
+        self.main_frame = main_frame
+
+    @property
+    def frames(self) -> List[FixtureFrame]:
+        frames = [self.main_frame]
+        for frame in frames:
+            frames.extend(frame.child_frames)
+        return frames
+
+    async def evaluate(self, script: str) -> List[str]:
+        """
+        Return what COLLECT_IFRAME_SOURCES_SCRIPT returns on the page, the only script evaluated.
+        """
+        sources = []
+        for frame in self.frames:
+            for iframe in frame.iframes:
+                for name in ("src", "data-src", "data-lazy-src"):
+                    if iframe.attributes.get(name):
+                        sources.append(urljoin(frame.url, iframe.attributes[name]))
+        return sources
+
+
+class IframeParser(HTMLParser):
+    """
+    Collects the attributes of the iframes of an HTML page.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.iframes: List[Dict[str, str]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "iframe":
+            self.iframes.append({name: value or "" for name, value in attrs})
+
+
+def load_fixture_frame(url: str) -> FixtureFrame:
+    """
+    Build the in-memory frame tree of a URL, from its fixture if it is one of `fixtures/`.
+
+    Args:
+        url (str): The frame's URL; under IN_MEMORY_BASE_URL for fixtures.
+
+    Returns:
+        FixtureFrame: The frame and, for fixtures, its iframes' frames.
+    """
+    if not url.startswith(IN_MEMORY_BASE_URL):
+        return FixtureFrame(url, [])
+
+    parser = IframeParser()
+    with open(os.path.join(FIXTURES_DIR, url[len(IN_MEMORY_BASE_URL) :])) as file:
+        parser.feed(file.read())
+    return FixtureFrame(
+        url,
+        [
+            FixtureIframe(
+                attributes, load_fixture_frame(urljoin(url, attributes.get("src", "")))
+            )
+            for attributes in parser.iframes
+        ],
+    )
+
+
+async def find_youtube_in_frames_recursively(frames: List[Frame]) -> Optional[str]:
+    """
+    The former frame search: query every frame for iframes and recurse into their frames.
+
+    Args:
+        frames (List[Frame]): The frames to search.
+
+    Returns:
+        Optional[str]: The URL of the first YouTube frame found, or None.
+    """
+    for frame in frames:
+        if "youtube.com" in frame.url:
+            return frame.url
+
+        iframe_elements = await frame.query_selector_all("iframe")
+        for iframe in iframe_elements:
+            child_frame = await iframe.content_frame()
+            if child_frame:
+                result = await find_youtube_in_frames_recursively([child_frame])
+                if result:
+                    return result
+    return None
+
+
+DETECTORS: Tuple[Tuple[str, Callable[[Any], Awaitable[Optional[str]]]], ...] = (
+    ("recursive", lambda page: find_youtube_in_frames_recursively(page.frames)),
+    ("single-pass", find_youtube_in_frames),
+)
+"""
+The frame detectors compared, by name, each taking a loaded page.
+"""
+
+
+def start_fixture_server() -> ThreadingHTTPServer:
+    """
+    Serve `fixtures/` over HTTP on a free local port, from a daemon thread.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(QuietHandler, directory=FIXTURES_DIR)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def answer_youtube_offline(route: Route) -> None:
+    """
+    Answer a YouTube request with an empty page, so frames keep their YouTube URL offline.
+
+    Args:
+        route (Route): The intercepted request.
+    """
+    await route.fulfill(status=200, content_type="text/html", body="<html></html>")
+
+
+async def run_benchmark(repeat: int) -> None:
+    """
+    Load every fixture `repeat` times per detector and print the average round-trips and time.
+
+    Args:
+        repeat (int): Number of times each fixture is loaded per detector.
+    """
+    server = start_fixture_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'fixture':<20} {'detector':<12} {'round-trips':>11} {'ms':>8}  result")
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        context = await browser.new_context()
+        await context.route("**/*youtube.com/**", answer_youtube_offline)
+        page = await context.new_page()
+
+        for fixture in FIXTURES:
+            for name, detect in DETECTORS:
+                round_trips = 0
+                elapsed_seconds = 0.0
+                result = None
+                for _ in range(repeat):
+                    await page.goto(f"{base_url}/{fixture}")
+                    await page.wait_for_load_state("networkidle")
+                    counter = RoundTripCounter()
+                    started_at = time.perf_counter()
+                    result = await detect(counter.wrap(page))
+                    elapsed_seconds += time.perf_counter() - started_at
+                    round_trips += counter.round_trips
+                print(
+                    f"{fixture:<20} {name:<12} {round_trips / repeat:>11.1f} "
+                    f"{elapsed_seconds / repeat * 1000:>8.1f}  {result or 'not found'}"
+                )
+
+        await browser.close()
+    server.shutdown()
+
+
+async def run_in_memory_benchmark() -> bool:
+    """
+    Count the round-trips of every detector on the in-memory frame tree of every fixture.
+
+    Returns:
+        bool: True if the single-pass search took at most one round-trip on every fixture.
+    """
+    single_pass_bounded = True
+    print(f"{'fixture':<20} {'detector':<12} {'round-trips':>11}  result")
+    for fixture in FIXTURES:
+        page = FixturePage(load_fixture_frame(IN_MEMORY_BASE_URL + fixture))
+        for name, detect in DETECTORS:
+            counter = RoundTripCounter()
+            result = await detect(counter.wrap(page))
+            print(
+                f"{fixture:<20} {name:<12} {counter.round_trips:>11}  {result or 'not found'}"
+            )
+            if name == "single-pass" and counter.round_trips > 1:
+                single_pass_bounded = False
+    return single_pass_bounded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Loads of each fixture per detector"
+    )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Count round-trips on in-memory frame trees instead of loading Chromium",
+    )
+    args = parser.parse_args()
+    if args.in_memory:
+        if not asyncio.run(run_in_memory_benchmark()):
+            sys.exit("The single-pass search took more than one round-trip.")
+    else:
+        asyncio.run(run_benchmark(args.repeat))